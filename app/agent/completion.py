@@ -25,6 +25,7 @@ from app.core.metrics import (
     ops_agent_investigation_completed_total,
     ops_agent_investigation_steps,
 )
+from app.core.tracing import agent_span, investigation_span_attributes
 from app.utils.clock import utc_now
 
 if TYPE_CHECKING:
@@ -33,14 +34,7 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 tracer = trace.get_tracer(__name__)
 
-# Confidence thresholds are only used as a fallback when state severity is invalid.
-_SEVERITY_THRESHOLDS = [
-    (0.8, "CRITICAL"),
-    (0.6, "HIGH"),
-    (0.3, "MEDIUM"),
-    (0.0, "LOW"),
-]
-_VALID_SEVERITIES = {"LOW", "MEDIUM", "HIGH", "CRITICAL"}
+_VALID_SEVERITIES = frozenset({"LOW", "MEDIUM", "HIGH", "CRITICAL"})
 
 
 def _compute_final_confidence(state: InvestigationState) -> float:
@@ -79,13 +73,21 @@ def _determine_severity(confidence: float, current_severity: str) -> str:
     by the tools/reasoning whenever valid. Only derive from confidence as a
     defensive fallback for malformed state.
     """
-    normalized = (current_severity or "").upper()
-    if normalized in _VALID_SEVERITIES:
-        return normalized
-
-    for threshold, level in _SEVERITY_THRESHOLDS:
-        if confidence >= threshold:
-            return level
+    # Common case: tools already wrote a valid uppercase severity.
+    if current_severity in _VALID_SEVERITIES:
+        return current_severity
+    if current_severity:
+        normalized = current_severity.upper()
+        if normalized in _VALID_SEVERITIES:
+            return normalized
+
+    # Confidence thresholds are only used as a fallback when state severity is invalid.
+    if confidence >= 0.8:
+        return "CRITICAL"
+    if confidence >= 0.6:
+        return "HIGH"
+    if confidence >= 0.3:
+        return "MEDIUM"
     return "LOW"
 
 
@@ -94,38 +96,32 @@ async def completion_node(
     state_store: PostgresStateStore | None = None,
 ) -> InvestigationState:
     """Finalize investigation and persist results."""
-    with tracer.start_as_current_span("agent.completion") as span:
+    with agent_span(tracer, "agent.completion") as span:
         investigation_id = state["investigation_id"]
-        span.set_attribute("investigation_id", investigation_id)
-        if state.get("transaction_id"):
-            span.set_attribute("transaction_id", state["transaction_id"])
-        model_mode = state.get("model_mode", "unknown")
-        span.set_attribute("model_mode", model_mode)
-        if state.get("case_id"):
-            span.set_attribute("case_id", state["case_id"])
-        if state.get("scenario_name"):
-            span.set_attribute("scenario_name", state["scenario_name"])
+        span.set_attributes(investigation_span_attributes(state))
 
         completed_at = utc_now().isoformat()
 
         terminal_status = str(state.get("status") or "").upper()
         if terminal_status in {"FAILED", "TIMED_OUT"}:
-            final_state: InvestigationState = {
-                **state,
-                "status": terminal_status,
-                "completed_at": completed_at,
-            }
-
-            span.set_attribute("status", terminal_status)
-            span.set_attribute("confidence_score", float(final_state.get("confidence_score", 0.0)))
-            span.set_attribute("severity", str(final_state.get("severity", "LOW")).upper())
-            span.set_attribute("step_count", state.get("step_count", 0))
+            final_state = state.copy()
+            final_state["status"] = terminal_status
+            final_state["completed_at"] = completed_at
+
+            span.set_attributes(
+                {
+                    "status": terminal_status,
+                    "confidence_score": float(final_state.get("confidence_score", 0.0)),
+                    "severity": str(final_state.get("severity", "LOW")).upper(),
+                    "step_count": state.get("step_count", 0),
+                }
+            )
 
             if state_store is not None:
                 try:
                     await state_store.save_state(
                         investigation_id=investigation_id,
-                        state=dict(final_state),
+                        state=final_state,
                     )
                 except Exception:
                     logger.error(
@@ -163,24 +159,26 @@ async def completion_node(
         # Step 3: Determine final severity
         severity = _determine_severity(confidence, state.get("severity", "LOW"))
 
-        final_state: InvestigationState = {
-            **state,
-            "status": "COMPLETED",
-            "completed_at": completed_at,
-            "confidence_score": confidence,
-            "severity": severity,
-        }
-
-        span.set_attribute("confidence_score", confidence)
-        span.set_attribute("severity", severity)
-        span.set_attribute("step_count", state.get("step_count", 0))
+        final_state = state.copy()
+        final_state["status"] = "COMPLETED"
+        final_state["completed_at"] = completed_at
+        final_state["confidence_score"] = confidence
+        final_state["severity"] = severity
+
+        span.set_attributes(
+            {
+                "confidence_score": confidence,
+                "severity": severity,
+                "step_count": state.get("step_count", 0),
+            }
+        )
 
         # Step 4: Persist state
         if state_store is not None:
             try:
                 await state_store.save_state(
                     investigation_id=investigation_id,
-                    state=dict(final_state),
+                    state=final_state,
                 )
             except Exception:
                 logger.error(
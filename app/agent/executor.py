@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import time
+from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -15,9 +18,11 @@ from app.core.metrics import (
     ops_agent_tool_execution_latency_seconds,
     ops_agent_tool_execution_total,
 )
+from app.core.tracing import agent_span, investigation_span_attributes
 from app.utils.clock import utc_now
 from app.utils.data_access import as_dict, as_list, get_attr
 from app.utils.redaction import redact_card_id
+from app.utils.type_utils import to_float, to_int
 
 if TYPE_CHECKING:
     from app.agent.registry import ToolRegistry
@@ -25,6 +30,10 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# The same card appears in every step of an investigation; bounded so concurrent
+# investigations only keep recently seen card ids.
+_redact_card_id_cached = lru_cache(maxsize=256)(redact_card_id)
+
 
 def _signal_names(context: dict[str, Any]) -> list[str]:
     names: list[str] = []
@@ -59,7 +68,7 @@ def _summarize_context(context_raw: Any) -> dict[str, Any]:
     context = as_dict(context_raw)
     transaction = context.get("transaction")
     card_id = get_attr(transaction, "card_id")
-    redacted_card_id = redact_card_id(card_id) if isinstance(card_id, str) else None
+    redacted_card_id = _redact_card_id_cached(card_id) if isinstance(card_id, str) else None
     return {
         "transaction_id": get_attr(transaction, "transaction_id"),
         "amount": get_attr(transaction, "amount"),
@@ -83,12 +92,9 @@ def _summarize_pattern_results(pattern_results_raw: Any) -> dict[str, Any]:
     ]
 
     def _score_value(item: dict[str, Any]) -> float:
-        try:
-            return float(item.get("score", 0.0) or 0.0)
-        except TypeError, ValueError:
-            return 0.0
+        return to_float(item.get("score"))
 
-    top_scores = sorted(scores, key=_score_value, reverse=True)[:3]
+    top_scores = heapq.nlargest(3, scores, key=_score_value)
     return {
         "overall_score": float(pattern_results.get("overall_score", 0.0) or 0.0),
         "patterns_detected": [
@@ -120,33 +126,12 @@ def _summarize_similarity_results(similarity_results_raw: Any) -> dict[str, Any]
 
     vector_diagnostics = as_dict(similarity_results.get("vector_diagnostics"))
     if vector_diagnostics:
-        candidate_count_raw = vector_diagnostics.get("candidate_count", 0)
-        search_limit_raw = vector_diagnostics.get("search_limit", 0)
-        min_similarity_raw = vector_diagnostics.get("min_similarity", 0.0)
-        embedding_dimension_raw = vector_diagnostics.get("embedding_dimension", 0)
-        try:
-            candidate_count = int(candidate_count_raw or 0)
-        except TypeError, ValueError:
-            candidate_count = 0
-        try:
-            search_limit = int(search_limit_raw or 0)
-        except TypeError, ValueError:
-            search_limit = 0
-        try:
-            min_similarity = float(min_similarity_raw or 0.0)
-        except TypeError, ValueError:
-            min_similarity = 0.0
-        try:
-            embedding_dimension = int(embedding_dimension_raw or 0)
-        except TypeError, ValueError:
-            embedding_dimension = 0
-
         summary["vector_diagnostics"] = {
-            "candidate_count": candidate_count,
-            "search_limit": search_limit,
-            "min_similarity": min_similarity,
+            "candidate_count": to_int(vector_diagnostics.get("candidate_count")),
+            "search_limit": to_int(vector_diagnostics.get("search_limit")),
+            "min_similarity": to_float(vector_diagnostics.get("min_similarity")),
             "embedding_model": vector_diagnostics.get("embedding_model"),
-            "embedding_dimension": embedding_dimension,
+            "embedding_dimension": to_int(vector_diagnostics.get("embedding_dimension")),
             "reason": vector_diagnostics.get("reason"),
         }
     return summary
@@ -179,24 +164,25 @@ def _summarize_link_analysis_results(link_analysis_raw: Any) -> dict[str, Any]:
 def _summarize_reasoning(reasoning_raw: Any) -> dict[str, Any]:
     reasoning = as_dict(reasoning_raw)
     findings = as_list(reasoning.get("key_findings"))
+    summary_text = reasoning.get("summary") or reasoning.get("narrative")
     return {
         "llm_status": reasoning.get("llm_status"),
         "risk_level": reasoning.get("risk_level"),
         "severity": reasoning.get("severity"),
         "confidence": reasoning.get("confidence"),
-        "summary": (reasoning.get("summary") or reasoning.get("narrative") or "")[:240],
+        "summary": summary_text[:240] if summary_text else "",
         "findings_count": len(findings),
     }
 
 
 def _summarize_recommendations(recommendations_raw: Any) -> dict[str, Any]:
     recommendations = [item for item in as_list(recommendations_raw) if isinstance(item, dict)]
-    rec_types = [
-        str(item.get("type") or item.get("recommendation_type") or "") for item in recommendations
-    ]
     return {
         "count": len(recommendations),
-        "types": rec_types[:8],
+        "types": [
+            str(item.get("type") or item.get("recommendation_type") or "")
+            for item in recommendations[:8]
+        ],
     }
 
 
@@ -209,65 +195,105 @@ def _summarize_rule_draft(rule_draft_raw: Any) -> dict[str, Any]:
     }
 
 
-def _build_input_summary(state: InvestigationState, tool_name: str) -> dict[str, Any]:
+_Summarizer = Callable[[Any], dict[str, Any]]
+
+_CONTEXT = ("context", _summarize_context)
+_PATTERN_RESULTS = ("pattern_results", _summarize_pattern_results)
+_SIMILARITY_RESULTS = ("similarity_results", _summarize_similarity_results)
+_LINK_ANALYSIS_RESULTS = ("link_analysis_results", _summarize_link_analysis_results)
+_REASONING = ("reasoning", _summarize_reasoning)
+_RECOMMENDATIONS = ("recommendations", _summarize_recommendations)
+_RULE_DRAFT = ("rule_draft", _summarize_rule_draft)
+
+# State fields summarized as input for each tool, keyed by the state field name.
+_INPUT_SUMMARIZERS: dict[str, tuple[tuple[str, _Summarizer], ...]] = {
+    "pattern_tool": (_CONTEXT,),
+    "similarity_tool": (_CONTEXT, _PATTERN_RESULTS),
+    "link_analysis_tool": (_CONTEXT, _PATTERN_RESULTS, _SIMILARITY_RESULTS),
+    "reasoning_tool": (_CONTEXT, _PATTERN_RESULTS, _SIMILARITY_RESULTS, _LINK_ANALYSIS_RESULTS),
+    "recommendation_tool": (
+        _CONTEXT,
+        _PATTERN_RESULTS,
+        _SIMILARITY_RESULTS,
+        _LINK_ANALYSIS_RESULTS,
+        _REASONING,
+    ),
+    "rule_draft_tool": (_RECOMMENDATIONS,),
+}
+
+# State field each tool produces, summarized on successful execution.
+_OUTPUT_SUMMARIZERS: dict[str, tuple[str, _Summarizer]] = {
+    "context_tool": _CONTEXT,
+    "pattern_tool": _PATTERN_RESULTS,
+    "similarity_tool": _SIMILARITY_RESULTS,
+    "link_analysis_tool": _LINK_ANALYSIS_RESULTS,
+    "reasoning_tool": _REASONING,
+    "recommendation_tool": _RECOMMENDATIONS,
+    "rule_draft_tool": _RULE_DRAFT,
+}
+
+
+def _build_input_summary(
+    state: InvestigationState,
+    tool_name: str,
+    *,
+    detail: str = "full",
+) -> dict[str, Any]:
+    if detail == "none":
+        return {}
     summary: dict[str, Any] = {
         "transaction_id": state.get("transaction_id"),
         "current_severity": state.get("severity"),
         "step_count": state.get("step_count", 0),
-        "completed_steps": list(state.get("completed_steps", [])),
     }
-    if tool_name in {
-        "pattern_tool",
-        "similarity_tool",
-        "link_analysis_tool",
-        "reasoning_tool",
-        "recommendation_tool",
-    }:
-        summary["context"] = _summarize_context(state.get("context"))
-    if tool_name in {
-        "similarity_tool",
-        "link_analysis_tool",
-        "reasoning_tool",
-        "recommendation_tool",
-    }:
-        summary["pattern_results"] = _summarize_pattern_results(state.get("pattern_results"))
-    if tool_name in {"link_analysis_tool", "reasoning_tool", "recommendation_tool"}:
-        summary["similarity_results"] = _summarize_similarity_results(
-            state.get("similarity_results")
-        )
-    if tool_name in {"reasoning_tool", "recommendation_tool"}:
-        summary["link_analysis_results"] = _summarize_link_analysis_results(
-            state.get("link_analysis_results")
-        )
-    if tool_name == "recommendation_tool":
-        summary["reasoning"] = _summarize_reasoning(state.get("reasoning"))
-    if tool_name == "rule_draft_tool":
-        summary["recommendations"] = _summarize_recommendations(state.get("recommendations"))
+    completed_steps = state.get("completed_steps", [])
+    if detail == "minimal":
+        summary["completed_step_count"] = len(completed_steps)
+        return summary
+    # State lists are never mutated in place, so the summary can share the list.
+    summary["completed_steps"] = completed_steps
+    for key, summarize in _INPUT_SUMMARIZERS.get(tool_name, ()):
+        summary[key] = summarize(state.get(key))
     return summary
 
 
+# Tool execution statuses produced by executor_node, mapped to their llm_status form.
+_KNOWN_STATUSES: dict[str, str] = {
+    "SUCCESS": "success",
+    "FAILED": "failed",
+    "TIMED_OUT": "timed_out",
+}
+
+
 def _build_output_summary(
     state: InvestigationState,
     tool_name: str,
     *,
     status: str,
     error_message: str | None = None,
+    detail: str = "full",
 ) -> dict[str, Any]:
-    normalized_status = str(status).strip().upper() or "UNKNOWN"
-    llm_status = normalized_status.lower()
+    if status not in _KNOWN_STATUSES:
+        status = str(status).strip().upper() or "UNKNOWN"
+    if detail == "none":
+        return {"status": status}
     summary: dict[str, Any] = {
-        "status": normalized_status,
+        "status": status,
         "severity": state.get("severity"),
     }
     if error_message:
         summary["error_message"] = error_message[:240]
+    if detail == "minimal":
+        return summary
+    llm_status = _KNOWN_STATUSES.get(status) or status.lower()
+    if error_message:
         if tool_name == "reasoning_tool":
             summary["reasoning"] = {
                 "llm_status": llm_status,
                 "summary": "Reasoning tool did not produce usable output.",
             }
         return summary
-    if normalized_status != "SUCCESS":
+    if status != "SUCCESS":
         if tool_name == "reasoning_tool":
             summary["reasoning"] = {
                 "llm_status": llm_status,
@@ -275,24 +301,10 @@ def _build_output_summary(
             }
         return summary
 
-    if tool_name == "context_tool":
-        summary["context"] = _summarize_context(state.get("context"))
-    elif tool_name == "pattern_tool":
-        summary["pattern_results"] = _summarize_pattern_results(state.get("pattern_results"))
-    elif tool_name == "similarity_tool":
-        summary["similarity_results"] = _summarize_similarity_results(
-            state.get("similarity_results")
-        )
-    elif tool_name == "link_analysis_tool":
-        summary["link_analysis_results"] = _summarize_link_analysis_results(
-            state.get("link_analysis_results")
-        )
-    elif tool_name == "reasoning_tool":
-        summary["reasoning"] = _summarize_reasoning(state.get("reasoning"))
-    elif tool_name == "recommendation_tool":
-        summary["recommendations"] = _summarize_recommendations(state.get("recommendations"))
-    elif tool_name == "rule_draft_tool":
-        summary["rule_draft"] = _summarize_rule_draft(state.get("rule_draft"))
+    output_summarizer = _OUTPUT_SUMMARIZERS.get(tool_name)
+    if output_summarizer is not None:
+        key, summarize = output_summarizer
+        summary[key] = summarize(state.get(key))
     return summary
 
 
@@ -303,18 +315,49 @@ def _create_execution_record(
     *,
     input_summary: dict[str, Any],
     output_summary: dict[str, Any],
+    timestamp: str,
     error_message: str | None = None,
 ) -> ToolExecution:
-    """Build a ToolExecution record with consistent structure."""
-    return ToolExecution(
-        tool_name=tool_name,
-        input_summary=input_summary,
-        output_summary=output_summary,
-        execution_time_ms=execution_time_ms,
-        status=status,
-        error_message=error_message,
-        timestamp=utc_now().isoformat(),
-    )
+    """Build a ToolExecution record with consistent structure.
+
+    Records stay plain dicts: they are persisted as JSONB, reloaded as dicts,
+    and read via ``.get`` by the service layer, so a literal is used instead
+    of calling the TypedDict class (which only forwards kwargs to ``dict``).
+    """
+    execution: ToolExecution = {
+        "tool_name": tool_name,
+        "input_summary": input_summary,
+        "output_summary": output_summary,
+        "execution_time_ms": execution_time_ms,
+        "status": status,
+        "error_message": error_message,
+        "timestamp": timestamp,
+    }
+    return execution
+
+
+# Planner-supplied names that are not registered share one series so a bad LLM
+# response cannot create unbounded tool_name label cardinality.
+_UNKNOWN_TOOL_FAILED_TOTAL = ops_agent_tool_execution_total.labels(
+    tool_name="__unknown__", status="FAILED"
+)
+
+# (tool_name, status) -> bound (latency, total) metric children. Only registered
+# tools reach _record_metrics, so this stays bounded by tools x statuses.
+_TOOL_METRIC_CHILDREN: dict[tuple[str, str], tuple[Any, Any]] = {}
+
+
+def _tool_metric_children(tool_name: str, status: str) -> tuple[Any, Any]:
+    """Return label-bound tool metric children, binding them on first use."""
+    key = (tool_name, status)
+    children = _TOOL_METRIC_CHILDREN.get(key)
+    if children is None:
+        children = (
+            ops_agent_tool_execution_latency_seconds.labels(tool_name=tool_name, status=status),
+            ops_agent_tool_execution_total.labels(tool_name=tool_name, status=status),
+        )
+        _TOOL_METRIC_CHILDREN[key] = children
+    return children
 
 
 def _record_metrics(
@@ -323,20 +366,16 @@ def _record_metrics(
     elapsed_seconds: float,
     span: Any,
     *,
-    execution_time_ms: int = 0,
     error: str | None = None,
 ) -> None:
     """Record Prometheus metrics and span attributes for a tool execution."""
-    ops_agent_tool_execution_latency_seconds.labels(tool_name=tool_name, status=status).observe(
-        elapsed_seconds
-    )
-    ops_agent_tool_execution_total.labels(tool_name=tool_name, status=status).inc()
-    span.set_attribute("status", status)
-    span.set_attribute("tool_status", status)
-    if execution_time_ms:
-        span.set_attribute("execution_time_ms", execution_time_ms)
+    latency, total = _tool_metric_children(tool_name, status)
+    latency.observe(elapsed_seconds)
+    total.inc()
+    attributes: dict[str, Any] = {"status": status, "tool_status": status}
     if error:
-        span.set_attribute("error", error)
+        attributes["error"] = error
+    span.set_attributes(attributes)
 
 
 def _append_step(
@@ -348,38 +387,41 @@ def _append_step(
 
     Note: Only mark a step as completed when the tool execution succeeded.
     Failed or timed out tools may be retried by the planner.
-    """
-    existing_completed = list(state.get("completed_steps", []))
-    if str(execution.get("status", "")).upper() == "SUCCESS":
-        existing_completed.append(tool_name)
 
-    return {
-        **state,
-        "completed_steps": existing_completed,
-        "tool_executions": [*state.get("tool_executions", []), execution],
-    }
+    State lists are never mutated in place, but an unchanged ``completed_steps``
+    list is shared with the new state instead of being copied on every step.
+    """
+    updated = dict(state)
+    completed_steps = state.get("completed_steps", [])
+    if execution["status"] == "SUCCESS":
+        completed_steps = [*completed_steps, tool_name]
+    updated["completed_steps"] = completed_steps
+    updated["tool_executions"] = [*state.get("tool_executions", []), execution]
+    return updated
 
 
 async def executor_node(
     state: InvestigationState,
     registry: ToolRegistry,
+    *,
+    tool_timeout_seconds: float | None = None,
+    summary_detail: str | None = None,
 ) -> InvestigationState:
-    """Execute the selected tool and update state."""
+    """Execute the selected tool and update state.
+
+    ``tool_timeout_seconds`` and ``summary_detail`` are resolved once by the
+    graph builder; direct callers may omit them to fall back to configuration.
+    A non-positive tool timeout runs the tool without a deadline.
+    """
     tool_name = state["next_action"]
-    settings = get_settings()
-    input_summary = _build_input_summary(state, tool_name)
-
-    with tracer.start_as_current_span(f"agent.tool.{tool_name}") as span:
-        span.set_attribute("investigation_id", state["investigation_id"])
-        span.set_attribute("tool_name", tool_name)
-        if state.get("transaction_id"):
-            span.set_attribute("transaction_id", state["transaction_id"])
-        model_mode = state.get("model_mode", "unknown")
-        span.set_attribute("model_mode", model_mode)
-        if state.get("case_id"):
-            span.set_attribute("case_id", state["case_id"])
-        if state.get("scenario_name"):
-            span.set_attribute("scenario_name", state["scenario_name"])
+    if tool_timeout_seconds is None:
+        tool_timeout_seconds = get_settings().langgraph.tool_timeout_seconds
+    if summary_detail is None:
+        summary_detail = get_settings().langgraph.tool_summary_detail
+    input_summary = _build_input_summary(state, tool_name, detail=summary_detail)
+
+    with agent_span(tracer, f"agent.tool.{tool_name}") as span:
+        span.set_attributes({**investigation_span_attributes(state), "tool_name": tool_name})
 
         if not registry.has(tool_name):
             logger.error(
@@ -393,111 +435,82 @@ async def executor_node(
                 "FAILED",
                 0,
                 input_summary=input_summary,
+                timestamp=utc_now().isoformat(),
                 output_summary=_build_output_summary(
                     state,
                     tool_name,
                     status="FAILED",
                     error_message=error_msg,
+                    detail=summary_detail,
                 ),
                 error_message=error_msg,
             )
-            ops_agent_tool_execution_total.labels(tool_name=tool_name, status="FAILED").inc()
+            _UNKNOWN_TOOL_FAILED_TOTAL.inc()
             return _append_step(state, tool_name, execution)
 
         tool = registry.get(tool_name)
+        status = "SUCCESS"
+        error_msg: str | None = None
+        out_state = state
         start_time = time.perf_counter()
 
         try:
-            async with asyncio.timeout(settings.langgraph.tool_timeout_seconds):
-                updated_state = await tool.execute(state)
-
-            execution_time_ms = int((time.perf_counter() - start_time) * 1000)
-            execution = _create_execution_record(
-                tool_name,
-                "SUCCESS",
-                execution_time_ms,
-                input_summary=input_summary,
-                output_summary=_build_output_summary(
-                    updated_state,
-                    tool_name,
-                    status="SUCCESS",
-                ),
-            )
-            _record_metrics(
-                tool_name,
-                "SUCCESS",
-                execution_time_ms / 1000.0,
-                span,
-                execution_time_ms=execution_time_ms,
-            )
-
-            logger.info(
-                "Tool executed successfully",
-                tool_name=tool_name,
-                investigation_id=state["investigation_id"],
-                execution_time_ms=execution_time_ms,
-            )
-
-            return _append_step(updated_state, tool_name, execution)
-
+            if tool_timeout_seconds > 0:
+                deadline = asyncio.get_running_loop().time() + tool_timeout_seconds
+                async with asyncio.timeout_at(deadline):
+                    out_state = await tool.execute(state)
+            else:
+                out_state = await tool.execute(state)
         except TimeoutError:
-            execution_time_ms = int((time.perf_counter() - start_time) * 1000)
-            error_msg = f"Tool timed out after {settings.langgraph.tool_timeout_seconds}s"
-
+            status = "TIMED_OUT"
+            error_msg = f"Tool timed out after {tool_timeout_seconds}s"
             logger.warning(
                 "Tool timed out",
                 tool_name=tool_name,
                 investigation_id=state["investigation_id"],
-                timeout_seconds=settings.langgraph.tool_timeout_seconds,
-            )
-
-            execution = _create_execution_record(
-                tool_name,
-                "TIMED_OUT",
-                execution_time_ms,
-                input_summary=input_summary,
-                output_summary=_build_output_summary(
-                    state,
-                    tool_name,
-                    status="TIMED_OUT",
-                    error_message=error_msg,
-                ),
-                error_message=error_msg,
+                timeout_seconds=tool_timeout_seconds,
             )
-            _record_metrics(tool_name, "TIMED_OUT", execution_time_ms / 1000.0, span)
-
-            return _append_step(state, tool_name, execution)
-
         except Exception as exc:
-            execution_time_ms = int((time.perf_counter() - start_time) * 1000)
-
+            status = "FAILED"
+            error_msg = str(exc)
             logger.error(
                 "Tool execution failed",
                 tool_name=tool_name,
                 investigation_id=state["investigation_id"],
-                error=str(exc),
+                error=error_msg,
                 exc_info=True,
             )
 
-            execution = _create_execution_record(
-                tool_name,
-                "FAILED",
-                execution_time_ms,
-                input_summary=input_summary,
-                output_summary=_build_output_summary(
-                    state,
-                    tool_name,
-                    status="FAILED",
-                    error_message=str(exc),
-                ),
-                error_message=str(exc),
-            )
-            _record_metrics(
+        # Single exit path: failed and timed-out tools keep the input state.
+        execution_time_ms = int((time.perf_counter() - start_time) * 1000)
+        execution = _create_execution_record(
+            tool_name,
+            status,
+            execution_time_ms,
+            input_summary=input_summary,
+            timestamp=utc_now().isoformat(),
+            output_summary=_build_output_summary(
+                out_state,
                 tool_name,
-                "FAILED",
-                execution_time_ms / 1000.0,
-                span,
-                error=str(exc),
+                status=status,
+                error_message=error_msg,
+                detail=summary_detail,
+            ),
+            error_message=error_msg,
+        )
+        _record_metrics(
+            tool_name,
+            status,
+            execution_time_ms / 1000.0,
+            span,
+            error=error_msg if status == "FAILED" else None,
+        )
+        if status == "SUCCESS":
+            logger.info(
+                "Tool executed successfully",
+                tool_name=tool_name,
+                investigation_id=state["investigation_id"],
+                execution_time_ms=execution_time_ms,
             )
 
-            return _append_step(state, tool_name, execution)
+        return _append_step(out_state, tool_name, execution)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from langgraph.graph import END, StateGraph
@@ -28,6 +29,8 @@ def build_investigation_graph(
     state_store: PostgresStateStore | None = None,
 ) -> CompiledStateGraph:
     """Build and compile the investigation StateGraph."""
+    tool_timeout_seconds = settings.langgraph.tool_timeout_seconds
+    summary_detail = settings.langgraph.tool_summary_detail
 
     async def _save_state(state: InvestigationState) -> None:
         if state_store is None:
@@ -35,7 +38,7 @@ def build_investigation_graph(
         try:
             await state_store.save_state(
                 investigation_id=state["investigation_id"],
-                state=dict(state),
+                state=state,
             )
         except Exception:
             # Best-effort recovery for shared SQLAlchemy session state.
@@ -61,21 +64,36 @@ def build_investigation_graph(
         await _save_state(updated)
         return updated
 
+    run_executor = partial(
+        executor_node,
+        registry=registry,
+        tool_timeout_seconds=tool_timeout_seconds,
+        summary_detail=summary_detail,
+    )
+
     async def executor(state: InvestigationState) -> InvestigationState:
-        updated = await executor_node(state, registry)
+        updated = await run_executor(state)
         await _save_state(updated)
         return updated
 
     async def completion(state: InvestigationState) -> InvestigationState:
-        updated = await completion_node(state, state_store)
+        # Persist once here (with session rollback on failure) rather than also
+        # letting completion_node serialize and write the same final payload.
+        updated = await completion_node(state)
         await _save_state(updated)
         return updated
 
     builder = StateGraph(InvestigationState)
 
     builder.add_node("planner", planner)
-    builder.add_node("tool_executor", executor)
-    builder.add_node("completion", completion)
+    if state_store is None:
+        # Nothing to persist: let LangGraph await the nodes directly instead of
+        # going through a wrapper coroutine per transition.
+        builder.add_node("tool_executor", run_executor)
+        builder.add_node("completion", completion_node)
+    else:
+        builder.add_node("tool_executor", executor)
+        builder.add_node("completion", completion)
 
     builder.set_entry_point("planner")
 
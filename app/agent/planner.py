@@ -5,8 +5,12 @@ from __future__ import annotations
 import asyncio
 import json
 import time
+from collections import OrderedDict
+from functools import lru_cache
+from string import Formatter
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
 from langchain_core.messages import HumanMessage, SystemMessage
 from opentelemetry import trace
@@ -18,9 +22,12 @@ from app.core.metrics import (
     ops_agent_llm_calls_total,
     ops_agent_llm_latency_seconds,
     ops_agent_llm_tokens_total,
+    ops_agent_planner_cache_lookups_total,
     ops_agent_planner_decisions_total,
 )
+from app.core.tracing import investigation_span_attributes
 from app.utils.clock import utc_now
+from app.utils.constants import SEVERITY_RANK
 
 if TYPE_CHECKING:
     from langchain_core.language_models import BaseChatModel
@@ -30,6 +37,40 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# Pre-bound metric children for the per-step planner path; ``.labels()`` hashes the
+# label values and takes the metric lock on every call.
+_PLANNER_LLM_LATENCY = ops_agent_llm_latency_seconds.labels(purpose="planner")
+_PLANNER_LLM_CALLS = {
+    status: ops_agent_llm_calls_total.labels(purpose="planner", status=status)
+    for status in (
+        "success",
+        "repair_success",
+        "timeout",
+        "repair_timeout",
+        "error",
+        "repair_error",
+        "parse_error",
+        "repair_parse_error",
+        "fix_requested",
+        "invalid_decision",
+        "repair_requested",
+    )
+}
+_PLANNER_CACHE_LOOKUPS = {
+    result: ops_agent_planner_cache_lookups_total.labels(result=result)
+    for result in ("hit", "miss", "coalesced")
+}
+
+
+@lru_cache(maxsize=16)
+def _planner_token_counters(model_name: str) -> tuple[Any, Any, Any]:
+    """Return bound (input, output, cache_read) token counters for a model."""
+    return (
+        ops_agent_llm_tokens_total.labels(model=model_name, type="input"),
+        ops_agent_llm_tokens_total.labels(model=model_name, type="output"),
+        ops_agent_llm_tokens_total.labels(model=model_name, type="cache_read"),
+    )
+
 
 PLANNER_SYSTEM_PROMPT = """You are a fraud investigation planner for a card fraud operations team.
 Your job is to determine the NEXT investigation step based on current evidence.
@@ -40,6 +81,24 @@ Or to finish: {"tool": "COMPLETE", "reason": "<why>", "confidence": <0.0-1.0>}
 Only output the JSON object, no additional text.
 """
 
+# Static planning scaffolding. It is appended to the system prompt so every planner
+# call for a given tool set shares a byte-identical prefix, which lets the provider's
+# automatic prompt caching serve it from cache on every step after the first.
+PLANNER_TOOLS_TEMPLATE = """
+## Available Tools
+{tool_descriptions}
+
+## Rules
+1. ALWAYS retrieve context first if not yet available.
+2. Run analysis tools (pattern_tool, similarity_tool, link_analysis_tool) BEFORE reasoning_tool.
+3. Run reasoning_tool BEFORE recommendation_tool.
+4. Run recommendation_tool BEFORE rule_draft_tool.
+5. NEVER repeat a tool that is already in completed_steps.
+6. Output COMPLETE when recommendations have been generated and the investigation has sufficient evidence.
+7. If confidence is above 0.8 and recommendations exist, prefer COMPLETE over additional tools.
+"""
+
+# Per-step investigation state; always sent last so it never breaks the cached prefix.
 PLANNER_USER_TEMPLATE = """## Current Investigation State
 
 Transaction ID: {transaction_id}
@@ -58,22 +117,16 @@ Step Count: {step_count} / {max_steps}
 - Current Severity: {severity}
 - Findings Summary: {findings_summary}
 
-## Available Tools
-{tool_descriptions}
-
-## Rules
-1. ALWAYS retrieve context first if not yet available.
-2. Run analysis tools (pattern_tool, similarity_tool, link_analysis_tool) BEFORE reasoning_tool.
-3. Run reasoning_tool BEFORE recommendation_tool.
-4. Run recommendation_tool BEFORE rule_draft_tool.
-5. NEVER repeat a tool that is already in completed_steps.
-6. Output COMPLETE when recommendations have been generated and the investigation has sufficient evidence.
-7. If confidence is above 0.8 and recommendations exist, prefer COMPLETE over additional tools.
-
 ## Decision
 Select the next tool to execute, or COMPLETE if the investigation is sufficient.
 """
 
+# PLANNER_USER_TEMPLATE split once into (literal, field) segments so rendering is a
+# single join instead of re-parsing the template on every planner step.
+_PLANNER_USER_SEGMENTS = tuple(
+    (literal, field) for literal, field, _, _ in Formatter().parse(PLANNER_USER_TEMPLATE)
+)
+
 PLANNER_MAX_DECISION_REPAIRS = 2
 
 PLANNER_RESPONSE_FORMAT = {
@@ -84,6 +137,7 @@ PLANNER_RESPONSE_FORMAT = {
         "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
     },
     "required": ["tool", "reason", "confidence"],
+    "additionalProperties": False,
 }
 
 
@@ -94,25 +148,25 @@ async def planner_node(
 ) -> InvestigationState:
     """Analyze state and select next investigation tool using LLM."""
     with tracer.start_as_current_span("agent.planner") as span:
-        span.set_attribute("investigation_id", state["investigation_id"])
-        span.set_attribute("step_count", state["step_count"])
-        if state.get("transaction_id"):
-            span.set_attribute("transaction_id", state["transaction_id"])
-        model_mode = state.get("model_mode", "unknown")
-        span.set_attribute("model_mode", model_mode)
-        if state.get("case_id"):
-            span.set_attribute("case_id", state["case_id"])
-        if state.get("scenario_name"):
-            span.set_attribute("scenario_name", state["scenario_name"])
+        span.set_attributes(
+            {**investigation_span_attributes(state), "step_count": state["step_count"]}
+        )
 
         has_context = bool(state.get("context"))
-        valid_tools = set(registry.tool_names) | {"COMPLETE"} if registry else {"COMPLETE"}
+        valid_tools = registry.tool_name_set | {"COMPLETE"} if registry else {"COMPLETE"}
         settings = get_settings()
         feature_flags = state.get("feature_flags", {})
         planner_llm_enabled = bool(
             settings.planner.llm_enabled and feature_flags.get("planner_llm_enabled", True)
         )
-        planner_circuit_open = _planner_llm_circuit_open(state)
+        planner_fast_path_enabled = bool(
+            settings.planner.fast_path_enabled
+            and feature_flags.get("planner_fast_path_enabled", True)
+        )
+        planner_circuit_open = state.get("planner_circuit_open")
+        if planner_circuit_open is None:
+            # State persisted before the flag existed: derive it from past decisions.
+            planner_circuit_open = _planner_llm_circuit_open(state)
 
         llm_prompt_preview = None
         llm_response_preview = None
@@ -121,6 +175,9 @@ async def planner_node(
             tool_name = "context_tool"
             reason = "Context is required before any analysis"
             confidence = 0.99
+        elif planner_fast_path_enabled and _is_canonical_state(state, registry):
+            tool_name, _, confidence = _rule_sequence_next_tool(state, registry)
+            reason = "fast-path: canonical sequence"
         elif not planner_llm_enabled:
             tool_name, reason, confidence = _rule_sequence_next_tool(state, registry)
         elif planner_circuit_open:
@@ -130,21 +187,35 @@ async def planner_node(
             )
             tool_name, reason, confidence = _rule_sequence_next_tool(state, registry)
         else:
-            try:
-                (
-                    tool_name,
-                    reason,
-                    confidence,
-                    llm_prompt_preview,
-                    llm_response_preview,
-                ) = await _llm_planning(state, llm, registry)
-            except PlannerError as exc:
-                logger.warning(
-                    "Planner LLM failed — falling back to rule-sequence",
-                    investigation_id=state["investigation_id"],
-                    llm_error=str(exc),
-                )
-                tool_name, reason, confidence = _rule_sequence_next_tool(state, registry)
+            cache_size = settings.planner.decision_cache_size
+            cache_key = _decision_cache_key(state, registry) if cache_size > 0 else None
+            cached = _DECISION_CACHE.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                _PLANNER_CACHE_LOOKUPS["hit"].inc()
+                _DECISION_CACHE.move_to_end(cache_key)
+                tool_name, reason, confidence = cached
+            else:
+                try:
+                    (
+                        tool_name,
+                        reason,
+                        confidence,
+                        llm_prompt_preview,
+                        llm_response_preview,
+                    ) = (
+                        await _llm_planning(state, llm, registry)
+                        if cache_key is None
+                        else await _coalesced_llm_planning(
+                            state, llm, registry, cache_key, cache_size
+                        )
+                    )
+                except PlannerError as exc:
+                    logger.warning(
+                        "Planner LLM failed — falling back to rule-sequence",
+                        investigation_id=state["investigation_id"],
+                        llm_error=str(exc),
+                    )
+                    tool_name, reason, confidence = _rule_sequence_next_tool(state, registry)
 
         if tool_name not in valid_tools:
             raise PlannerError(
@@ -165,8 +236,7 @@ async def planner_node(
 
         ops_agent_planner_decisions_total.labels(selected_tool=tool_name).inc()
 
-        span.set_attribute("selected_tool", tool_name)
-        span.set_attribute("confidence", confidence)
+        span.set_attributes({"selected_tool": tool_name, "confidence": confidence})
 
         logger.info(
             "Planner decision",
@@ -177,12 +247,53 @@ async def planner_node(
             confidence=confidence,
         )
 
-        return {
-            **state,
-            "next_action": tool_name,
-            "step_count": state["step_count"] + 1,
-            "planner_decisions": [*state["planner_decisions"], decision],
-        }
+        updated = state.copy()
+        updated["next_action"] = tool_name
+        updated["step_count"] = state["step_count"] + 1
+        updated["planner_decisions"] = [*state["planner_decisions"], decision]
+        updated["planner_circuit_open"] = planner_circuit_open or reason == _LLM_UNAVAILABLE_REASON
+        return updated
+
+
+async def _coalesced_llm_planning(
+    state: InvestigationState,
+    llm: BaseChatModel,
+    registry: ToolRegistry,
+    cache_key: tuple[Any, ...],
+    cache_size: int,
+) -> tuple[str, str, float, str | None, str | None]:
+    """Run ``_llm_planning`` once per fingerprint and cache the decision.
+
+    Concurrent planner calls with the same fingerprint await the in-flight call
+    instead of issuing their own; if it fails they fall back like it did.
+    """
+    inflight = _INFLIGHT_DECISIONS.get(cache_key)
+    if inflight is not None:
+        _PLANNER_CACHE_LOOKUPS["coalesced"].inc()
+        # Shield so a cancelled follower does not cancel the shared future.
+        decision = await asyncio.shield(inflight)
+        if decision is None:
+            raise PlannerError(
+                "LLM planning failed: coalesced planner call failed",
+                investigation_id=state["investigation_id"],
+            )
+        return (*decision, None, None)
+
+    _PLANNER_CACHE_LOOKUPS["miss"].inc()
+    future: asyncio.Future[tuple[str, str, float] | None] = (
+        asyncio.get_running_loop().create_future()
+    )
+    _INFLIGHT_DECISIONS[cache_key] = future
+    decision = None
+    try:
+        result = await _llm_planning(state, llm, registry)
+        decision = result[:3]
+        _store_cached_decision(cache_key, decision, cache_size)
+        return result
+    finally:
+        del _INFLIGHT_DECISIONS[cache_key]
+        if not future.done():
+            future.set_result(decision)
 
 
 async def _llm_planning(
@@ -191,13 +302,11 @@ async def _llm_planning(
     registry: ToolRegistry,
 ) -> tuple[str, str, float, str | None, str | None]:
     """Call LLM for planning decision. Raises PlannerError on failure."""
-    tool_descriptions = "\n".join(
-        f"- {t['name']}: {t['description']}" for t in registry.list_tools()
-    )
+    system_prompt = _build_planner_system_prompt(registry.tool_descriptions_block())
 
     # SECURITY: state values are produced by internal investigation flow, not direct user input.
     # Transaction context is sourced from authenticated TM service calls and controlled tool outputs.
-    user_prompt = PLANNER_USER_TEMPLATE.format(
+    user_prompt = _render_planner_user_prompt(
         transaction_id=state["transaction_id"],
         completed_steps=", ".join(state["completed_steps"]) or "none",
         step_count=state["step_count"],
@@ -212,30 +321,34 @@ async def _llm_planning(
         confidence_score=state.get("confidence_score", 0.0),
         severity=state.get("severity", "LOW"),
         findings_summary=_build_findings_summary(state),
-        tool_descriptions=tool_descriptions,
     )
 
     messages = [
-        SystemMessage(content=PLANNER_SYSTEM_PROMPT),
+        SystemMessage(content=system_prompt),
         HumanMessage(content=user_prompt),
     ]
 
-    current_span = trace.get_current_span()
-    current_span.add_event(
-        "llm.request",
-        {
-            "purpose": "planner",
-            "system_prompt_chars": len(PLANNER_SYSTEM_PROMPT),
-            "user_prompt_preview": user_prompt[:2000],
-        },
-    )
-
     settings = get_settings()
-    available_tools = set(registry.tool_names)
+    current_span = trace.get_current_span()
+    # Prompt/response previews are only sliced and exported for sampled spans
+    # with verbose planner tracing enabled.
+    trace_previews = current_span.is_recording() and settings.planner.verbose_tracing
+    preview_chars = settings.planner.trace_preview_chars
+    request_attributes: dict[str, Any] = {
+        "purpose": "planner",
+        "system_prompt_chars": len(system_prompt),
+        "user_prompt_chars": len(user_prompt),
+    }
+    if trace_previews:
+        request_attributes["user_prompt_preview"] = user_prompt[:preview_chars]
+    current_span.add_event("llm.request", request_attributes)
+
+    available_tools = registry.tool_name_set
     response_messages: list[HumanMessage | SystemMessage] = list(messages)
 
+    fix_retries_left = settings.planner.fix_retries
     for repair_attempt in range(PLANNER_MAX_DECISION_REPAIRS + 1):
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         status = "success" if repair_attempt == 0 else "repair_success"
         try:
             async with asyncio.timeout(settings.langgraph.planner_timeout_seconds):
@@ -244,52 +357,56 @@ async def _llm_planning(
                     max_tokens=settings.planner.max_tokens,
                     request_timeout=float(settings.langgraph.planner_timeout_seconds + 5),
                     response_format=PLANNER_RESPONSE_FORMAT,
+                    response_format_name="planner_decision",
                 )
         except TimeoutError as exc:
             status = "timeout" if repair_attempt == 0 else "repair_timeout"
-            ops_agent_llm_calls_total.labels(purpose="planner", status=status).inc()
+            _PLANNER_LLM_CALLS[status].inc()
             raise PlannerError(
                 f"LLM planning timeout after {settings.langgraph.planner_timeout_seconds}s",
                 investigation_id=state["investigation_id"],
             ) from exc
         except Exception as exc:
             status = "error" if repair_attempt == 0 else "repair_error"
-            ops_agent_llm_calls_total.labels(purpose="planner", status=status).inc()
+            _PLANNER_LLM_CALLS[status].inc()
             raise PlannerError(
                 f"LLM planning failed: {exc}",
                 investigation_id=state["investigation_id"],
             ) from exc
         finally:
-            elapsed = time.perf_counter() - start_time
-            ops_agent_llm_latency_seconds.labels(purpose="planner").observe(elapsed)
+            _PLANNER_LLM_LATENCY.observe((time.perf_counter_ns() - start_ns) / 1e9)
 
-        ops_agent_llm_calls_total.labels(purpose="planner", status=status).inc()
+        _PLANNER_LLM_CALLS[status].inc()
 
         input_tokens = 0
         output_tokens = 0
+        cache_read_tokens = 0
         if hasattr(response, "usage_metadata") and response.usage_metadata:
             metadata = response.usage_metadata
-            model_name = getattr(llm, "model", "unknown")
+            input_counter, output_counter, cache_read_counter = _planner_token_counters(
+                getattr(llm, "model", "unknown")
+            )
             if "input_tokens" in metadata:
                 input_tokens = metadata["input_tokens"]
-                ops_agent_llm_tokens_total.labels(model=model_name, type="input").inc(input_tokens)
+                input_counter.inc(input_tokens)
             if "output_tokens" in metadata:
                 output_tokens = metadata["output_tokens"]
-                ops_agent_llm_tokens_total.labels(model=model_name, type="output").inc(
-                    output_tokens
-                )
+                output_counter.inc(output_tokens)
+            cache_read_tokens = (metadata.get("input_token_details") or {}).get("cache_read", 0)
+            if cache_read_tokens:
+                cache_read_counter.inc(cache_read_tokens)
 
         response_content = str(response.content)
-        current_span.add_event(
-            "llm.response",
-            {
-                "purpose": "planner" if repair_attempt == 0 else "planner_repair",
-                "attempt": repair_attempt + 1,
-                "content_preview": response_content[:2000],
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-            },
-        )
+        response_attributes: dict[str, Any] = {
+            "purpose": "planner" if repair_attempt == 0 else "planner_repair",
+            "attempt": repair_attempt + 1,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cache_read_tokens": cache_read_tokens,
+        }
+        if trace_previews:
+            response_attributes["content_preview"] = response_content[:preview_chars]
+        current_span.add_event("llm.response", response_attributes)
 
         try:
             parsed = _parse_planner_payload(response.content)
@@ -301,7 +418,16 @@ async def _llm_planning(
                 raise ValueError("LLM returned empty tool name")
         except (json.JSONDecodeError, ValueError, TypeError) as exc:
             parse_status = "parse_error" if repair_attempt == 0 else "repair_parse_error"
-            ops_agent_llm_calls_total.labels(purpose="planner", status=parse_status).inc()
+            _PLANNER_LLM_CALLS[parse_status].inc()
+            if fix_retries_left > 0 and repair_attempt < PLANNER_MAX_DECISION_REPAIRS:
+                # Ask for the same decision reformatted instead of abandoning the LLM plan.
+                fix_retries_left -= 1
+                response_messages = [
+                    *messages,
+                    HumanMessage(content=_build_planner_fix_instruction(response_content)),
+                ]
+                _PLANNER_LLM_CALLS["fix_requested"].inc()
+                continue
             raise PlannerError(
                 f"LLM planning failed: failed to parse LLM response: {response_content[:200]}",
                 investigation_id=state["investigation_id"],
@@ -311,7 +437,7 @@ async def _llm_planning(
         if not rule_violation:
             return tool, reason, confidence, user_prompt, response_content
 
-        ops_agent_llm_calls_total.labels(purpose="planner", status="invalid_decision").inc()
+        _PLANNER_LLM_CALLS["invalid_decision"].inc()
         current_span.add_event(
             "llm.response_invalid_decision",
             {
@@ -347,7 +473,7 @@ async def _llm_planning(
                 )
             ),
         ]
-        ops_agent_llm_calls_total.labels(purpose="planner", status="repair_requested").inc()
+        _PLANNER_LLM_CALLS["repair_requested"].inc()
 
     raise PlannerError(
         "LLM planning failed: repair loop exhausted",
@@ -355,10 +481,68 @@ async def _llm_planning(
     )
 
 
+# Process-local LRU of LLM planner decisions keyed by a coarse state fingerprint.
+# Disabled unless PLANNER_DECISION_CACHE_SIZE > 0.
+_DECISION_CACHE: OrderedDict[tuple[Any, ...], tuple[str, str, float]] = OrderedDict()
+# Planner LLM calls currently in flight, keyed like _DECISION_CACHE; resolves to the
+# decision, or None when the call failed.
+_INFLIGHT_DECISIONS: dict[tuple[Any, ...], asyncio.Future[tuple[str, str, float] | None]] = {}
+
+
+def _decision_cache_key(state: InvestigationState, registry: ToolRegistry) -> tuple[Any, ...]:
+    """Fingerprint the planner inputs that drive the LLM's tool choice."""
+    return (
+        frozenset(state["completed_steps"]),
+        bool(state.get("context")),
+        bool(state.get("pattern_results")),
+        bool(state.get("similarity_results")),
+        bool(state.get("link_analysis_results")),
+        bool(state.get("reasoning")),
+        bool(state.get("recommendations")),
+        state.get("rule_draft") is not None,
+        state.get("severity", "LOW"),
+        round(float(state.get("confidence_score", 0.0)), 1),
+        registry.tool_names,
+    )
+
+
+def _store_cached_decision(
+    key: tuple[Any, ...],
+    decision: tuple[str, str, float],
+    max_size: int,
+) -> None:
+    _DECISION_CACHE[key] = decision
+    _DECISION_CACHE.move_to_end(key)
+    while len(_DECISION_CACHE) > max_size:
+        _DECISION_CACHE.popitem(last=False)
+
+
+def _render_planner_user_prompt(**values: Any) -> str:
+    """Equivalent to ``PLANNER_USER_TEMPLATE.format(**values)`` using pre-split segments."""
+    return "".join(
+        [
+            literal + (str(values[field]) if field else "")
+            for literal, field in _PLANNER_USER_SEGMENTS
+        ]
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_planner_system_prompt(tool_descriptions: str) -> str:
+    """Render the static planner prefix (instructions, tools, rules) for a tool set.
+
+    The graph registers tools in a fixed order, so the prefix stays byte-identical
+    across workers sharing the provider's prompt cache.
+    """
+    return PLANNER_SYSTEM_PROMPT + PLANNER_TOOLS_TEMPLATE.format(
+        tool_descriptions=tool_descriptions
+    )
+
+
 def _validate_planner_decision(
     state: InvestigationState,
     tool_name: str,
-    available_tools: set[str],
+    available_tools: frozenset[str],
 ) -> str | None:
     """Validate sequencing constraints for LLM planner choices."""
     completed = set(state.get("completed_steps", []))
@@ -413,6 +597,18 @@ def _build_planner_repair_instruction(
     )
 
 
+def _build_planner_fix_instruction(response_preview: str) -> str:
+    preview = response_preview.strip().replace("\x00", "")
+    if len(preview) > 1200:
+        preview = preview[:1200] + "..."
+    return (
+        "Your previous planner response was not a valid JSON decision.\n"
+        "Return only one raw JSON object with keys: tool, reason, confidence.\n"
+        "Keep the same decision; do not use markdown or code fences.\n\n"
+        f"Previous response:\n{preview}"
+    )
+
+
 def _strip_markdown_fences(text: str) -> str:
     stripped = text.strip()
     if stripped.startswith("```"):
@@ -466,7 +662,7 @@ def _parse_planner_payload(raw_content: Any) -> dict[str, Any]:
                 candidates.append(value)
 
     for candidate in candidates:
-        parsed = json.loads(candidate)
+        parsed = orjson.loads(candidate)
         if isinstance(parsed, dict):
             return parsed
 
@@ -483,10 +679,40 @@ _TOOL_SEQUENCE = [
 ]
 
 
+_HIGH_SEVERITY_RANK = SEVERITY_RANK["HIGH"]
+
+
+def _is_high_severity(state: InvestigationState) -> bool:
+    """Return True when state severity is HIGH or CRITICAL."""
+    severity = state.get("severity", "")
+    rank = SEVERITY_RANK.get(severity)
+    if rank is None and isinstance(severity, str):
+        rank = SEVERITY_RANK.get(severity.upper())
+    return (rank or 0) >= _HIGH_SEVERITY_RANK
+
+
+def _is_canonical_state(state: InvestigationState, registry: ToolRegistry) -> bool:
+    """Return True when the next step is unambiguous and the LLM adds nothing.
+
+    That is the case while completed steps are a strict prefix of the canonical
+    tool sequence (restricted to registered tools) and severity is not HIGH/CRITICAL.
+    """
+    if _is_high_severity(state):
+        return False
+    available = registry.tool_name_set if registry else frozenset()
+    canonical = [tool for tool in _TOOL_SEQUENCE if tool in available]
+    completed = state["completed_steps"]
+    return len(completed) < len(canonical) and completed == canonical[: len(completed)]
+
+
+# Reason recorded when the rule sequence stands in for the LLM planner; it opens
+# the planner circuit for the rest of the investigation.
+_LLM_UNAVAILABLE_REASON = "rule-sequence fallback: LLM planner unavailable"
+
+
 def _should_attempt_rule_draft(state: InvestigationState) -> bool:
     """Return True when fallback flow should attempt rule draft generation."""
-    severity = str(state.get("severity", "")).upper()
-    if severity in {"HIGH", "CRITICAL"}:
+    if _is_high_severity(state):
         return True
 
     recommendations = state.get("recommendations", [])
@@ -496,8 +722,9 @@ def _should_attempt_rule_draft(state: InvestigationState) -> bool:
     for rec in recommendations:
         if not isinstance(rec, dict):
             continue
-        rec_type = str(rec.get("type", "")).lower()
-        if "rule" in rec_type:
+        # recommendation_tool writes lowercase types, so no per-read normalization.
+        rec_type = rec.get("type")
+        if isinstance(rec_type, str) and "rule" in rec_type:
             return True
     return False
 
@@ -510,12 +737,14 @@ def _rule_sequence_next_tool(
 
     Used as a fallback when the LLM planner fails so investigations always complete.
     """
-    completed = set(state["completed_steps"])
-    available = set(registry.tool_names) if registry else set()
+    # completed_steps holds at most one entry per tool, so list membership is cheaper
+    # than building a set on every fallback decision.
+    completed = state["completed_steps"]
+    available = registry.tool_name_set if registry else frozenset()
 
     for tool in _TOOL_SEQUENCE:
         if tool not in completed and tool in available:
-            return tool, "rule-sequence fallback: LLM planner unavailable", 0.5
+            return tool, _LLM_UNAVAILABLE_REASON, 0.5
 
     if (
         "rule_draft_tool" in available
@@ -529,7 +758,11 @@ def _rule_sequence_next_tool(
 
 
 def _build_findings_summary(state: InvestigationState) -> str:
-    """Build a brief summary of findings so far for planner context."""
+    """Build a brief summary of findings so far for planner context.
+
+    Only rendered inside ``_llm_planning``: bootstrap, fast-path, cached and
+    circuit-open decisions never pay for it.
+    """
     parts: list[str] = []
     pattern = state.get("pattern_results", {})
     if pattern:
@@ -552,14 +785,19 @@ def _build_findings_summary(state: InvestigationState) -> str:
     return "; ".join(parts) if parts else "none"
 
 
+def _opens_planner_circuit(reason: str) -> bool:
+    """Return True when a decision reason marks a hard LLM planner failure."""
+    reason = reason.lower()
+    return (
+        "rule-sequence fallback: llm planner unavailable" in reason
+        or "rule-sequence fallback: planner circuit open" in reason
+    )
+
+
 def _planner_llm_circuit_open(state: InvestigationState) -> bool:
-    """Open planner fallback circuit after first hard LLM planner failure."""
-    for decision in state.get("planner_decisions", []):
-        if not isinstance(decision, dict):
-            continue
-        reason = str(decision.get("reason") or "").lower()
-        if "rule-sequence fallback: llm planner unavailable" in reason:
-            return True
-        if "rule-sequence fallback: planner circuit open" in reason:
-            return True
-    return False
+    """Derive the planner circuit from past decisions (legacy states without the flag)."""
+    return any(
+        _opens_planner_circuit(str(decision.get("reason") or ""))
+        for decision in state.get("planner_decisions", [])
+        if isinstance(decision, dict)
+    )
@@ -2,39 +2,104 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from app.tools.base import BaseTool
 
 
 class ToolRegistry:
-    """Registry for investigation tools."""
+    """Registry for investigation tools.
+
+    Tools are registered once per graph build and then read on every planner
+    step; call ``freeze()`` after the last registration to lock the registry and
+    precompute its read-only views.
+    """
 
     def __init__(self) -> None:
-        self._tools: dict[str, BaseTool] = {}
+        self._tools: Mapping[str, BaseTool] = {}
+        self._frozen = False
+        # Derived views are rebuilt lazily after each registration.
+        self._tool_names_cached: tuple[str, ...] | None = None
+        self._tool_name_set_cached: frozenset[str] | None = None
+        self._tool_list_cached: list[dict[str, str]] | None = None
+        self._tool_descriptions_cached: str | None = None
 
     def register(self, tool: BaseTool) -> None:
-        """Register a tool by its name."""
+        """Register a tool by its name. Raises RuntimeError once frozen."""
+        if self._frozen:
+            raise RuntimeError(f"Tool registry is frozen; cannot register: {tool.name}")
         if tool.name in self._tools:
             raise ValueError(f"Tool already registered: {tool.name}")
-        self._tools[tool.name] = tool
+        self._tools[tool.name] = tool  # type: ignore[index]
+        self._tool_names_cached = None
+        self._tool_name_set_cached = None
+        self._tool_list_cached = None
+        self._tool_descriptions_cached = None
+
+    def freeze(self) -> None:
+        """Lock the registry and precompute its derived views. Idempotent."""
+        if self._frozen:
+            return
+        self._tools = MappingProxyType(dict(self._tools))
+        self._frozen = True
+        self._tool_names_cached = tuple(sorted(self._tools))
+        self._tool_name_set_cached = frozenset(self._tools)
+        self.list_tools()
+        self.tool_descriptions_block()
+
+    @property
+    def frozen(self) -> bool:
+        """Whether ``freeze()`` has been called."""
+        return self._frozen
 
     def get(self, name: str) -> BaseTool:
         """Get a tool by name. Raises KeyError if not found."""
-        if name not in self._tools:
+        tool = self._tools.get(name)
+        if tool is None:
             raise KeyError(f"Unknown tool: {name}")
-        return self._tools[name]
+        return tool
 
     def list_tools(self) -> list[dict[str, str]]:
-        """List all registered tools with name and description."""
-        return [{"name": t.name, "description": t.description} for t in self._tools.values()]
+        """List all registered tools with name and description.
+
+        The returned list is cached and shared between callers; do not mutate it.
+        """
+        if self._tool_list_cached is None:
+            self._tool_list_cached = [
+                {"name": t.name, "description": t.description} for t in self._tools.values()
+            ]
+        return self._tool_list_cached
+
+    def tool_descriptions_block(self) -> str:
+        """Return ``- name: description`` lines for all tools in registration order.
+
+        The graph registers tools in investigation order, which the planner prompt
+        relies on to suggest the canonical sequence.
+        """
+        if self._tool_descriptions_cached is None:
+            self._tool_descriptions_cached = "\n".join(
+                f"- {tool.name}: {tool.description}" for tool in self._tools.values()
+            )
+        return self._tool_descriptions_cached
 
     def has(self, name: str) -> bool:
         """Check if a tool is registered."""
         return name in self._tools
 
     @property
-    def tool_names(self) -> list[str]:
-        """Return sorted list of registered tool names."""
-        return sorted(self._tools.keys())
+    def tool_names(self) -> tuple[str, ...]:
+        """Return registered tool names as a cached, sorted tuple."""
+        if self._tool_names_cached is None:
+            self._tool_names_cached = tuple(sorted(self._tools))
+        return self._tool_names_cached
+
+    @property
+    def tool_name_set(self) -> frozenset[str]:
+        """Return registered tool names as a cached frozenset for membership checks."""
+        if self._tool_name_set_cached is None:
+            self._tool_name_set_cached = frozenset(self._tools)
+        return self._tool_name_set_cached
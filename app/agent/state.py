@@ -77,6 +77,8 @@ class InvestigationState(TypedDict):
     planner_decisions: list[PlannerDecision]
     tool_executions: list[ToolExecution]
     error: str | None
+    # Set once a planner decision falls back after a hard LLM failure
+    planner_circuit_open: bool
 
     # Runtime feature flags snapshot (TDD-002 sec. 2)
     feature_flags: dict[str, bool]
@@ -124,6 +126,7 @@ def create_initial_state(
         planner_decisions=[],
         tool_executions=[],
         error=None,
+        planner_circuit_open=False,
         feature_flags=feature_flags or {},
         safeguards=safeguards or {},
     )
@@ -140,5 +143,9 @@ def update_state(state: InvestigationState, **updates: Any) -> InvestigationStat
     >>> s2 = update_state(s, severity="HIGH", confidence_score=0.85)
     >>> s2["severity"]
     'HIGH'
+
+    Uses dict union, which copies the state with a single C-level dict copy
+    rather than re-inserting every key as ``{**state, **updates}`` does.
+    Lists inside the state are shared, never mutated in place.
     """
-    return {**state, **updates}  # type: ignore[return-value]
+    return state | updates  # type: ignore[return-value]
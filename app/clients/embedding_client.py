@@ -13,7 +13,7 @@ from app.core.config import Settings, get_settings
 from app.core.tracing import get_tracing_headers
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmbeddingResponse:
     embedding: list[float]
     model: str
@@ -103,6 +103,12 @@ class TMClient:
         self._base_url = config.base_url.rstrip("/")
         self._timeout = config.timeout_seconds
         self._retry_count = config.retry_count
+        # One bounded keep-alive pool shared by every investigation: concurrent
+        # context/history calls queue for a connection instead of opening new ones.
+        self._limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_connections,
+        )
         self._client: httpx.AsyncClient | None = None
 
         # Circuit breaker state
@@ -116,7 +122,7 @@ class TMClient:
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self._timeout)
+            self._client = httpx.AsyncClient(timeout=self._timeout, limits=self._limits)
         return self._client
 
     async def close(self) -> None:
@@ -9,6 +9,7 @@ from __future__ import annotations
 import os
 from enum import StrEnum
 from functools import lru_cache
+from typing import Literal
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from pydantic import AliasChoices, Field, SecretStr, field_validator, model_validator
@@ -483,6 +484,8 @@ class LangGraphConfig(BaseSettings):
     investigation_timeout_seconds: int = Field(default=180)
     tool_timeout_seconds: int = Field(default=120)
     planner_timeout_seconds: int = Field(default=60)
+    # Detail level of per-step tool input/output summaries (full | minimal | none).
+    tool_summary_detail: Literal["none", "minimal", "full"] = Field(default="full")
 
     model_config = SettingsConfigDict(env_prefix="LANGGRAPH_")
 
@@ -493,6 +496,11 @@ class PlannerConfig(BaseSettings):
     temperature: float = Field(default=0.1)
     max_tokens: int = Field(default=256)
     timeout_seconds: int = Field(default=10)
+    decision_cache_size: int = Field(default=0)
+    fast_path_enabled: bool = Field(default=False)
+    fix_retries: int = Field(default=1)
+    verbose_tracing: bool = Field(default=False)
+    trace_preview_chars: int = Field(default=256)
 
     model_config = SettingsConfigDict(env_prefix="PLANNER_")
 
@@ -503,6 +511,7 @@ class TMClientConfig(BaseSettings):
     retry_count: int = Field(default=3)
     circuit_breaker_threshold: int = Field(default=5)
     circuit_breaker_timeout: int = Field(default=60)
+    max_connections: int = Field(default=20)
     m2m_client_id: str = Field(default="")
     m2m_client_secret: SecretStr = Field(default=SecretStr(""))
     m2m_audience: str = Field(default="")
@@ -42,6 +42,12 @@ ops_agent_planner_decisions_total = Counter(
     ["selected_tool"],
 )
 
+ops_agent_planner_cache_lookups_total = Counter(
+    "ops_agent_planner_cache_lookups_total",
+    "Planner decision cache lookups",
+    ["result"],  # result: hit, miss, coalesced
+)
+
 # ---------------------------------------------------------------------------
 # Tool execution
 # ---------------------------------------------------------------------------
@@ -100,7 +106,7 @@ ops_agent_llm_latency_seconds = Histogram(
 ops_agent_llm_tokens_total = Counter(
     "ops_agent_llm_tokens_total",
     "Total tokens consumed in LLM calls",
-    ["model", "type"],  # type: input, output
+    ["model", "type"],  # type: input, output, cache_read
 )
 
 ops_agent_llm_cost_tokens_total = Counter(
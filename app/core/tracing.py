@@ -5,7 +5,10 @@ information that needs to propagate across async boundaries to outbound HTTP
 calls (LLM provider, Rule Management, Embedding service).
 """
 
+import os
 import uuid
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import Any
 
@@ -15,6 +18,36 @@ from opentelemetry import trace as otel_trace
 request_id_ctx: ContextVar[str | None] = ContextVar("request_id", default=None)
 trace_parent_ctx: ContextVar[str | None] = ContextVar("trace_parent", default=None)
 
+# Agent node spans are emitted unless explicitly disabled. Resolved once at import
+# so the per-step hot path never re-reads the environment.
+_TRACING_ENABLED = os.getenv("OTEL_AGENT_SPANS_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
+
+class _NoopSpan:
+    """Span stand-in used when agent spans are disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        return None
+
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None:
+        return None
+
+    def add_event(self, name: str, attributes: dict[str, Any] | None = None) -> None:
+        return None
+
+    def is_recording(self) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
 
 def get_request_id() -> str | None:
     """Get the current request ID from context."""
@@ -93,3 +126,57 @@ def get_current_trace_id() -> str | None:
     if not span_ctx or not span_ctx.is_valid:
         return None
     return f"{span_ctx.trace_id:032x}"
+
+
+def investigation_span_attributes(
+    state: Mapping[str, Any],
+    *,
+    model_mode: str | None = None,
+) -> dict[str, Any]:
+    """Return the identifying attributes shared by investigation spans.
+
+    Built as one dict so call sites can apply them with a single
+    ``span.set_attributes`` call. Optional IDs are included only when set;
+    ``model_mode`` overrides the state's value.
+    """
+    attributes: dict[str, Any] = {
+        "investigation_id": state["investigation_id"],
+        "model_mode": model_mode or state.get("model_mode", "unknown"),
+    }
+    for key in ("transaction_id", "case_id", "scenario_name"):
+        value = state.get(key)
+        if value:
+            attributes[key] = value
+    return attributes
+
+
+@contextmanager
+def agent_span(tracer: otel_trace.Tracer, name: str) -> Iterator[Any]:
+    """Start an agent node span, or yield a shared no-op span when disabled.
+
+    Keeps ``span.set_attribute`` call sites unchanged while avoiding span and
+    attribute allocation per graph step when agent spans are turned off, or
+    when the enclosing span was sampled out and would drop this child anyway.
+    """
+    if not _TRACING_ENABLED:
+        yield _NOOP_SPAN
+        return
+    parent = otel_trace.get_current_span()
+    if parent.get_span_context().is_valid and not parent.is_recording():
+        yield _NOOP_SPAN
+        return
+    with tracer.start_as_current_span(name) as span:
+        yield span
+
+
+def current_agent_span(name: str) -> Any:
+    """Return the current span if it is the recording agent span ``name``.
+
+    Lets code running inside ``agent_span`` annotate that span directly. Falls back
+    to the no-op span when agent spans are disabled or sampled out, so nothing is
+    written onto an enclosing investigation span instead.
+    """
+    span = otel_trace.get_current_span()
+    if _TRACING_ENABLED and span.is_recording() and getattr(span, "name", None) == name:
+        return span
+    return _NOOP_SPAN
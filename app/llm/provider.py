@@ -32,6 +32,104 @@ _REASONING_MODEL_PREFIXES = ("gpt-5", "o1", "o3", "o4")
 _DEFAULT_REASONING_EFFORT = "minimal"
 
 
+# Process-wide HTTP client shared by every chat provider so concurrent
+# investigations reuse pooled keep-alive connections instead of paying a TCP/TLS
+# handshake per LLM call. Rebuilt if the running event loop changes.
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        if _http_client is not None and not _http_client.is_closed:
+            _release_stale_http_client(_http_client, _http_client_loop)
+        _http_client = httpx.AsyncClient()
+        _http_client_loop = loop
+    return _http_client
+
+
+def _release_stale_http_client(
+    client: httpx.AsyncClient,
+    loop: asyncio.AbstractEventLoop | None,
+) -> None:
+    """Close a shared client left behind by another event loop.
+
+    Its connections are bound to that loop, so ``aclose()`` is scheduled there. A
+    client whose loop has already closed cannot be awaited; dropping the reference
+    lets its transport be collected.
+    """
+    if loop is None or loop.is_closed():
+        return
+    close = client.aclose()
+    try:
+        asyncio.run_coroutine_threadsafe(close, loop)
+    except RuntimeError:
+        # The loop closed after the check above.
+        close.close()
+
+
+async def close_chat_http_client() -> None:
+    """Close the shared LLM HTTP client."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        try:
+            if not _http_client.is_closed:
+                await _http_client.aclose()
+        except RuntimeError, httpx.HTTPError:
+            logger.warning("Error closing LLM HTTP client", exc_info=True)
+        finally:
+            _http_client = None
+            _http_client_loop = None
+
+
+# (base_url, model) pairs whose endpoint rejected a json_schema response_format with a 400.
+_JSON_SCHEMA_UNSUPPORTED: set[tuple[str, str]] = set()
+
+
+def _response_format(
+    base_url: str,
+    model: str,
+    schema: Any,
+    name: str,
+) -> dict[str, Any]:
+    """Build the JSON-mode response_format, preferring native structured outputs.
+
+    A JSON schema is sent as ``json_schema`` (strict when the schema forbids
+    additional properties); endpoints known to reject it get plain ``json_object``.
+    """
+    if not isinstance(schema, dict) or not schema or (base_url, model) in _JSON_SCHEMA_UNSUPPORTED:
+        return {"type": "json_object"}
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "schema": schema,
+            "strict": schema.get("additionalProperties") is False,
+        },
+    }
+
+
+def _uses_json_schema(payload: dict[str, Any]) -> bool:
+    return (payload.get("response_format") or {}).get("type") == "json_schema"
+
+
+def _rejects_json_schema(exc: httpx.HTTPStatusError) -> bool:
+    """Return True if a 400 response blames the structured-output response_format.
+
+    Other 400s (context length, max_tokens, content policy) must not downgrade the
+    endpoint, since a json_object retry would fail the same way.
+    """
+    if exc.response.status_code != 400:
+        return False
+    try:
+        body = exc.response.text.lower()
+    except httpx.ResponseNotRead:
+        return False
+    return "response_format" in body or "json_schema" in body
+
+
 def _extract_text_field(value: Any) -> str:
     """Normalize content fields that may be string or structured list."""
     if isinstance(value, str):
@@ -94,11 +192,14 @@ class LLMChatProvider:
         client: httpx.AsyncClient,
         url: str,
         payload: dict[str, Any],
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: httpx.Timeout | None = None,
     ) -> httpx.Response:
         """POST with exponential backoff on transient HTTP errors (429, 5xx)."""
         last_exc: httpx.HTTPStatusError | None = None
         for attempt in range(1, _MAX_HTTP_RETRIES + 1):
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, headers=headers, timeout=timeout)
             if response.status_code not in _RETRYABLE_STATUS_CODES:
                 response.raise_for_status()
                 return response
@@ -141,7 +242,12 @@ class LLMChatProvider:
         # gpt-5-mini and o-series reasoning models only accept temperature=1 (the default).
         # Always omit temperature so the API uses its default; avoids 400 on restricted models.
         if json_mode:
-            payload["response_format"] = {"type": "json_object"}
+            payload["response_format"] = _response_format(
+                self.base_url,
+                self.model,
+                kwargs.get("response_format"),
+                str(kwargs.get("response_format_name", "response")),
+            )
 
         headers = {**get_tracing_headers()}
         if self.api_key:
@@ -151,69 +257,89 @@ class LLMChatProvider:
         timeout = httpx.Timeout(request_timeout)
         invalid_json_preview: str | None = None
 
-        async with httpx.AsyncClient(timeout=timeout, headers=headers) as client:
-            for attempt in range(1, _MAX_CONTENT_RETRIES + 1):
-                response = await self._post_with_retries(client, url, payload)
-                data = response.json()
-
-                choices = data.get("choices") or []
-                content = ""
-                first_choice: dict[str, Any] = {}
-                first_message: dict[str, Any] = {}
-                if choices:
-                    first_choice = choices[0] or {}
-                    first_message = (
-                        (first_choice.get("message") or {})
-                        if isinstance(first_choice, dict)
-                        else {}
-                    )
-                    content = _extract_text_field(first_message.get("content") or "")
-
-                if content:
-                    if not json_mode or _is_valid_json_object(content):
-                        usage = data.get("usage") or {}
-                        return AIMessage(
-                            content=content,
-                            usage_metadata={
-                                "input_tokens": int(usage.get("prompt_tokens", 0)),
-                                "output_tokens": int(usage.get("completion_tokens", 0)),
-                                "total_tokens": int(usage.get("total_tokens", 0)),
-                            },
-                            response_metadata={"model": str(data.get("model", self.model))},
-                        )
-                    invalid_json_preview = content[:240]
-                    logger.warning(
-                        "LLM returned non-JSON in json_mode",
-                        attempt=attempt,
-                        max_retries=_MAX_CONTENT_RETRIES,
-                        content_preview=invalid_json_preview,
-                    )
-                else:
-                    usage = data.get("usage") if isinstance(data, dict) else {}
-                    completion_tokens = int((usage or {}).get("completion_tokens", 0))
-                    completion_details = (usage or {}).get("completion_tokens_details") or {}
-                    reasoning_tokens = int((completion_details or {}).get("reasoning_tokens", 0))
-                    logger.warning(
-                        "LLM returned empty content",
-                        attempt=attempt,
-                        max_retries=_MAX_CONTENT_RETRIES,
-                        top_level_keys=sorted(data.keys()) if isinstance(data, dict) else [],
-                        finish_reason=first_choice.get("finish_reason"),
-                        message_keys=sorted(first_message.keys()) if first_message else [],
-                        refusal_present=bool(first_message.get("refusal")),
-                        completion_tokens=completion_tokens,
-                        reasoning_tokens=reasoning_tokens,
+        client = _get_http_client()
+        for attempt in range(1, _MAX_CONTENT_RETRIES + 1):
+            try:
+                response = await self._post_with_retries(
+                    client, url, payload, headers=headers, timeout=timeout
+                )
+            except httpx.HTTPStatusError as exc:
+                if not _uses_json_schema(payload) or not _rejects_json_schema(exc):
+                    raise
+                # Endpoint rejects structured outputs: remember that and use JSON mode.
+                _JSON_SCHEMA_UNSUPPORTED.add((self.base_url, self.model))
+                logger.warning(
+                    "LLM endpoint rejected json_schema response_format; using json_object",
+                    model=self.model,
+                )
+                payload["response_format"] = {"type": "json_object"}
+                response = await self._post_with_retries(
+                    client, url, payload, headers=headers, timeout=timeout
+                )
+            data = response.json()
+
+            choices = data.get("choices") or []
+            content = ""
+            first_choice: dict[str, Any] = {}
+            first_message: dict[str, Any] = {}
+            if choices:
+                first_choice = choices[0] or {}
+                first_message = (
+                    (first_choice.get("message") or {}) if isinstance(first_choice, dict) else {}
+                )
+                content = _extract_text_field(first_message.get("content") or "")
+
+            if content:
+                if not json_mode or _is_valid_json_object(content):
+                    usage = data.get("usage") or {}
+                    usage_metadata: dict[str, Any] = {
+                        "input_tokens": int(usage.get("prompt_tokens", 0)),
+                        "output_tokens": int(usage.get("completion_tokens", 0)),
+                        "total_tokens": int(usage.get("total_tokens", 0)),
+                    }
+                    prompt_details = usage.get("prompt_tokens_details") or {}
+                    if "cached_tokens" in prompt_details:
+                        usage_metadata["input_token_details"] = {
+                            "cache_read": int(prompt_details.get("cached_tokens") or 0)
+                        }
+                    return AIMessage(
+                        content=content,
+                        usage_metadata=usage_metadata,
+                        response_metadata={"model": str(data.get("model", self.model))},
                     )
+                invalid_json_preview = content[:240]
+                logger.warning(
+                    "LLM returned non-JSON in json_mode",
+                    attempt=attempt,
+                    max_retries=_MAX_CONTENT_RETRIES,
+                    content_preview=invalid_json_preview,
+                )
+            else:
+                usage = data.get("usage") if isinstance(data, dict) else {}
+                completion_tokens = int((usage or {}).get("completion_tokens", 0))
+                completion_details = (usage or {}).get("completion_tokens_details") or {}
+                reasoning_tokens = int((completion_details or {}).get("reasoning_tokens", 0))
+                logger.warning(
+                    "LLM returned empty content",
+                    attempt=attempt,
+                    max_retries=_MAX_CONTENT_RETRIES,
+                    top_level_keys=sorted(data.keys()) if isinstance(data, dict) else [],
+                    finish_reason=first_choice.get("finish_reason"),
+                    message_keys=sorted(first_message.keys()) if first_message else [],
+                    refusal_present=bool(first_message.get("refusal")),
+                    completion_tokens=completion_tokens,
+                    reasoning_tokens=reasoning_tokens,
+                )
 
-                if attempt < _MAX_CONTENT_RETRIES:
-                    await asyncio.sleep(_RETRY_DELAY_SECONDS)
+            if attempt < _MAX_CONTENT_RETRIES:
+                await asyncio.sleep(_RETRY_DELAY_SECONDS)
 
-            if invalid_json_preview is not None:
-                raise ValueError(
-                    f"LLM non-JSON response after {_MAX_CONTENT_RETRIES} attempts in json_mode; "
-                    f"preview={invalid_json_preview!r}"
-                )
-            raise ValueError(f"LLM returned empty content after {_MAX_CONTENT_RETRIES} attempts")
+        if invalid_json_preview is not None:
+            raise ValueError(
+                f"LLM non-JSON response after {_MAX_CONTENT_RETRIES} attempts in json_mode; "
+                f"preview={invalid_json_preview!r}"
+            )
+        raise ValueError(f"LLM returned empty content after {_MAX_CONTENT_RETRIES} attempts")
 
 
 def get_chat_model(settings: Settings | None = None) -> LLMChatProvider:
@@ -30,6 +30,7 @@ from app.core.database import get_engine, get_session_factory, reset_engine
 from app.core.errors import OpsAgentError, get_status_code
 from app.core.logging import setup_logging
 from app.core.tracing import clear_tracing_context, set_request_id, set_trace_parent
+from app.llm.provider import close_chat_http_client
 
 logger = structlog.get_logger(__name__)
 
@@ -90,6 +91,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
 
     await tm_client.close()
     await close_async_http_client()
+    await close_chat_http_client()
     await reset_engine()
 
     logger.info("Card Fraud Ops Analyst Agent stopped")
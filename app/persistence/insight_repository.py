@@ -101,6 +101,38 @@ class InsightRepository:
         )
         return row_to_dict(result.fetchone())
 
+    async def add_evidence_batch(
+        self,
+        insight_id: str,
+        items: list[tuple[str, dict[str, Any]]],
+    ) -> int:
+        """Add (evidence_kind, evidence_payload) items to an insight in one round trip.
+
+        Returns the number of rows written.
+        """
+        if not items:
+            return 0
+
+        now = utc_now()
+        query = text("""
+            INSERT INTO fraud_gov.ops_agent_evidence
+                (evidence_id, insight_id, evidence_kind, evidence_payload, created_at)
+            VALUES
+                (:evidence_id, :insight_id, :evidence_kind, :evidence_payload, :created_at)
+        """)
+        params = [
+            {
+                "evidence_id": str(uuid.uuid7()),
+                "insight_id": insight_id,
+                "evidence_kind": evidence_kind,
+                "evidence_payload": json.dumps(evidence_payload),
+                "created_at": now,
+            }
+            for evidence_kind, evidence_payload in items
+        ]
+        await self.session.execute(query, params)
+        return len(params)
+
     async def get_insights_for_transaction(self, transaction_id: str) -> list[dict[str, Any]]:
         """Get all insights for a transaction."""
         query = text("""
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import time
+from collections.abc import Mapping
 from dataclasses import asdict, is_dataclass
 from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,9 +17,15 @@ from app.core.metrics import ops_agent_state_store_latency_seconds
 
 
 def _json_default(value: Any) -> Any:
-    """Serialize dataclasses and datetime/UUID values for JSONB persistence."""
+    """Serialize dataclasses and datetime/UUID values for JSONB persistence.
+
+    orjson handles these types natively; this remains the fallback for anything
+    it does not (and keeps the error message for unsupported types).
+    """
     if is_dataclass(value):
         return asdict(value)
+    if isinstance(value, Mapping):
+        return dict(value)
     if isinstance(value, (datetime, date)):
         return value.isoformat()
     if isinstance(value, UUID):
@@ -35,7 +42,7 @@ class PostgresStateStore:
     async def save_state(
         self,
         investigation_id: str,
-        state: dict[str, Any],
+        state: Mapping[str, Any],
     ) -> int:
         """Upsert investigation state. Returns new version number."""
         start_time = time.perf_counter()
@@ -55,7 +62,9 @@ class PostgresStateStore:
                 query,
                 {
                     "id": investigation_id,
-                    "state": json.dumps(state, default=_json_default),
+                    "state": orjson.dumps(
+                        state, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+                    ).decode(),
                 },
             )
             row = result.fetchone()
@@ -82,7 +91,7 @@ class PostgresStateStore:
                 return None
             state = row[0]
             if isinstance(state, str):
-                return json.loads(state)
+                return orjson.loads(state)
             return state
         finally:
             elapsed = time.perf_counter() - start_time
@@ -88,6 +88,50 @@ class ToolLogRepository:
         row = result.fetchone()
         return self._normalize_execution_row(row_to_dict(row)) if row else {}
 
+    async def log_executions(
+        self,
+        *,
+        investigation_id: str,
+        executions: list[dict[str, Any]],
+    ) -> int:
+        """Insert all tool execution records for an investigation in one round trip.
+
+        Step numbers follow list order (1-based). Returns the number of rows written.
+        """
+        if not executions:
+            return 0
+
+        now = utc_now()
+        params = [
+            {
+                "log_id": str(uuid.uuid7()),
+                "investigation_id": investigation_id,
+                "tool_name": execution.get("tool_name", "unknown"),
+                "step_number": step_number,
+                "input_summary": json.dumps(execution.get("input_summary", {})),
+                "output_summary": json.dumps(execution.get("output_summary", {})),
+                "execution_time_ms": execution.get("execution_time_ms", 0),
+                "status": execution.get("status", "SUCCESS"),
+                "error_message": execution.get("error_message"),
+                "created_at": now,
+            }
+            for step_number, execution in enumerate(executions, start=1)
+        ]
+        await self._session.execute(
+            text("""
+                INSERT INTO fraud_gov.ops_agent_tool_execution_log
+                    (log_id, investigation_id, tool_name, step_number,
+                     input_summary, output_summary, execution_time_ms,
+                     status, error_message, created_at)
+                VALUES
+                    (:log_id, :investigation_id, :tool_name, :step_number,
+                     :input_summary, :output_summary,
+                     :execution_time_ms, :status, :error_message, :created_at)
+            """),
+            params,
+        )
+        return len(params)
+
     async def get_executions(self, investigation_id: str) -> list[dict[str, Any]]:
         """Return all tool executions for an investigation, ordered by step."""
         result = await self._session.execute(
@@ -17,7 +17,7 @@ from app.agent.state import create_initial_state
 from app.clients.tm_client import TMClient
 from app.core.config import get_settings
 from app.core.errors import ConflictError, NotFoundError
-from app.core.tracing import get_current_trace_id
+from app.core.tracing import get_current_trace_id, investigation_span_attributes
 from app.llm.provider import get_chat_model
 from app.persistence.audit_repository import AuditRepository
 from app.persistence.insight_repository import InsightRepository
@@ -105,6 +105,7 @@ class InvestigationService:
             max_steps=self._settings.langgraph.max_steps,
             feature_flags={
                 "planner_llm_enabled": self._settings.planner.llm_enabled,
+                "planner_fast_path_enabled": self._settings.planner.fast_path_enabled,
                 "reasoning_llm_enabled": self._settings.features.enable_llm_reasoning,
                 "vector_search_enabled": self._settings.vector_search.enabled,
             },
@@ -149,20 +150,21 @@ class InvestigationService:
         try:
             async with asyncio.timeout(self._settings.langgraph.investigation_timeout_seconds):
                 with tracer.start_as_current_span("investigation.run") as span:
-                    span.set_attribute("investigation_id", investigation_id)
-                    span.set_attribute("transaction_id", transaction_id)
-                    span.set_attribute("mode", mode)
-                    span.set_attribute("model_mode", "agentic")
+                    run_attributes: dict[str, Any] = {
+                        "investigation_id": investigation_id,
+                        "transaction_id": transaction_id,
+                        "mode": mode,
+                        "model_mode": "agentic",
+                    }
                     if case_id:
-                        span.set_attribute("case_id", case_id)
+                        run_attributes["case_id"] = case_id
                     if scenario_name:
-                        span.set_attribute("scenario_name", scenario_name)
+                        run_attributes["scenario_name"] = scenario_name
                     if trace_id:
-                        span.set_attribute("trace_id", trace_id)
+                        run_attributes["trace_id"] = trace_id
+                    span.set_attributes(run_attributes)
                     result = await graph.ainvoke(initial_state)
-                    span.set_attribute("status", result.get("status", "COMPLETED"))
-                    span.set_attribute("severity", result.get("severity", "LOW"))
-                    span.set_attribute("step_count", result.get("step_count", 0))
+                    span.set_attributes(self._result_span_attributes(result))
                     if trace_id and not result.get("trace_id"):
                         result = {**result, "trace_id": trace_id}
         except TimeoutError:
@@ -291,23 +293,16 @@ class InvestigationService:
         try:
             async with asyncio.timeout(self._settings.langgraph.investigation_timeout_seconds):
                 with tracer.start_as_current_span("investigation.resume") as span:
-                    span.set_attribute("investigation_id", investigation_id)
-                    if state.get("transaction_id"):
-                        span.set_attribute("transaction_id", state["transaction_id"])
-                    span.set_attribute("model_mode", "agentic")
-                    if state.get("case_id"):
-                        span.set_attribute("case_id", state["case_id"])
-                    if state.get("scenario_name"):
-                        span.set_attribute("scenario_name", state["scenario_name"])
+                    resume_attributes = investigation_span_attributes(state, model_mode="agentic")
+                    resume_attributes["investigation_id"] = investigation_id
                     trace_id = get_current_trace_id()
                     if trace_id:
-                        span.set_attribute("trace_id", trace_id)
+                        resume_attributes["trace_id"] = trace_id
                         if not state.get("trace_id"):
                             state["trace_id"] = trace_id
+                    span.set_attributes(resume_attributes)
                     result = await graph.ainvoke(state)
-                    span.set_attribute("status", result.get("status", "COMPLETED"))
-                    span.set_attribute("severity", result.get("severity", "LOW"))
-                    span.set_attribute("step_count", result.get("step_count", 0))
+                    span.set_attributes(self._result_span_attributes(result))
                     if trace_id and not result.get("trace_id"):
                         result = {**result, "trace_id": trace_id}
         except TimeoutError:
@@ -396,25 +391,18 @@ class InvestigationService:
         transaction_id = state.get("transaction_id", "")
 
         tool_executions = state.get("tool_executions", [])
-        for idx, exec_record in enumerate(tool_executions):
-            try:
-                await self._tool_log_repo.log_execution(
-                    investigation_id=investigation_id,
-                    tool_name=exec_record.get("tool_name", "unknown"),
-                    step_number=idx + 1,
-                    input_summary=exec_record.get("input_summary", {}),
-                    output_summary=exec_record.get("output_summary", {}),
-                    execution_time_ms=exec_record.get("execution_time_ms", 0),
-                    status=exec_record.get("status", "SUCCESS"),
-                    error_message=exec_record.get("error_message"),
-                )
-            except Exception as exc:
-                logger.warning(
-                    "Failed to persist tool execution log",
-                    investigation_id=investigation_id,
-                    tool_name=exec_record.get("tool_name"),
-                    error=str(exc),
-                )
+        try:
+            await self._tool_log_repo.log_executions(
+                investigation_id=investigation_id,
+                executions=tool_executions,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to persist tool execution logs",
+                investigation_id=investigation_id,
+                tool_count=len(tool_executions),
+                error=str(exc),
+            )
 
         reasoning = state.get("reasoning", {})
         evidence = state.get("evidence", [])
@@ -445,20 +433,25 @@ class InvestigationService:
                 )
 
                 insight_id = insight.get("insight_id", "")
+                evidence_items: list[tuple[str, dict[str, Any]]] = []
                 for ev in evidence:
                     try:
-                        evidence_kind, evidence_payload = self._normalize_evidence_item(ev)
-                        await self._insight_repo.add_evidence(
-                            insight_id=insight_id,
-                            evidence_kind=evidence_kind,
-                            evidence_payload=evidence_payload,
-                        )
+                        evidence_items.append(self._normalize_evidence_item(ev))
                     except Exception as exc:
                         logger.warning(
-                            "Failed to add evidence to insight",
+                            "Failed to normalize evidence item",
                             insight_id=insight_id,
                             error=str(exc),
                         )
+                try:
+                    await self._insight_repo.add_evidence_batch(insight_id, evidence_items)
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to add evidence to insight",
+                        insight_id=insight_id,
+                        evidence_count=len(evidence_items),
+                        error=str(exc),
+                    )
             except Exception as exc:
                 logger.warning(
                     "Failed to persist insight",
@@ -532,6 +525,15 @@ class InvestigationService:
                     error=str(exc),
                 )
 
+    @staticmethod
+    def _result_span_attributes(result: dict[str, Any]) -> dict[str, Any]:
+        """Outcome attributes recorded on the run/resume span after the graph finishes."""
+        return {
+            "status": result.get("status", "COMPLETED"),
+            "severity": result.get("severity", "LOW"),
+            "step_count": result.get("step_count", 0),
+        }
+
     @staticmethod
     def _build_insight_summary(reasoning: Any, evidence: list[Any]) -> str:
         """Build stable summary text from current agentic reasoning/evidence shapes."""
@@ -670,6 +672,7 @@ class InvestigationService:
         registry.register(ReasoningTool(llm=llm, settings=self._settings))
         registry.register(RecommendationTool())
         registry.register(RuleDraftTool())
+        registry.freeze()
 
         return build_investigation_graph(
             registry=registry,
@@ -5,10 +5,11 @@ This module contains ZERO database access. Pure functions operating on in-memory
 
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionContext:
     """Immutable transaction context."""
 
@@ -26,7 +27,7 @@ class TransactionContext:
     fraud_score: float | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WindowStats:
     """Immutable window statistics."""
 
@@ -38,7 +39,7 @@ class WindowStats:
     unique_cards: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Signal:
     """Immutable signal extracted from context."""
 
@@ -63,28 +64,48 @@ def _coerce_datetime(value: Any) -> datetime | None:
         return value.astimezone(UTC)
 
     if isinstance(value, str):
-        try:
-            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except ValueError:
-            return None
-        if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=UTC)
-        return parsed.astimezone(UTC)
+        return _parse_iso_datetime(value)
 
     return None
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime | None:
+    """Parse an ISO-8601 string into a UTC-aware datetime (None if invalid).
+
+    Memoized: every history row's timestamp is re-read for each window and feature.
+    """
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+def _empty_window_stats(window_hours: int) -> WindowStats:
+    return WindowStats(
+        window_hours=window_hours,
+        transaction_count=0,
+        total_amount=0.0,
+        decline_count=0,
+        unique_merchants=0,
+        unique_cards=0,
+    )
+
+
+_CONTEXT_WINDOW_HOURS: tuple[int, ...] = (1, 6, 24, 72)
+# WindowStats is frozen, so the empty stats for the standard windows are shared.
+_EMPTY_WINDOW_STATS: dict[int, WindowStats] = {
+    hours: _empty_window_stats(hours) for hours in _CONTEXT_WINDOW_HOURS
+}
+
+
 def compute_window_stats(transactions: list[dict[str, Any]], window_hours: int) -> WindowStats:
     """Compute statistics for a time window."""
     if not transactions:
-        return WindowStats(
-            window_hours=window_hours,
-            transaction_count=0,
-            total_amount=0.0,
-            decline_count=0,
-            unique_merchants=0,
-            unique_cards=0,
-        )
+        return _EMPTY_WINDOW_STATS.get(window_hours) or _empty_window_stats(window_hours)
 
     total_amount = sum(float(t.get("amount", 0) or 0) for t in transactions)
     decline_count = sum(1 for t in transactions if _is_decline_status(t.get("status")))
@@ -125,7 +146,7 @@ def compute_all_windows(
 
     unique_transactions = list(deduped.values())
     windows = {}
-    for hours in [1, 6, 24, 72]:
+    for hours in _CONTEXT_WINDOW_HOURS:
         window_txns = []
         cutoff = anchor - timedelta(hours=hours)
         for t in unique_transactions:
@@ -3,15 +3,18 @@
 This module contains ZERO database access. Pure functions operating on in-memory data structures.
 """
 
+import heapq
 import math
+from collections.abc import Collection
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from app.utils.constants import RISK_MERCHANT_CATEGORIES
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PatternScore:
     """Immutable pattern score."""
 
@@ -22,12 +25,19 @@ class PatternScore:
 
 
 ROUND_NUMBER_THRESHOLDS: list[int] = [100, 200, 300, 400, 500, 750, 1000, 1500, 2000, 5000, 10000]
+_ROUND_NUMBER_SET: frozenset[int] = frozenset(ROUND_NUMBER_THRESHOLDS)
 
 
-def _is_round_number(amount: float, thresholds: list[int] | None = None) -> bool:
+@lru_cache(maxsize=8)
+def _round_number_set(thresholds: tuple[int, ...]) -> frozenset[int]:
+    """Return configured round-number thresholds as a set, built once per distinct config."""
+    return frozenset(thresholds)
+
+
+def _is_round_number(amount: float, thresholds: Collection[int] | None = None) -> bool:
     """Check if amount is a round number that may indicate fraud."""
     if thresholds is None:
-        thresholds = ROUND_NUMBER_THRESHOLDS
+        thresholds = _ROUND_NUMBER_SET
 
     if amount <= 0:
         return False
@@ -45,26 +55,43 @@ def _is_round_number(amount: float, thresholds: list[int] | None = None) -> bool
     return False
 
 
-def _calculate_mean(values: list[float]) -> float:
-    """Calculate mean of a list of values."""
-    if not values:
-        return 0.0
-    return sum(values) / len(values)
+def _tx_field(transaction: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a transaction dict or model object."""
+    if isinstance(transaction, dict):
+        return transaction.get(name, default)
+    return getattr(transaction, name, default)
+
 
+def _history_amount_stats(card_history: list[dict[str, Any]]) -> tuple[float, float]:
+    """Return (mean, population std dev) of parseable history amounts in one Welford pass.
 
-def _calculate_std_dev(values: list[float], mean: float) -> float:
-    """Calculate standard deviation."""
-    if len(values) < 2:
-        return 0.0
-    variance = sum((x - mean) ** 2 for x in values) / len(values)
-    return math.sqrt(variance)
+    Fewer than two amounts have no spread and yield a std dev of 0.0.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for txn in card_history:
+        txn_amount = txn.get("amount")
+        if txn_amount is None:
+            continue
+        try:
+            x = float(txn_amount)
+        except TypeError, ValueError:
+            continue
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += (x - mean) * delta
+    if count < 2:
+        return mean, 0.0
+    return mean, math.sqrt(m2 / count)
 
 
 def score_amount_anomalies(
     transaction: Any,
     card_history: list[dict[str, Any]],
     window_stats: dict[int, Any],
-    round_thresholds: list[int] | None = None,
+    round_thresholds: Collection[int] | None = None,
     high_threshold: float = 1000.0,
     elevated_threshold: float = 500.0,
     zscore_outlier: float = 3.0,
@@ -89,12 +116,7 @@ def score_amount_anomalies(
             details={},
         )
 
-    if hasattr(transaction, "amount"):
-        amount = float(transaction.amount)
-    elif isinstance(transaction, dict):
-        amount = float(transaction.get("amount", 0))
-    else:
-        amount = 0.0
+    amount = float(_tx_field(transaction, "amount", 0))
 
     if amount > 0:
         if _is_round_number(amount, round_thresholds):
@@ -109,20 +131,10 @@ def score_amount_anomalies(
             score = max(score, 0.5)
             details["elevated_amount"] = amount
 
-    historical_amounts = []
-    for txn in card_history:
-        txn_amount = txn.get("amount")
-        if txn_amount is not None:
-            try:
-                historical_amounts.append(float(txn_amount))
-            except TypeError, ValueError:
-                pass
-
-    if historical_amounts:
-        mean = _calculate_mean(historical_amounts)
-        std_dev = _calculate_std_dev(historical_amounts, mean)
-
-        if mean > 0 and std_dev > 0 and amount > 0:
+    # History only matters for the z-score of a positive amount; skip the scan otherwise.
+    if amount > 0:
+        mean, std_dev = _history_amount_stats(card_history)
+        if mean > 0 and std_dev > 0:
             z_score = (amount - mean) / std_dev
             if z_score > zscore_outlier:
                 score = max(score, 0.9)
@@ -155,7 +167,19 @@ def score_amount_anomalies(
     )
 
 
-HIGH_RISK_HOURS = (0, 1, 2, 3, 4, 5)
+HIGH_RISK_HOURS: frozenset[int] = frozenset({0, 1, 2, 3, 4, 5})
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime | None:
+    """Parse an ISO-8601 string, keeping its own offset (None if invalid).
+
+    Memoized: the same history timestamps are read by several scorers per run.
+    """
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
 
 
 def _get_hour_from_timestamp(ts: Any) -> int | None:
@@ -167,34 +191,38 @@ def _get_hour_from_timestamp(ts: Any) -> int | None:
         return ts.hour
 
     if isinstance(ts, str):
-        try:
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        dt = _parse_timestamp(ts)
+        if dt is not None:
             return dt.hour
-        except ValueError, AttributeError:
-            pass
 
     return None
 
 
-def _is_unusual_hour(hour: int, unusual_hours: list[int] | None = None) -> bool:
+def _is_unusual_hour(hour: int, unusual_hours: Collection[int] | None = None) -> bool:
     """Check if hour is unusual (late night/early morning)."""
     if unusual_hours is None:
-        unusual_hours = [0, 1, 2, 3, 4, 5]
+        unusual_hours = HIGH_RISK_HOURS
     return hour in unusual_hours
 
 
+def _build_mcc_risk() -> dict[str, str]:
+    # First listed category wins if an MCC ever appears in more than one.
+    mcc_risk: dict[str, str] = {}
+    for category, mccs in RISK_MERCHANT_CATEGORIES.items():
+        for mcc in mccs:
+            mcc_risk.setdefault(mcc, category)
+    return mcc_risk
+
+
+_MCC_RISK: dict[str, str] = _build_mcc_risk()
+
+
 def _get_merchant_category_risk(mcc: str | None) -> str:
     """Get risk level for merchant category code."""
     if mcc is None:
         return "low"
 
-    mcc_str = str(mcc).zfill(4)
-
-    for category, mccs in RISK_MERCHANT_CATEGORIES.items():
-        if mcc_str in mccs:
-            return category
-
-    return "low"
+    return _MCC_RISK.get(str(mcc).zfill(4), "low")
 
 
 def score_card_testing(
@@ -224,37 +252,24 @@ def score_card_testing(
             details={},
         )
 
-    current_amount = 0.0
-    if hasattr(transaction, "amount"):
-        current_amount = float(getattr(transaction, "amount", 0))
-    elif isinstance(transaction, dict):
-        current_amount = float(transaction.get("amount", 0))
-
-    current_timestamp = None
-    if hasattr(transaction, "transaction_timestamp"):
-        current_timestamp = getattr(transaction, "transaction_timestamp", None)
-    elif isinstance(transaction, dict):
-        ts = transaction.get("transaction_timestamp")
-        if isinstance(ts, str):
-            try:
-                current_timestamp = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            except ValueError:
-                pass
-        else:
-            current_timestamp = ts
+    current_amount = float(_tx_field(transaction, "amount", 0))
 
-    sorted_history = sorted(
-        card_history, key=lambda x: x.get("transaction_timestamp", ""), reverse=True
+    current_timestamp = _tx_field(transaction, "transaction_timestamp")
+    if isinstance(current_timestamp, str):
+        current_timestamp = _parse_timestamp(current_timestamp)
+
+    # Ten most recent rows, in the same order a full descending sort would give.
+    latest_history = heapq.nlargest(
+        10, card_history, key=lambda x: x.get("transaction_timestamp") or ""
     )
 
     recent_txns_with_ts: list[tuple[datetime, dict[str, Any]]] = []
-    for txn in sorted_history[:10]:
+    for txn in latest_history:
         txn_ts = txn.get("transaction_timestamp")
         if txn_ts:
             if isinstance(txn_ts, str):
-                try:
-                    txn_dt = datetime.fromisoformat(txn_ts.replace("Z", "+00:00"))
-                except ValueError:
+                txn_dt = _parse_timestamp(txn_ts)
+                if txn_dt is None:
                     continue
             else:
                 txn_dt = txn_ts
@@ -268,10 +283,33 @@ def score_card_testing(
     recent_txns_with_ts.sort(key=lambda item: item[0])
     recent_txns = [txn for _, txn in recent_txns_with_ts]
 
+    # One pass over the recent rows feeds the ladder, decline, merchant and small-amount checks.
+    amounts: list[float] = []
+    small_count = 0
+    decline_count = 0
+    merchant_ids = set()
+    for txn in recent_txns:
+        txn_amount = txn.get("amount")
+        if txn_amount is None:
+            small_count += 1
+        else:
+            # A malformed amount only drops this row from the amount-based checks.
+            try:
+                amount_value = float(txn_amount)
+            except TypeError, ValueError:
+                pass
+            else:
+                amounts.append(amount_value)
+                if amount_value < 10:
+                    small_count += 1
+        status = txn.get("status") or txn.get("decision")
+        if status and str(status).upper() == "DECLINE":
+            decline_count += 1
+        m_id = txn.get("merchant_id")
+        if m_id:
+            merchant_ids.add(m_id)
+
     if len(recent_txns) >= 3:
-        amounts = [
-            float(txn.get("amount", 0)) for txn in recent_txns if txn.get("amount") is not None
-        ]
         amounts.append(current_amount)
 
         if len(amounts) >= 3:
@@ -283,12 +321,6 @@ def score_card_testing(
                 details["sequence_length"] = len(amounts)
                 details["amount_range"] = f"{amounts[0]:.2f} - {amounts[-1]:.2f}"
 
-    decline_count = 0
-    for txn in recent_txns:
-        status = txn.get("status") or txn.get("decision")
-        if status and str(status).upper() == "DECLINE":
-            decline_count += 1
-
     if len(recent_txns) >= 2:
         decline_rate = decline_count / len(recent_txns)
         if decline_rate >= 0.5:
@@ -297,20 +329,9 @@ def score_card_testing(
             details["decline_rate"] = round(decline_rate, 2)
             details["recent_decline_count"] = decline_count
 
-    merchant_ids = set()
-    for txn in recent_txns:
-        m_id = txn.get("merchant_id")
-        if m_id:
-            merchant_ids.add(m_id)
-
-    if hasattr(transaction, "merchant_id"):
-        m_id = getattr(transaction, "merchant_id", None)
-        if m_id:
-            merchant_ids.add(m_id)
-    elif isinstance(transaction, dict):
-        m_id = transaction.get("merchant_id")
-        if m_id:
-            merchant_ids.add(m_id)
+    m_id = _tx_field(transaction, "merchant_id")
+    if m_id:
+        merchant_ids.add(m_id)
 
     if len(merchant_ids) >= 3:
         score = max(score, 0.6)
@@ -318,7 +339,6 @@ def score_card_testing(
         details["unique_merchants"] = len(merchant_ids)
 
     if current_amount > 0 and current_amount < 10:
-        small_count = sum(1 for txn in recent_txns if float(txn.get("amount", 0)) < 10)
         if small_count >= 2:
             score = max(score, 0.7)
             details["small_amount_sequence"] = True
@@ -336,7 +356,7 @@ def score_time_anomalies(
     transaction: Any,
     card_history: list[dict[str, Any]],
     transaction_context: dict[str, Any] | None = None,
-    unusual_hours: list[int] | None = None,
+    unusual_hours: Collection[int] | None = None,
 ) -> PatternScore:
     """Score time-based anomalies.
 
@@ -346,7 +366,7 @@ def score_time_anomalies(
     - First transaction at unusual hour for cardholder
     """
     if unusual_hours is None:
-        unusual_hours = [0, 1, 2, 3, 4, 5]
+        unusual_hours = HIGH_RISK_HOURS
 
     score = 0.0
     weight = 0.25
@@ -360,14 +380,7 @@ def score_time_anomalies(
             details={},
         )
 
-    if hasattr(transaction, "transaction_timestamp"):
-        tx_timestamp = transaction.transaction_timestamp
-    elif isinstance(transaction, dict):
-        tx_timestamp = transaction.get("transaction_timestamp")
-    else:
-        tx_timestamp = None
-
-    hour = _get_hour_from_timestamp(tx_timestamp)
+    hour = _get_hour_from_timestamp(_tx_field(transaction, "transaction_timestamp"))
 
     if hour is not None:
         if _is_unusual_hour(hour, unusual_hours):
@@ -375,11 +388,9 @@ def score_time_anomalies(
             details["unusual_hour"] = hour
             details["hour_category"] = "late_night"
 
-        mcc = None
-        if hasattr(transaction, "merchant_category"):
-            mcc = getattr(transaction, "merchant_category", None)
-        elif isinstance(transaction, dict):
-            mcc = transaction.get("merchant_category") or transaction.get("merchant_category_code")
+        mcc = _tx_field(transaction, "merchant_category") or _tx_field(
+            transaction, "merchant_category_code"
+        )
 
         merchant_risk = _get_merchant_category_risk(mcc)
         details["merchant_category"] = str(mcc) if mcc else "unknown"
@@ -401,21 +412,22 @@ def score_time_anomalies(
         details["ip_country"] = ip_country
         details["card_country"] = card_country
 
-    historical_hours = []
-    for txn in card_history:
-        txn_ts = txn.get("transaction_timestamp") if isinstance(txn, dict) else None
-        if txn_ts:
-            h = _get_hour_from_timestamp(txn_ts)
-            if h is not None:
-                historical_hours.append(h)
-
-    if historical_hours and hour is not None:
-        usual_hours = set(historical_hours)
-        if hour not in usual_hours:
-            if len(historical_hours) >= 5:
-                score = max(score, 0.6)
-                details["unusual_hour_for_cardholder"] = True
-                details["usual_hours"] = sorted(list(usual_hours))
+    # The cardholder's usual hours as a 24-bit mask; only needed when the current hour is known.
+    if hour is not None:
+        usual_hours_mask = 0
+        historical_hour_count = 0
+        for txn in card_history:
+            txn_ts = txn.get("transaction_timestamp") if isinstance(txn, dict) else None
+            if txn_ts:
+                h = _get_hour_from_timestamp(txn_ts)
+                if h is not None:
+                    usual_hours_mask |= 1 << h
+                    historical_hour_count += 1
+
+        if historical_hour_count >= 5 and not (usual_hours_mask >> hour) & 1:
+            score = max(score, 0.6)
+            details["unusual_hour_for_cardholder"] = True
+            details["usual_hours"] = [h for h in range(24) if (usual_hours_mask >> h) & 1]
 
     return PatternScore(
         pattern_name="time_anomaly",
@@ -558,7 +570,12 @@ def run_pattern_scoring(
     card_history = context.get("card_history", [])
     transaction_context = context.get("transaction_context", {})
 
-    round_thresholds = thresholds.get("round_number_thresholds", ROUND_NUMBER_THRESHOLDS)
+    configured_round_thresholds = thresholds.get("round_number_thresholds")
+    round_thresholds = (
+        _round_number_set(tuple(configured_round_thresholds))
+        if configured_round_thresholds is not None
+        else _ROUND_NUMBER_SET
+    )
 
     scores = [
         score_amount_anomalies(
@@ -575,7 +592,7 @@ def run_pattern_scoring(
             transaction,
             card_history,
             transaction_context,
-            thresholds.get("time_unusual_hours", [0, 1, 2, 3, 4, 5]),
+            thresholds.get("time_unusual_hours", HIGH_RISK_HOURS),
         ),
         score_velocity_patterns(
             window_stats,
@@ -601,21 +618,40 @@ def run_pattern_scoring(
     return scores
 
 
+_NETWORK_SIGNAL_NAMES: frozenset[str] = frozenset(
+    {"velocity", "decline_anomaly", "cross_merchant", "card_testing"}
+)
+
+
 def compute_severity(pattern_scores: list[PatternScore]) -> str:
     """Compute overall severity from pattern scores."""
     if not pattern_scores:
         return "LOW"
 
-    score_by_name = {s.pattern_name: float(s.score) for s in pattern_scores}
-    network_signal_names = ("velocity", "decline_anomaly", "cross_merchant", "card_testing")
-    network_scores = [score_by_name.get(name, 0.0) for name in network_signal_names]
-    network_medium_count = sum(1 for value in network_scores if value >= 0.5)
-    network_strong_count = sum(1 for value in network_scores if value >= 0.7)
-
-    weighted_sum = sum(s.score * s.weight for s in pattern_scores)
-    total_weight = sum(s.weight for s in pattern_scores)
-    max_score = max((s.score for s in pattern_scores), default=0.0)
-    medium_signal_count = sum(1 for s in pattern_scores if s.score >= 0.5)
+    weighted_sum = 0.0
+    total_weight = 0.0
+    max_score = float("-inf")
+    medium_signal_count = 0
+    # Last score per network signal name, matching a name -> score mapping.
+    network_score_by_name: dict[str, float] = {}
+    for s in pattern_scores:
+        score = s.score
+        weighted_sum += score * s.weight
+        total_weight += s.weight
+        if score > max_score:
+            max_score = score
+        if score >= 0.5:
+            medium_signal_count += 1
+        if s.pattern_name in _NETWORK_SIGNAL_NAMES:
+            network_score_by_name[s.pattern_name] = float(score)
+
+    network_medium_count = 0
+    network_strong_count = 0
+    for value in network_score_by_name.values():
+        if value >= 0.5:
+            network_medium_count += 1
+            if value >= 0.7:
+                network_strong_count += 1
 
     if total_weight > 0:
         normalized_score = weighted_sum / total_weight
@@ -647,7 +683,7 @@ def compute_severity(pattern_scores: list[PatternScore]) -> str:
     return "LOW"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeatureAttribution:
     """Attribution for a single feature's contribution to the risk score."""
 
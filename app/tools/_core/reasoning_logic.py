@@ -229,6 +229,30 @@ def _resolve_field(
     return default
 
 
+# (feature key, compact prompt label) pairs rendered into the context_features section.
+_FEATURE_LABELS: tuple[tuple[str, str], ...] = (
+    ("transaction_id", "txn_id"),
+    ("amount", "amt"),
+    ("currency", "curr"),
+    ("decision", "decision"),
+    ("mcc", "mcc"),
+    ("timestamp", "ts"),
+    ("card_id", "card"),
+    ("merchant_id", "mcht"),
+    ("txn_count_5m", "cnt_5m"),
+    ("txn_count_1h", "cnt_1h"),
+    ("txn_count_24h", "cnt_24h"),
+    ("decline_rate_1h", "decl_1h%"),
+    ("avg_amount_30d", "avg_30d"),
+    ("amount_zscore", "zscore"),
+    ("distinct_merchants_1h", "uniq_mcht_1h"),
+    ("distinct_cards_1h", "uniq_card_1h"),
+    ("ip_address", "ip"),
+    ("ip_country_alpha3", "ip_ctry"),
+    ("device_id", "dev_id"),
+)
+
+
 def assemble_prompt_payload(
     context: dict[str, Any],
     pattern_analysis: dict[str, Any],
@@ -381,31 +405,14 @@ def assemble_prompt_payload(
     features = context.get("features", {})
     features_text = "None available"
     if features:
-        feature_lines = []
-        for key, value in [
-            ("transaction_id", "txn_id"),
-            ("amount", "amt"),
-            ("currency", "curr"),
-            ("decision", "decision"),
-            ("mcc", "mcc"),
-            ("timestamp", "ts"),
-            ("card_id", "card"),
-            ("merchant_id", "mcht"),
-            ("txn_count_5m", "cnt_5m"),
-            ("txn_count_1h", "cnt_1h"),
-            ("txn_count_24h", "cnt_24h"),
-            ("decline_rate_1h", "decl_1h%"),
-            ("avg_amount_30d", "avg_30d"),
-            ("amount_zscore", "zscore"),
-            ("distinct_merchants_1h", "uniq_mcht_1h"),
-            ("distinct_cards_1h", "uniq_card_1h"),
-            ("ip_address", "ip"),
-            ("ip_country_alpha3", "ip_ctry"),
-            ("device_id", "dev_id"),
-        ]:
-            if features.get(key) is not None:
-                feature_lines.append(f"  - {value}: {features[key]}")
-        features_text = "\n".join(feature_lines) if feature_lines else "No features computed"
+        features_text = (
+            "\n".join(
+                f"  - {label}: {features[key]}"
+                for key, label in _FEATURE_LABELS
+                if features.get(key) is not None
+            )
+            or "No features computed"
+        )
 
     link_analysis_payload: dict[str, Any] = {}
     if isinstance(link_analysis, dict) and link_analysis:
@@ -494,7 +501,8 @@ def validate_llm_output(parsed: dict[str, Any]) -> tuple[dict[str, Any], list[st
 
     risk_level = parsed.get("risk_level", "MEDIUM")
     if isinstance(risk_level, str):
-        risk_upper = risk_level.upper().strip()
+        # Structured output usually returns a canonical level; normalize only otherwise.
+        risk_upper = risk_level if risk_level in VALID_RISK_LEVELS else risk_level.upper().strip()
         if risk_upper not in VALID_RISK_LEVELS:
             sanitized["risk_level"] = "MEDIUM"
             warnings.append(f"risk_level '{risk_level}' normalized to MEDIUM")
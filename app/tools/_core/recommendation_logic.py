@@ -6,10 +6,11 @@ This module contains ZERO database access. Pure functions operating on in-memory
 from dataclasses import dataclass
 from typing import Any
 
+from app.utils.constants import SEVERITY_RANK
 from app.utils.data_access import as_dict, get_attr
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecommendationCandidate:
     """Immutable recommendation candidate."""
 
@@ -20,27 +21,25 @@ class RecommendationCandidate:
     signature_hash: str
 
 
-def _pattern_value(pattern: Any, name: str, default: float = 0.0) -> float:
-    if get_attr(pattern, "pattern_name") != name:
-        return default
-    return float(get_attr(pattern, "score", default))
-
-
-def _pattern_scores(pattern_scores: list[Any], name: str) -> float:
-    for pattern in pattern_scores:
-        score = _pattern_value(pattern, name, default=-1.0)
-        if score >= 0.0:
-            return score
-    return 0.0
-
+def _index_patterns(
+    pattern_scores: list[Any],
+) -> tuple[dict[str, float], dict[str, dict[str, Any]]]:
+    """Index pattern scores and details by pattern name in a single pass.
 
-def _pattern_details(pattern_scores: list[Any], name: str) -> dict[str, Any]:
+    The first entry for a name wins (for scores, the first non-negative one).
+    """
+    scores: dict[str, float] = {}
+    details: dict[str, dict[str, Any]] = {}
     for pattern in pattern_scores:
-        if get_attr(pattern, "pattern_name") != name:
-            continue
-        details = get_attr(pattern, "details", {})
-        return details if isinstance(details, dict) else {}
-    return {}
+        name = get_attr(pattern, "pattern_name")
+        if name not in details:
+            pattern_details = get_attr(pattern, "details", {})
+            details[name] = pattern_details if isinstance(pattern_details, dict) else {}
+        if name not in scores:
+            score = float(get_attr(pattern, "score", -1.0))
+            if score >= 0.0:
+                scores[name] = score
+    return scores, details
 
 
 def _similarity_overall(similarity_result: Any) -> float:
@@ -70,12 +69,13 @@ def generate_recommendations(
     merchant_id = get_attr(transaction, "merchant_id", "unknown") if transaction else "unknown"
 
     v24h = as_dict(velocity).get("velocity_24h", "unknown")
-    amount_details = _pattern_details(pattern_scores, "amount_anomaly")
-    time_details = _pattern_details(pattern_scores, "time_anomaly")
-    cross_details = _pattern_details(pattern_scores, "cross_merchant")
-    card_testing_details = _pattern_details(pattern_scores, "card_testing")
+    scores, details = _index_patterns(pattern_scores)
+    amount_details = details.get("amount_anomaly", {})
+    time_details = details.get("time_anomaly", {})
+    cross_details = details.get("cross_merchant", {})
+    card_testing_details = details.get("card_testing", {})
 
-    if severity in ("CRITICAL", "HIGH"):
+    if SEVERITY_RANK.get(severity, 0) >= SEVERITY_RANK["HIGH"]:
         candidates.append(
             RecommendationCandidate(
                 recommendation_type="review_priority",
@@ -89,7 +89,7 @@ def generate_recommendations(
             )
         )
 
-    card_testing_score = _pattern_scores(pattern_scores, "card_testing")
+    card_testing_score = scores.get("card_testing", 0.0)
     if card_testing_score >= 0.6:
         sequence_length = card_testing_details.get("sequence_length", "multiple")
         amount_range = card_testing_details.get("amount_range", "small escalating amounts")
@@ -106,7 +106,7 @@ def generate_recommendations(
             )
         )
 
-    velocity_score = _pattern_scores(pattern_scores, "velocity")
+    velocity_score = scores.get("velocity", 0.0)
     if velocity_score >= 0.6:
         candidates.append(
             RecommendationCandidate(
@@ -121,7 +121,7 @@ def generate_recommendations(
             )
         )
 
-    decline_score = _pattern_scores(pattern_scores, "decline_anomaly")
+    decline_score = scores.get("decline_anomaly", 0.0)
     if decline_score >= 0.5:
         candidates.append(
             RecommendationCandidate(
@@ -149,7 +149,7 @@ def generate_recommendations(
             )
         )
 
-    cross_score = _pattern_scores(pattern_scores, "cross_merchant")
+    cross_score = scores.get("cross_merchant", 0.0)
     if cross_score >= 0.5:
         merchants_24h = cross_details.get("unique_merchants_24h", "multiple")
         candidates.append(
@@ -165,7 +165,7 @@ def generate_recommendations(
             )
         )
 
-    amount_score = _pattern_scores(pattern_scores, "amount_anomaly")
+    amount_score = scores.get("amount_anomaly", 0.0)
     if amount_score >= 0.5:
         high_amount = amount_details.get("high_amount") or amount_details.get("elevated_amount")
         amount_text = (
@@ -184,7 +184,7 @@ def generate_recommendations(
             )
         )
 
-    time_score = _pattern_scores(pattern_scores, "time_anomaly")
+    time_score = scores.get("time_anomaly", 0.0)
     if time_score >= 0.5:
         unusual_hour = time_details.get("unusual_hour")
         timezone_mismatch = bool(time_details.get("timezone_mismatch"))
@@ -209,8 +209,8 @@ def generate_recommendations(
             )
         )
 
-    if _similarity_overall(similarity_result) >= 0.5:
-        sim_score = _similarity_overall(similarity_result)
+    sim_score = _similarity_overall(similarity_result)
+    if sim_score >= 0.5:
         candidates.append(
             RecommendationCandidate(
                 recommendation_type="rule_candidate",
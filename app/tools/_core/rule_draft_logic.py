@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleCondition:
     """Immutable rule condition."""
 
@@ -17,7 +17,7 @@ class RuleCondition:
     logical_op: str = "AND"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleDraftPayload:
     """Immutable rule draft payload."""
 
@@ -96,7 +96,9 @@ def _build_conditions_from_evidence(evidence: list[dict[str, Any]]) -> list[Rule
         score = payload.get("score", 0)
 
         if score > 0.5:
-            if pattern_name == "velocity" or "velocity" in pattern_name.lower():
+            # Substring checks also cover the exact pattern names; lowercase once per item.
+            pattern_key = pattern_name.lower()
+            if "velocity" in pattern_key:
                 conditions.append(
                     RuleCondition(
                         field_name="transaction_velocity_1h",
@@ -105,7 +107,7 @@ def _build_conditions_from_evidence(evidence: list[dict[str, Any]]) -> list[Rule
                         logical_op="AND",
                     )
                 )
-            elif pattern_name == "decline_anomaly" or "decline" in pattern_name.lower():
+            elif "decline" in pattern_key:
                 conditions.append(
                     RuleCondition(
                         field_name="decline_rate_1h",
@@ -114,7 +116,7 @@ def _build_conditions_from_evidence(evidence: list[dict[str, Any]]) -> list[Rule
                         logical_op="AND",
                     )
                 )
-            elif pattern_name == "amount_anomaly" or "amount" in pattern_name.lower():
+            elif "amount" in pattern_key:
                 conditions.append(
                     RuleCondition(
                         field_name="amount_vs_historical_avg",
@@ -123,7 +125,7 @@ def _build_conditions_from_evidence(evidence: list[dict[str, Any]]) -> list[Rule
                         logical_op="AND",
                     )
                 )
-            elif pattern_name == "geo_improbable" or "geo" in pattern_name.lower():
+            elif "geo" in pattern_key:
                 conditions.append(
                     RuleCondition(
                         field_name="distance_from_cardholder_location_km",
@@ -158,15 +160,16 @@ def _generate_rule_name(rec_type: str, evidence: list[dict[str, Any]]) -> str:
         for e in evidence:
             payload = e.get("evidence_payload", {})
             if payload.get("score", 0) > 0.5:
-                patterns.append(payload.get("pattern_name", e.get("evidence_kind", "unknown")))
+                pattern_name = payload.get("pattern_name", e.get("evidence_kind", "unknown"))
+                patterns.append(pattern_name.lower())
 
-        if any("velocity" in p.lower() for p in patterns):
+        if any("velocity" in p for p in patterns):
             return "Velocity Threshold Rule - Card Testing Detection"
-        elif any("decline" in p.lower() for p in patterns):
+        elif any("decline" in p for p in patterns):
             return "Decline Rate Anomaly Rule"
-        elif any("amount" in p.lower() for p in patterns):
+        elif any("amount" in p for p in patterns):
             return "Amount Deviation Rule"
-        elif any("geo" in p.lower() for p in patterns):
+        elif any("geo" in p for p in patterns):
             return "Geographic Implausibility Rule"
         return "Ops Agent Generated Rule"
     return "Custom Rule"
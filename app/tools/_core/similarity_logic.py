@@ -3,14 +3,16 @@
 This module contains ZERO database access. Pure functions operating on in-memory data structures.
 """
 
+import heapq
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
+from app.utils.clock import utc_now
 from app.utils.type_utils import to_float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimilarityMatch:
     """Immutable similarity match result."""
 
@@ -21,7 +23,7 @@ class SimilarityMatch:
     counter_evidence: list[dict[str, Any]] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimilarityResult:
     """Immutable similarity analysis result."""
 
@@ -30,31 +32,44 @@ class SimilarityResult:
     counter_evidence: list[dict[str, Any]] | None = None
 
 
-def freshness_weight(transaction_timestamp: datetime | None) -> float:
-    """Compute freshness weight based on transaction timestamp."""
-    if transaction_timestamp is None:
-        return 0.5
+# (exclusive max age, weight) buckets for freshness weighting, youngest first.
+_FRESHNESS_BUCKETS: tuple[tuple[timedelta, float], ...] = (
+    (timedelta(hours=1), 1.0),
+    (timedelta(hours=6), 0.9),
+    (timedelta(hours=24), 0.7),
+    (timedelta(days=7), 0.5),
+)
+_STALE_FRESHNESS_WEIGHT = 0.3
+_TOP_MATCH_LIMIT = 5
 
-    now = datetime.now(UTC)
-    age = now - transaction_timestamp
 
-    if age < timedelta(hours=1):
-        return 1.0
-    elif age < timedelta(hours=6):
-        return 0.9
-    elif age < timedelta(hours=24):
-        return 0.7
-    elif age < timedelta(days=7):
+def freshness_weight(
+    transaction_timestamp: datetime | None,
+    now: datetime | None = None,
+) -> float:
+    """Compute freshness weight based on transaction timestamp.
+
+    Callers scoring several timestamps should read the clock once and pass ``now``.
+    """
+    if transaction_timestamp is None:
         return 0.5
-    else:
-        return 0.3
+
+    age = (now or utc_now()) - transaction_timestamp
+    for max_age, weight in _FRESHNESS_BUCKETS:
+        if age < max_age:
+            return weight
+    return _STALE_FRESHNESS_WEIGHT
 
 
 def evaluate_similarity(
     transaction: Any,
     similar_transactions: list[dict[str, Any]],
+    now: datetime | None = None,
 ) -> SimilarityResult:
-    """Evaluate similarity to other transactions."""
+    """Evaluate similarity to other transactions.
+
+    ``now`` is the reference time for freshness weighting (defaults to the current UTC time).
+    """
     matches = []
 
     if not similar_transactions:
@@ -67,7 +82,7 @@ def evaluate_similarity(
             transaction.get("transaction_timestamp") if isinstance(transaction, dict) else None
         )
 
-    freshness = freshness_weight(tx_timestamp)
+    freshness = freshness_weight(tx_timestamp, now)
 
     if hasattr(transaction, "amount"):
         amount = to_float(transaction.amount)
@@ -87,10 +102,11 @@ def evaluate_similarity(
         base_score = sim_tx.get("similarity_score")
         match_type = sim_tx.get("match_type")
         details = sim_tx.get("details")
+        computed_details: dict[str, Any] | None = None
 
         if base_score is None:
             score = 0.0
-            computed_details: dict[str, Any] = {}
+            computed_details = {}
 
             sim_amount = to_float(sim_tx.get("amount", 0))
             if amount > 0 and sim_amount > 0:
@@ -117,7 +133,9 @@ def evaluate_similarity(
         if base_score and base_score > 0:
             risk_multiplier = _risk_multiplier(sim_tx, counter_evidence_payload)
             weighted_score = float(base_score) * freshness * risk_multiplier
-            normalized_details = dict(details)
+            # Copy the row's own details so the input is never mutated; a dict built
+            # above is private to this match and can be annotated in place.
+            normalized_details = details if details is computed_details else dict(details)
             normalized_details["risk_multiplier"] = round(risk_multiplier, 6)
             matches.append(
                 SimilarityMatch(
@@ -133,8 +151,9 @@ def evaluate_similarity(
                 )
             )
 
-    matches.sort(key=lambda m: m.similarity_score, reverse=True)
-    top_matches = matches[:5]
+    # Same ordering as a full descending sort (ties keep input order), without sorting
+    # every candidate when only the top few are kept.
+    top_matches = heapq.nlargest(_TOP_MATCH_LIMIT, matches, key=lambda m: m.similarity_score)
 
     overall = (
         sum(m.similarity_score for m in top_matches) / len(top_matches) if top_matches else 0.0
@@ -147,6 +166,18 @@ def evaluate_similarity(
     )
 
 
+# Risk multiplier by normalized match decision; unknown non-empty decisions use
+# _OTHER_DECISION_MULTIPLIER and a missing decision counts as fully risky.
+_DECISION_MULTIPLIERS: dict[str, float] = {
+    "APPROVE": 0.65,
+    "APPROVED": 0.65,
+    "DECLINE": 1.0,
+    "DECLINED": 1.0,
+    "": 1.0,
+}
+_OTHER_DECISION_MULTIPLIER = 0.85
+
+
 def _risk_multiplier(
     sim_tx: dict[str, Any],
     counter_evidence_payload: dict[str, Any] | None,
@@ -157,14 +188,7 @@ def _risk_multiplier(
     contribute less to fraud risk than similarity to declined/flagged flows.
     """
     decision = str(sim_tx.get("decision", "")).strip().upper()
-    if decision in {"APPROVE", "APPROVED"}:
-        decision_multiplier = 0.65
-    elif decision in {"DECLINE", "DECLINED"}:
-        decision_multiplier = 1.0
-    elif decision:
-        decision_multiplier = 0.85
-    else:
-        decision_multiplier = 1.0
+    decision_multiplier = _DECISION_MULTIPLIERS.get(decision, _OTHER_DECISION_MULTIPLIER)
 
     if not counter_evidence_payload:
         return decision_multiplier
@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from app.agent.state import InvestigationState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvidenceEntry:
     """Single evidence record generated by a tool."""
 
@@ -52,19 +52,27 @@ class LinkAnalysisTool(BaseTool):
         card_history = context.get("card_history", [])
         merchant_history = context.get("merchant_history", [])
 
-        result = run_link_analysis(
-            transaction=transaction,
-            card_history=card_history if isinstance(card_history, list) else [],
-            merchant_history=merchant_history if isinstance(merchant_history, list) else [],
-        )
+        # Start the TM neighborhood lookups first so their network wait overlaps the
+        # CPU-bound local graph analysis instead of following it.
+        neighborhoods = self._start_tm_neighborhood_fetches(context, transaction)
+        await asyncio.sleep(0)
+        try:
+            result = run_link_analysis(
+                transaction=transaction,
+                card_history=card_history if isinstance(card_history, list) else [],
+                merchant_history=merchant_history if isinstance(merchant_history, list) else [],
+            )
+        except BaseException:
+            neighborhoods.cancel()
+            raise
 
-        tm_enriched = await self._enrich_with_tm_neighborhoods(context, transaction)
+        ip_neighbors, device_neighbors, fingerprint_neighbors = await neighborhoods
         result = augment_link_analysis_with_neighborhoods(
             result,
             current_transaction_id=str(transaction.get("transaction_id", "") or ""),
-            ip_neighbors=tm_enriched["ip_neighbors"],
-            device_neighbors=tm_enriched["device_neighbors"],
-            fingerprint_neighbors=tm_enriched["fingerprint_neighbors"],
+            ip_neighbors=ip_neighbors,
+            device_neighbors=device_neighbors,
+            fingerprint_neighbors=fingerprint_neighbors,
         )
 
         evidence_entry = EvidenceEntry(
@@ -83,18 +91,16 @@ class LinkAnalysisTool(BaseTool):
             link_analysis_results=result,
         )
 
-    async def _enrich_with_tm_neighborhoods(
+    def _start_tm_neighborhood_fetches(
         self,
         context: dict,
         transaction: dict,
-    ) -> dict[str, list[dict]]:
-        if self._tm_client is None:
-            return {
-                "ip_neighbors": [],
-                "device_neighbors": [],
-                "fingerprint_neighbors": [],
-            }
+    ) -> asyncio.Future[list[list[dict]]]:
+        """Schedule the ip/device/fingerprint lookups and return their gathered result.
 
+        Each lookup is its own task so it starts on the next loop iteration rather
+        than when the result is awaited; without a TM client they resolve to ``[]``.
+        """
         features = context.get("features", {}) if isinstance(context.get("features"), dict) else {}
         tx_context = (
             context.get("transaction_context", {})
@@ -122,17 +128,11 @@ class LinkAnalysisTool(BaseTool):
         )
 
         tasks = [
-            self._fetch_neighbors("ip", ip_address),
-            self._fetch_neighbors("device", device_id),
-            self._fetch_neighbors("fingerprint", device_fingerprint_hash),
+            asyncio.create_task(self._fetch_neighbors("ip", ip_address)),
+            asyncio.create_task(self._fetch_neighbors("device", device_id)),
+            asyncio.create_task(self._fetch_neighbors("fingerprint", device_fingerprint_hash)),
         ]
-        ip_neighbors, device_neighbors, fingerprint_neighbors = await asyncio.gather(*tasks)
-
-        return {
-            "ip_neighbors": ip_neighbors,
-            "device_neighbors": device_neighbors,
-            "fingerprint_neighbors": fingerprint_neighbors,
-        }
+        return asyncio.gather(*tasks)
 
     async def _fetch_neighbors(self, kind: str, identifier: str | None) -> list[dict]:
         if not identifier or self._tm_client is None:
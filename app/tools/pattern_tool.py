@@ -55,12 +55,20 @@ class PatternTool(BaseTool):
 
         scores = run_pattern_scoring(context, thresholds)
 
+        # One pass over the scores for the weighted average and detected pattern names.
+        weighted_sum = 0.0
+        total_weight = 0.0
+        patterns_detected: list[str] = []
+        for s in scores:
+            weighted_sum += s.score * s.weight
+            total_weight += s.weight
+            if s.score > 0.5:
+                patterns_detected.append(s.pattern_name)
+
         pattern_results = {
             "scores": to_dict_list(scores),
-            "overall_score": (
-                sum(s.score * s.weight for s in scores) / max(sum(s.weight for s in scores), 1)
-            ),
-            "patterns_detected": [s.pattern_name for s in scores if s.score > 0.5],
+            "overall_score": weighted_sum / max(total_weight, 1),
+            "patterns_detected": patterns_detected,
         }
 
         severity = compute_severity(scores)
@@ -68,7 +76,7 @@ class PatternTool(BaseTool):
         evidence_entry = EvidenceEntry(
             category="pattern_analysis",
             tool=self.name,
-            description=f"Detected {len(pattern_results['patterns_detected'])} fraud patterns",
+            description=f"Detected {len(patterns_detected)} fraud patterns",
             data=pattern_results,
         )
 
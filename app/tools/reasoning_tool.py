@@ -6,11 +6,11 @@ import asyncio
 import json
 import re
 import time
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import structlog
 from langchain_core.messages import HumanMessage, SystemMessage
-from opentelemetry import trace
 
 from app.agent.state import update_state
 from app.core.metrics import (
@@ -18,6 +18,7 @@ from app.core.metrics import (
     ops_agent_llm_latency_seconds,
     ops_agent_llm_tokens_total,
 )
+from app.core.tracing import current_agent_span
 from app.tools._core.reasoning_logic import (
     assemble_prompt_payload,
     parse_llm_response,
@@ -34,7 +35,31 @@ if TYPE_CHECKING:
     from app.agent.state import InvestigationState
 
 logger = structlog.get_logger(__name__)
-tracer = trace.get_tracer(__name__)
+
+# Pre-bound metric children for the reasoning LLM path, as in the planner.
+_REASONING_LLM_LATENCY = ops_agent_llm_latency_seconds.labels(purpose="reasoning")
+_REASONING_LLM_CALLS = {
+    status: ops_agent_llm_calls_total.labels(purpose="reasoning", status=status)
+    for status in (
+        "success",
+        "timeout",
+        "error",
+        "blocked_by_guard",
+        "parse_error",
+        "repair_parse_error",
+        "repair_error",
+    )
+}
+
+
+@lru_cache(maxsize=16)
+def _reasoning_token_counters(model_name: str) -> tuple[Any, Any]:
+    """Return bound (input, output) token counters for a model."""
+    return (
+        ops_agent_llm_tokens_total.labels(model=model_name, type="input"),
+        ops_agent_llm_tokens_total.labels(model=model_name, type="output"),
+    )
+
 
 REASONING_SYSTEM_PROMPT = """You are a fraud investigation reasoning engine.
 Analyze the provided evidence and generate a structured risk assessment.
@@ -135,6 +160,20 @@ LOW_RISK_LANGUAGE_MARKERS = (
 )
 
 
+# Counter-evidence signals as (transaction_context keys, transaction attributes);
+# a signal counts once if any source is truthy, checked lazily in order.
+_COUNTER_EVIDENCE_SIGNALS: tuple[tuple[tuple[str, ...], tuple[str, ...]], ...] = (
+    (("3ds_verified",), ("three_ds_authenticated",)),
+    (("trusted_device",), ("device_trusted", "is_trusted_device")),
+    (("cardholder_present",), ("cardholder_present",)),
+    (("is_recurring_customer",), ("is_recurring_customer",)),
+    (("known_merchant",), ("is_known_merchant",)),
+    (("avs_match",), ("avs_match",)),
+    (("cvv_match",), ("cvv_match",)),
+    (("tokenized", "payment_token_present"), ("is_tokenized", "payment_token_present")),
+)
+
+
 class ReasoningTool(BaseTool):
     """Perform LLM-powered fraud reasoning based on collected evidence."""
 
@@ -172,248 +211,248 @@ class ReasoningTool(BaseTool):
             get_attr(get_attr(settings, "features", None), "enable_llm_reasoning", True)
         )
 
-        with tracer.start_as_current_span("tool.reasoning") as span:
-            span.set_attribute("investigation_id", state["investigation_id"])
-            span.set_attribute("tool_name", self.name)
+        # Record on the executor's agent.tool.reasoning_tool span rather than opening a
+        # child span of near-identical duration; LLM calls show up as its events. When
+        # that span is absent, write nothing rather than annotate the investigation span.
+        span = current_agent_span(f"agent.tool.{self.name}")
+
+        if not reasoning_enabled:
+            span.set_attribute("reasoning_llm_enabled", False)
+            message = "LLM reasoning disabled by OPS_AGENT_ENABLE_LLM_REASONING"
+            logger.error(
+                "Reasoning tool LLM disabled by feature flag",
+                investigation_id=state["investigation_id"],
+                error=message,
+            )
+            raise RuntimeError(message)
+
+        context = state["context"]
+        pattern_results = state["pattern_results"]
+        similarity_results = state["similarity_results"]
+        link_analysis_results = state.get("link_analysis_results", {})
+
+        redacted_context = redact_state_for_llm(context)
+        prompt_payload = assemble_prompt_payload(
+            context=redacted_context,
+            pattern_analysis=pattern_results,
+            similarity_analysis=similarity_results,
+            link_analysis=link_analysis_results,
+        )
 
-            if not reasoning_enabled:
-                span.set_attribute("reasoning_llm_enabled", False)
-                message = "LLM reasoning disabled by OPS_AGENT_ENABLE_LLM_REASONING"
-                logger.error(
-                    "Reasoning tool LLM disabled by feature flag",
+        if prompt_guard_enabled:
+            validation_errors = validate_prompt_payload(prompt_payload)
+            if validation_errors:
+                logger.warning(
+                    "Prompt guard validation failed",
                     investigation_id=state["investigation_id"],
-                    error=message,
+                    errors=validation_errors[:5],
+                    error_count=len(validation_errors),
+                )
+                span.set_attributes(
+                    {
+                        "prompt_guard_blocked": True,
+                        "prompt_guard_errors": len(validation_errors),
+                    }
+                )
+                _REASONING_LLM_CALLS["blocked_by_guard"].inc()
+                error_preview = "; ".join([str(err) for err in validation_errors[:5]])
+                raise ValueError(f"Prompt guard blocked: {error_preview}")
+
+        messages = [
+            SystemMessage(content=REASONING_SYSTEM_PROMPT),
+            HumanMessage(content=json.dumps(prompt_payload, default=str)),
+        ]
+
+        span.add_event(
+            "llm.request",
+            {
+                "purpose": "reasoning",
+                "system_prompt_chars": len(REASONING_SYSTEM_PROMPT),
+                "prompt_payload_keys": list(prompt_payload.keys()),
+            },
+        )
+
+        start_time = time.perf_counter()
+        try:
+            async with asyncio.timeout(settings.llm.stage_timeout_seconds):
+                response = await self._llm.ainvoke(
+                    messages,
+                    max_tokens=max(settings.llm.max_completion_tokens, REASONING_MIN_MAX_TOKENS),
+                    request_timeout=float(settings.llm.stage_timeout_seconds),
+                    response_format=REASONING_RESPONSE_FORMAT,
+                    response_format_name="reasoning",
                 )
-                raise RuntimeError(message)
-
-            context = state["context"]
-            pattern_results = state["pattern_results"]
-            similarity_results = state["similarity_results"]
-            link_analysis_results = state.get("link_analysis_results", {})
-
-            redacted_context = redact_state_for_llm(context)
-            prompt_payload = assemble_prompt_payload(
-                context=redacted_context,
-                pattern_analysis=pattern_results,
-                similarity_analysis=similarity_results,
-                link_analysis=link_analysis_results,
+        except TimeoutError:
+            elapsed = time.perf_counter() - start_time
+            _REASONING_LLM_LATENCY.observe(elapsed)
+            _REASONING_LLM_CALLS["timeout"].inc()
+            span.set_attribute(
+                "error", f"reasoning_llm_timeout_{settings.llm.stage_timeout_seconds}s"
             )
+            logger.warning(
+                "Reasoning tool LLM call timed out",
+                investigation_id=state["investigation_id"],
+                timeout_seconds=settings.llm.stage_timeout_seconds,
+            )
+            raise
+        except Exception as exc:
+            elapsed = time.perf_counter() - start_time
+            _REASONING_LLM_LATENCY.observe(elapsed)
+            _REASONING_LLM_CALLS["error"].inc()
+            span.set_attribute("error", str(exc))
+            logger.error(
+                "Reasoning tool LLM call failed",
+                investigation_id=state["investigation_id"],
+                error=str(exc),
+            )
+            raise
 
-            if prompt_guard_enabled:
-                validation_errors = validate_prompt_payload(prompt_payload)
-                if validation_errors:
-                    logger.warning(
-                        "Prompt guard validation failed",
-                        investigation_id=state["investigation_id"],
-                        errors=validation_errors[:5],
-                        error_count=len(validation_errors),
-                    )
-                    span.set_attribute("prompt_guard_blocked", True)
-                    span.set_attribute("prompt_guard_errors", len(validation_errors))
-                    ops_agent_llm_calls_total.labels(
-                        purpose="reasoning", status="blocked_by_guard"
-                    ).inc()
-                    error_preview = "; ".join([str(err) for err in validation_errors[:5]])
-                    raise ValueError(f"Prompt guard blocked: {error_preview}")
-
-            messages = [
-                SystemMessage(content=REASONING_SYSTEM_PROMPT),
-                HumanMessage(content=json.dumps(prompt_payload, default=str)),
-            ]
-
-            span.add_event(
-                "llm.request",
-                {
-                    "purpose": "reasoning",
-                    "system_prompt_chars": len(REASONING_SYSTEM_PROMPT),
-                    "prompt_payload_keys": list(prompt_payload.keys()),
-                },
+        elapsed = time.perf_counter() - start_time
+        _REASONING_LLM_LATENCY.observe(elapsed)
+
+        input_tokens = 0
+        output_tokens = 0
+        if hasattr(response, "usage_metadata") and response.usage_metadata:
+            metadata = response.usage_metadata
+            input_counter, output_counter = _reasoning_token_counters(
+                getattr(self._llm, "model", "unknown")
             )
+            if "input_tokens" in metadata:
+                input_tokens = metadata["input_tokens"]
+                input_counter.inc(input_tokens)
+            if "output_tokens" in metadata:
+                output_tokens = metadata["output_tokens"]
+                output_counter.inc(output_tokens)
+
+        response_content = str(response.content)
+        span.add_event(
+            "llm.response",
+            {
+                "purpose": "reasoning",
+                "content_length": len(response_content),
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+            },
+        )
 
-            start_time = time.perf_counter()
+        parse_attempt = 0
+        current_content = response_content
+        while True:
             try:
-                async with asyncio.timeout(settings.llm.stage_timeout_seconds):
-                    response = await self._llm.ainvoke(
-                        messages,
-                        max_tokens=max(
-                            settings.llm.max_completion_tokens, REASONING_MIN_MAX_TOKENS
-                        ),
-                        request_timeout=float(settings.llm.stage_timeout_seconds),
-                        response_format=REASONING_RESPONSE_FORMAT,
-                    )
-            except TimeoutError:
-                elapsed = time.perf_counter() - start_time
-                ops_agent_llm_latency_seconds.labels(purpose="reasoning").observe(elapsed)
-                ops_agent_llm_calls_total.labels(purpose="reasoning", status="timeout").inc()
-                span.set_attribute(
-                    "error", f"reasoning_llm_timeout_{settings.llm.stage_timeout_seconds}s"
-                )
+                reasoning = parse_llm_response(current_content)
+                break
+            except ValueError as exc:
+                status_label = "parse_error" if parse_attempt == 0 else "repair_parse_error"
+                _REASONING_LLM_CALLS[status_label].inc()
                 logger.warning(
-                    "Reasoning tool LLM call timed out",
-                    investigation_id=state["investigation_id"],
-                    timeout_seconds=settings.llm.stage_timeout_seconds,
-                )
-                raise
-            except Exception as exc:
-                elapsed = time.perf_counter() - start_time
-                ops_agent_llm_latency_seconds.labels(purpose="reasoning").observe(elapsed)
-                ops_agent_llm_calls_total.labels(purpose="reasoning", status="error").inc()
-                span.set_attribute("error", str(exc))
-                logger.error(
-                    "Reasoning tool LLM call failed",
+                    "Reasoning tool returned non-parseable payload",
                     investigation_id=state["investigation_id"],
+                    attempt=parse_attempt + 1,
+                    max_attempts=REASONING_MAX_REPAIR_ATTEMPTS + 1,
                     error=str(exc),
+                    response_length=len(current_content),
                 )
-                raise
-
-            elapsed = time.perf_counter() - start_time
-            ops_agent_llm_latency_seconds.labels(purpose="reasoning").observe(elapsed)
-
-            input_tokens = 0
-            output_tokens = 0
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                metadata = response.usage_metadata
-                model_name = getattr(self._llm, "model", "unknown")
-                if "input_tokens" in metadata:
-                    input_tokens = metadata["input_tokens"]
-                    ops_agent_llm_tokens_total.labels(model=model_name, type="input").inc(
-                        input_tokens
-                    )
-                if "output_tokens" in metadata:
-                    output_tokens = metadata["output_tokens"]
-                    ops_agent_llm_tokens_total.labels(model=model_name, type="output").inc(
-                        output_tokens
-                    )
+                span.add_event(
+                    "llm.response_parse_error",
+                    {
+                        "purpose": "reasoning",
+                        "attempt": parse_attempt + 1,
+                        "error": str(exc)[:240],
+                        "response_preview": current_content[:240],
+                    },
+                )
+                if parse_attempt >= REASONING_MAX_REPAIR_ATTEMPTS:
+                    raise
 
-            response_content = str(response.content)
-            span.add_event(
-                "llm.response",
-                {
-                    "purpose": "reasoning",
-                    "content_length": len(response_content),
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                },
-            )
+                repair_messages = [
+                    *messages,
+                    HumanMessage(content=self._repair_instruction(current_content)),
+                ]
 
-            parse_attempt = 0
-            current_content = response_content
-            while True:
+                start_time = time.perf_counter()
                 try:
-                    reasoning = parse_llm_response(current_content)
-                    break
-                except ValueError as exc:
-                    status_label = "parse_error" if parse_attempt == 0 else "repair_parse_error"
-                    ops_agent_llm_calls_total.labels(purpose="reasoning", status=status_label).inc()
-                    logger.warning(
-                        "Reasoning tool returned non-parseable payload",
+                    async with asyncio.timeout(settings.llm.stage_timeout_seconds):
+                        repair_response = await self._llm.ainvoke(
+                            repair_messages,
+                            max_tokens=max(
+                                settings.llm.max_completion_tokens,
+                                REASONING_MIN_MAX_TOKENS,
+                            ),
+                            request_timeout=float(settings.llm.stage_timeout_seconds),
+                            response_format=REASONING_RESPONSE_FORMAT,
+                            response_format_name="reasoning",
+                        )
+                except Exception as repair_exc:
+                    elapsed = time.perf_counter() - start_time
+                    _REASONING_LLM_LATENCY.observe(elapsed)
+                    _REASONING_LLM_CALLS["repair_error"].inc()
+                    span.set_attribute("error", str(repair_exc))
+                    logger.error(
+                        "Reasoning tool repair call failed",
                         investigation_id=state["investigation_id"],
                         attempt=parse_attempt + 1,
-                        max_attempts=REASONING_MAX_REPAIR_ATTEMPTS + 1,
-                        error=str(exc),
-                        response_length=len(current_content),
-                    )
-                    span.add_event(
-                        "llm.response_parse_error",
-                        {
-                            "purpose": "reasoning",
-                            "attempt": parse_attempt + 1,
-                            "error": str(exc)[:240],
-                            "response_preview": current_content[:240],
-                        },
+                        error=str(repair_exc),
                     )
-                    if parse_attempt >= REASONING_MAX_REPAIR_ATTEMPTS:
-                        raise
-
-                    repair_messages = [
-                        *messages,
-                        HumanMessage(content=self._repair_instruction(current_content)),
-                    ]
-
-                    start_time = time.perf_counter()
-                    try:
-                        async with asyncio.timeout(settings.llm.stage_timeout_seconds):
-                            repair_response = await self._llm.ainvoke(
-                                repair_messages,
-                                max_tokens=max(
-                                    settings.llm.max_completion_tokens,
-                                    REASONING_MIN_MAX_TOKENS,
-                                ),
-                                request_timeout=float(settings.llm.stage_timeout_seconds),
-                                response_format=REASONING_RESPONSE_FORMAT,
-                            )
-                    except Exception as repair_exc:
-                        elapsed = time.perf_counter() - start_time
-                        ops_agent_llm_latency_seconds.labels(purpose="reasoning").observe(elapsed)
-                        ops_agent_llm_calls_total.labels(
-                            purpose="reasoning", status="repair_error"
-                        ).inc()
-                        span.set_attribute("error", str(repair_exc))
-                        logger.error(
-                            "Reasoning tool repair call failed",
-                            investigation_id=state["investigation_id"],
-                            attempt=parse_attempt + 1,
-                            error=str(repair_exc),
-                        )
-                        raise
+                    raise
 
-                    elapsed = time.perf_counter() - start_time
-                    ops_agent_llm_latency_seconds.labels(purpose="reasoning").observe(elapsed)
-                    current_content = str(repair_response.content)
-                    span.add_event(
-                        "llm.repair_response",
-                        {
-                            "purpose": "reasoning",
-                            "attempt": parse_attempt + 1,
-                            "content_length": len(current_content),
-                        },
-                    )
-                    parse_attempt += 1
-
-            if "summary" not in reasoning and isinstance(reasoning.get("narrative"), str):
-                narrative = reasoning["narrative"].strip()
-                if narrative:
-                    reasoning["summary"] = narrative
-            llm_status = "success"
-            ops_agent_llm_calls_total.labels(purpose="reasoning", status=llm_status).inc()
-            reasoning["llm_status"] = llm_status
-
-            hypotheses = reasoning.get("hypotheses", [])
-            severity = reasoning.get("risk_level", state["severity"])
-            if severity not in VALID_SEVERITIES:
-                severity = state["severity"]
-            calibrated_severity = self._calibrate_llm_severity(state, severity)
-            if calibrated_severity != severity:
-                reasoning["llm_risk_level"] = severity
-                reasoning["severity_calibration"] = "counter_evidence_no_pattern_cap"
-                severity = calibrated_severity
-                reasoning["risk_level"] = calibrated_severity
-            confidence = reasoning.get("confidence", state["confidence_score"])
-            reasoning["severity"] = severity
-            reasoning = self._harmonize_reasoning_text(state, reasoning, severity)
-
-            span.set_attribute("severity", str(severity))
-            span.set_attribute("confidence", float(confidence))
-
-            logger.info(
-                "Reasoning tool completed",
-                investigation_id=state["investigation_id"],
-                severity=severity,
-                confidence=confidence,
-                findings_count=len(reasoning.get("key_findings", [])),
-            )
+                elapsed = time.perf_counter() - start_time
+                _REASONING_LLM_LATENCY.observe(elapsed)
+                current_content = str(repair_response.content)
+                span.add_event(
+                    "llm.repair_response",
+                    {
+                        "purpose": "reasoning",
+                        "attempt": parse_attempt + 1,
+                        "content_length": len(current_content),
+                    },
+                )
+                parse_attempt += 1
+
+        if "summary" not in reasoning and isinstance(reasoning.get("narrative"), str):
+            narrative = reasoning["narrative"].strip()
+            if narrative:
+                reasoning["summary"] = narrative
+        llm_status = "success"
+        _REASONING_LLM_CALLS[llm_status].inc()
+        reasoning["llm_status"] = llm_status
+
+        hypotheses = reasoning.get("hypotheses", [])
+        severity = reasoning.get("risk_level", state["severity"])
+        if severity not in VALID_SEVERITIES:
+            severity = state["severity"]
+        calibrated_severity = self._calibrate_llm_severity(state, severity)
+        if calibrated_severity != severity:
+            reasoning["llm_risk_level"] = severity
+            reasoning["severity_calibration"] = "counter_evidence_no_pattern_cap"
+            severity = calibrated_severity
+            reasoning["risk_level"] = calibrated_severity
+        confidence = reasoning.get("confidence", state["confidence_score"])
+        reasoning["severity"] = severity
+        reasoning = self._harmonize_reasoning_text(state, reasoning, severity)
+
+        span.set_attributes({"severity": str(severity), "confidence": float(confidence)})
+
+        logger.info(
+            "Reasoning tool completed",
+            investigation_id=state["investigation_id"],
+            severity=severity,
+            confidence=confidence,
+            findings_count=len(reasoning.get("key_findings", [])),
+        )
 
-            return update_state(
-                state,
-                reasoning=reasoning,
-                hypotheses=[*state["hypotheses"], *hypotheses],
-                severity=severity,
-                confidence_score=float(confidence),
-            )
+        return update_state(
+            state,
+            reasoning=reasoning,
+            hypotheses=[*state["hypotheses"], *hypotheses],
+            severity=severity,
+            confidence_score=float(confidence),
+        )
 
     @staticmethod
     def _normalize_severity(value: object, *, default: str) -> str:
         if isinstance(value, str):
+            if value in VALID_SEVERITIES:
+                return value
             normalized = value.strip().upper()
             if normalized in VALID_SEVERITIES:
                 return normalized
@@ -451,56 +490,34 @@ class ReasoningTool(BaseTool):
         tx_context_dict = tx_context if isinstance(tx_context, dict) else {}
         transaction = context_dict.get("transaction", {})
 
-        features = {
-            "three_ds": (
-                tx_context_dict.get("3ds_verified"),
-                get_attr(transaction, "three_ds_authenticated"),
-            ),
-            "trusted_device": (
-                tx_context_dict.get("trusted_device"),
-                get_attr(transaction, "device_trusted"),
-                get_attr(transaction, "is_trusted_device"),
-            ),
-            "cardholder_present": (
-                tx_context_dict.get("cardholder_present"),
-                get_attr(transaction, "cardholder_present"),
-            ),
-            "recurring_customer": (
-                tx_context_dict.get("is_recurring_customer"),
-                get_attr(transaction, "is_recurring_customer"),
-            ),
-            "known_merchant": (
-                tx_context_dict.get("known_merchant"),
-                get_attr(transaction, "is_known_merchant"),
-            ),
-            "avs_match": (
-                tx_context_dict.get("avs_match"),
-                get_attr(transaction, "avs_match"),
-            ),
-            "cvv_match": (
-                tx_context_dict.get("cvv_match"),
-                get_attr(transaction, "cvv_match"),
-            ),
-            "tokenized": (
-                tx_context_dict.get("tokenized"),
-                tx_context_dict.get("payment_token_present"),
-                get_attr(transaction, "is_tokenized"),
-                get_attr(transaction, "payment_token_present"),
-            ),
-        }
-
-        return sum(1 for values in features.values() if any(cls._truthy(v) for v in values))
+        truthy = cls._truthy
+        count = 0
+        for context_keys, transaction_attrs in _COUNTER_EVIDENCE_SIGNALS:
+            if any(truthy(tx_context_dict.get(key)) for key in context_keys) or any(
+                truthy(get_attr(transaction, attr)) for attr in transaction_attrs
+            ):
+                count += 1
+        return count
 
     @classmethod
-    def _max_pattern_score(cls, state: InvestigationState) -> float:
+    def _pattern_score_summary(cls, state: InvestigationState) -> tuple[float, dict[str, float]]:
+        """Return the max pattern score and per-name scores from one pass over the rows."""
         max_score = 0.0
+        score_by_name: dict[str, float] = {}
         for row in cls._pattern_rows(state):
             try:
                 score = float(row.get("score", 0.0) or 0.0)
             except TypeError, ValueError:
                 score = 0.0
             max_score = max(max_score, score)
-        return max_score
+            name = row.get("pattern_name")
+            if isinstance(name, str):
+                score_by_name[name] = score
+        return max_score, score_by_name
+
+    @classmethod
+    def _max_pattern_score(cls, state: InvestigationState) -> float:
+        return cls._pattern_score_summary(state)[0]
 
     @classmethod
     def _similarity_summary(cls, state: InvestigationState) -> tuple[float, int]:
@@ -544,19 +561,10 @@ class ReasoningTool(BaseTool):
     def _calibrate_llm_severity(cls, state: InvestigationState, severity: Any) -> str:
         normalized = cls._normalize_severity(severity, default="LOW")
 
-        max_pattern_score = cls._max_pattern_score(state)
+        max_pattern_score, score_by_name = cls._pattern_score_summary(state)
         similarity_score, similarity_match_count = cls._similarity_summary(state)
         similarity_has_counter_evidence = cls._similarity_has_counter_evidence(state)
         counter_evidence_count = cls._counter_evidence_count(state)
-        score_by_name: dict[str, float] = {}
-        for row in cls._pattern_rows(state):
-            name = row.get("pattern_name")
-            if not isinstance(name, str):
-                continue
-            try:
-                score_by_name[name] = float(row.get("score", 0.0) or 0.0)
-            except TypeError, ValueError:
-                score_by_name[name] = 0.0
         amount_anomaly_score = score_by_name.get("amount_anomaly", 0.0)
         non_amount_pattern_max = max(
             (
@@ -656,7 +664,7 @@ class ReasoningTool(BaseTool):
         reasoning: dict[str, Any],
         severity: str,
     ) -> dict[str, Any]:
-        if severity not in {"MEDIUM", "HIGH", "CRITICAL"}:
+        if SEVERITY_RANK.get(severity, 0) < SEVERITY_RANK["MEDIUM"]:
             return reasoning
         output = dict(reasoning)
         for key in ("summary", "narrative"):
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from app.agent.state import update_state
 from app.tools._core.pattern_logic import PatternScore
@@ -16,6 +16,21 @@ if TYPE_CHECKING:
     from app.agent.state import InvestigationState
 
 
+def _to_similarity_match(match: Any) -> SimilarityMatch:
+    """Rebuild a persisted similarity match, reading each field once."""
+    details = get_attr(match, "details", {})
+    counter_evidence = get_attr(match, "counter_evidence")
+    return SimilarityMatch(
+        match_id=str(get_attr(match, "match_id") or get_attr(match, "transaction_id", "")),
+        match_type=str(get_attr(match, "match_type", "unknown")),
+        similarity_score=float(
+            get_attr(match, "similarity_score") or get_attr(match, "score", 0.0)
+        ),
+        details=details if isinstance(details, dict) else {},
+        counter_evidence=counter_evidence if isinstance(counter_evidence, list) else None,
+    )
+
+
 class RecommendationTool(BaseTool):
     """Generate fraud investigation recommendations based on evidence and reasoning results."""
 
@@ -59,26 +74,7 @@ class RecommendationTool(BaseTool):
             for s in pattern_results.get("scores", [])
         ]
 
-        matches = [
-            SimilarityMatch(
-                match_id=str(get_attr(m, "match_id") or get_attr(m, "transaction_id", "")),
-                match_type=str(get_attr(m, "match_type", "unknown")),
-                similarity_score=float(
-                    get_attr(m, "similarity_score") or get_attr(m, "score", 0.0)
-                ),
-                details=(
-                    get_attr(m, "details", {})
-                    if isinstance(get_attr(m, "details", {}), dict)
-                    else {}
-                ),
-                counter_evidence=(
-                    get_attr(m, "counter_evidence")
-                    if isinstance(get_attr(m, "counter_evidence"), list)
-                    else None
-                ),
-            )
-            for m in similarity_results.get("matches", [])
-        ]
+        matches = [_to_similarity_match(m) for m in similarity_results.get("matches", [])]
 
         similarity_result = SimilarityResult(
             matches=matches,
@@ -8,7 +8,8 @@ from typing import Any
 
 def get_attr(value: Any, key: str, default: Any = None) -> Any:
     """Read key from mapping-like values or attribute from objects."""
-    if isinstance(value, Mapping):
+    # Exact-dict check first: the common case, and cheaper than the ABC isinstance.
+    if type(value) is dict or isinstance(value, Mapping):
         return value.get(key, default)
     return getattr(value, key, default)
 
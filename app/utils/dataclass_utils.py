@@ -2,17 +2,65 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, fields, is_dataclass
+from functools import cache
+from operator import attrgetter
 from typing import Any
 
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+class _NotPlainError(Exception):
+    """Raised when a value needs the full ``asdict`` treatment."""
+
+
+@cache
+def _field_accessors(cls: type) -> tuple[tuple[str, ...], attrgetter[Any] | None]:
+    """Return a dataclass's field names and a getter for all of them, computed once."""
+    names = tuple(f.name for f in fields(cls))
+    return names, attrgetter(*names) if names else None
+
+
+def _plain(value: Any) -> Any:
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    if value_type is list:
+        return [_plain(item) for item in value]
+    if value_type is dict:
+        return {_plain(k): _plain(v) for k, v in value.items()}
+    if value_type is tuple:
+        return tuple(_plain(item) for item in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return _dataclass_to_dict(value)
+    raise _NotPlainError
+
+
+def _dataclass_to_dict(obj: Any) -> dict[str, Any]:
+    names, getter = _field_accessors(type(obj))
+    if getter is None:
+        return {}
+    values = getter(obj)
+    if len(names) == 1:
+        values = (values,)
+    return {name: _plain(value) for name, value in zip(names, values, strict=True)}
+
 
 def to_dict(obj: Any) -> dict[str, Any]:
-    """Convert a dataclass (possibly nested) to a JSON-friendly dict."""
+    """Convert a dataclass (possibly nested) to a JSON-friendly dict.
+
+    Equivalent to ``dataclasses.asdict``. Trees made of dataclasses, JSON
+    primitives, lists, tuples and dicts take a fast path with per-class cached
+    field getters; anything else falls back to ``asdict``.
+    """
     if isinstance(obj, dict):
         return obj
     if is_dataclass(obj) and not isinstance(obj, type):
-        # asdict() recursively converts nested dataclasses.
-        return asdict(obj)
+        try:
+            return _dataclass_to_dict(obj)
+        except _NotPlainError:
+            # asdict() deep-copies values it does not recognise.
+            return asdict(obj)
     return {}
 
 
@@ -29,3 +29,21 @@ def to_float(value: Any, default: float = 0.0) -> float:
         return float(value)
     except TypeError, ValueError:
         return default
+
+
+def to_int(value: Any, default: int = 0) -> int:
+    """Convert a value to int, returning ``default`` when conversion fails.
+
+    Args:
+        value: The value to convert to int
+        default: The default value if conversion fails
+
+    Returns:
+        The converted int value or the default
+    """
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except TypeError, ValueError:
+        return default
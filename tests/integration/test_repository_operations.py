@@ -73,6 +73,24 @@ class TestToolLogRepository:
         assert result["status"] == "SUCCESS"
         assert result["step_number"] == 1
 
+    async def test_log_executions_inserts_all_records_in_step_order(self, session):
+        """Batched tool log insert writes one row per execution with 1-based steps."""
+        investigation_id = await _create_investigation(session)
+        repo = ToolLogRepository(session)
+
+        written = await repo.log_executions(
+            investigation_id=investigation_id,
+            executions=[
+                {"tool_name": "context_tool", "status": "SUCCESS", "execution_time_ms": 10},
+                {"tool_name": "pattern_tool", "status": "FAILED", "error_message": "boom"},
+            ],
+        )
+
+        rows = await repo.get_executions(investigation_id)
+        assert written == 2
+        assert [row["tool_name"] for row in rows] == ["context_tool", "pattern_tool"]
+        assert [row["step_number"] for row in rows] == [1, 2]
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -119,6 +137,28 @@ class TestInsightRepository:
 
         assert result["evidence_kind"] == "pattern"
 
+    async def test_add_evidence_batch(self, session):
+        """Batched evidence insert writes one row per item."""
+        repo = InsightRepository(session)
+
+        insight_id = str(uuid.uuid7())
+        transaction_id = str(uuid.uuid7())
+
+        await session.execute(
+            text(
+                f"INSERT INTO fraud_gov.ops_agent_insights "
+                f"(insight_id, transaction_id, severity, summary, insight_type, model_mode, generated_at) "
+                f"VALUES ('{insight_id}', '{transaction_id}', 'LOW', 'Test', 'test', 'agentic', NOW())"
+            )
+        )
+
+        written = await repo.add_evidence_batch(
+            insight_id,
+            [("pattern", {"score": 0.8}), ("similarity", {"score": 0.4})],
+        )
+
+        assert written == 2
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
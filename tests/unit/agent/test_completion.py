@@ -18,6 +18,12 @@ def test_determine_severity_falls_back_to_confidence_when_invalid() -> None:
     assert _determine_severity(0.1, "") == "LOW"
 
 
+def test_determine_severity_normalizes_lowercase_level() -> None:
+    assert _determine_severity(0.1, "critical") == "CRITICAL"
+    assert _determine_severity(0.85, "bogus") == "CRITICAL"
+    assert _determine_severity(0.35, "bogus") == "MEDIUM"
+
+
 @pytest.mark.asyncio
 async def test_completion_node_does_not_escalate_low_risk_by_confidence() -> None:
     state = create_initial_state("inv-1", "txn-1")
@@ -35,3 +41,26 @@ async def test_completion_node_does_not_escalate_low_risk_by_confidence() -> Non
     completed = await completion_node(state)
     assert completed["confidence_score"] == 0.95
     assert completed["severity"] == "LOW"
+
+
+@pytest.mark.asyncio
+async def test_completion_node_persists_final_state_without_mutating_input() -> None:
+    class _Store:
+        def __init__(self) -> None:
+            self.saved: list[object] = []
+
+        async def save_state(self, investigation_id, state):  # noqa: ANN001
+            self.saved.append(state)
+            return 1
+
+    state = create_initial_state("inv-2", "txn-2")
+    state["status"] = "FAILED"
+    store = _Store()
+
+    completed = await completion_node(state, store)  # type: ignore[arg-type]
+
+    assert store.saved == [completed]
+    assert store.saved[0] is completed
+    assert completed["status"] == "FAILED"
+    assert completed["completed_at"] is not None
+    assert state["completed_at"] is None
@@ -301,3 +301,99 @@ def test_executor_link_analysis_summary_is_populated() -> None:
     assert link_summary["signals_count"] == 1
     assert link_summary["hypotheses_count"] == 1
     assert link_summary["key_metrics"]["card_fan_out_1h"] == 6
+
+
+def test_executor_append_step_does_not_mutate_input_lists() -> None:
+    state = create_initial_state("inv-exec-6", "txn-exec-6")
+    state["completed_steps"] = ["context_tool", "pattern_tool", "similarity_tool"]
+    state["step_count"] = 4
+    state["next_action"] = "reasoning_tool"
+
+    registry = ToolRegistry()
+    registry.register(_FailingReasoningTool())
+
+    result = asyncio.run(executor_node(state, registry))
+
+    assert result["completed_steps"] == ["context_tool", "pattern_tool", "similarity_tool"]
+    assert len(result["tool_executions"]) == 1
+    assert state["tool_executions"] == []
+
+
+def test_executor_summary_detail_none_skips_summaries() -> None:
+    state = create_initial_state("inv-exec-7", "txn-exec-7")
+    state["completed_steps"] = ["context_tool"]
+    state["step_count"] = 1
+    state["next_action"] = "pattern_tool"
+
+    registry = ToolRegistry()
+    registry.register(_PatternTool())
+
+    result = asyncio.run(executor_node(state, registry, summary_detail="none"))
+
+    execution = result["tool_executions"][-1]
+    assert execution["input_summary"] == {}
+    assert execution["output_summary"] == {"status": "SUCCESS"}
+
+
+def test_executor_summary_detail_minimal_keeps_core_fields() -> None:
+    state = create_initial_state("inv-exec-8", "txn-exec-8")
+    state["completed_steps"] = ["context_tool"]
+    state["step_count"] = 1
+    state["next_action"] = "pattern_tool"
+
+    registry = ToolRegistry()
+    registry.register(_PatternTool())
+
+    result = asyncio.run(executor_node(state, registry, summary_detail="minimal"))
+
+    execution = result["tool_executions"][-1]
+    assert execution["input_summary"] == {
+        "transaction_id": "txn-exec-8",
+        "current_severity": "LOW",
+        "step_count": 1,
+        "completed_step_count": 1,
+    }
+    assert execution["output_summary"] == {"status": "SUCCESS", "severity": "HIGH"}
+
+
+def test_executor_zero_timeout_runs_tool_without_deadline() -> None:
+    state = create_initial_state("inv-exec-9", "txn-exec-9")
+    state["completed_steps"] = ["context_tool"]
+    state["step_count"] = 1
+    state["next_action"] = "pattern_tool"
+
+    registry = ToolRegistry()
+    registry.register(_PatternTool())
+
+    result = asyncio.run(executor_node(state, registry, tool_timeout_seconds=0))
+
+    assert result["tool_executions"][-1]["status"] == "SUCCESS"
+    assert result["completed_steps"] == ["context_tool", "pattern_tool"]
+
+
+def test_executor_tool_span_sets_tool_name_not_duration(monkeypatch) -> None:  # noqa: ANN001
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from app.agent import executor as executor_module
+
+    monkeypatch.setattr("app.core.tracing._TRACING_ENABLED", True)
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(executor_module, "tracer", provider.get_tracer(__name__))
+
+    state = create_initial_state("inv-exec-10", "txn-exec-10")
+    state["completed_steps"] = ["context_tool"]
+    state["step_count"] = 1
+    state["next_action"] = "pattern_tool"
+    registry = ToolRegistry()
+    registry.register(_PatternTool())
+
+    asyncio.run(executor_node(state, registry))
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "agent.tool.pattern_tool"
+    assert span.attributes["tool_name"] == "pattern_tool"
+    assert "execution_time_ms" not in span.attributes
@@ -320,3 +320,267 @@ def test_planner_falls_back_when_repair_does_not_fix_invalid_decision() -> None:
 
     assert updated_state["next_action"] == "reasoning_tool"
     assert "rule-sequence fallback" in updated_state["planner_decisions"][-1]["reason"]
+
+
+def test_planner_system_prompt_is_stable_across_steps() -> None:
+    captured: list[list] = []
+
+    class _CapturingLLM:
+        async def ainvoke(self, messages, **_kwargs):  # noqa: ANN001, ANN003
+            captured.append(messages)
+            return _DummyResponse(content='{"tool":"pattern_tool","reason":"x","confidence":0.5}')
+
+    registry = _build_registry()
+    for step_count, completed in (
+        (1, ["context_tool"]),
+        (2, ["context_tool", "link_analysis_tool"]),
+    ):
+        state = create_initial_state("inv-cache", "txn-cache")
+        state["context"] = {"transaction": {"transaction_id": "txn-cache"}}
+        state["completed_steps"] = completed
+        state["step_count"] = step_count
+        asyncio.run(planner_node(state, _CapturingLLM(), registry))
+
+    first, second = captured
+    assert first[0].content == second[0].content
+    assert "## Available Tools" in first[0].content
+    assert "link_analysis_tool" in second[1].content
+    assert "## Available Tools" not in second[1].content
+
+
+def test_planner_system_prompt_lists_tools_in_registration_order() -> None:
+    captured: list[str] = []
+
+    class _CapturingLLM:
+        async def ainvoke(self, messages, **_kwargs):  # noqa: ANN001, ANN003
+            captured.append(messages[0].content)
+            return _DummyResponse(content='{"tool":"pattern_tool","reason":"x","confidence":0.5}')
+
+    names = ["context_tool", "pattern_tool", "similarity_tool", "reasoning_tool"]
+    registry = ToolRegistry()
+    for tool_name in names:
+        registry.register(_DummyTool(tool_name))
+    state = create_initial_state("inv-order", "txn-order")
+    state["context"] = {"transaction": {"transaction_id": "txn-order"}}
+    state["completed_steps"] = ["context_tool"]
+    asyncio.run(planner_node(state, _CapturingLLM(), registry))
+
+    positions = [captured[0].index(f"- {name}:") for name in names]
+    assert positions == sorted(positions)
+
+
+def test_planner_decision_cache_skips_llm_for_identical_state(monkeypatch) -> None:  # noqa: ANN001
+    from app.agent import planner as planner_module
+
+    settings = planner_module.get_settings().model_copy(deep=True)
+    settings.planner.decision_cache_size = 4
+    monkeypatch.setattr(planner_module, "get_settings", lambda: settings)
+    monkeypatch.setattr(planner_module, "_DECISION_CACHE", planner_module.OrderedDict())
+
+    calls = 0
+
+    class _CountingLLM:
+        async def ainvoke(self, _messages, **_kwargs):  # noqa: ANN001, ANN003
+            nonlocal calls
+            calls += 1
+            return _DummyResponse(content='{"tool":"pattern_tool","reason":"x","confidence":0.5}')
+
+    registry = _build_registry()
+    for transaction_id in ("txn-a", "txn-b"):
+        state = create_initial_state(f"inv-{transaction_id}", transaction_id)
+        state["context"] = {"transaction": {"transaction_id": transaction_id}}
+        state["completed_steps"] = ["context_tool"]
+        updated_state = asyncio.run(planner_node(state, _CountingLLM(), registry))
+        assert updated_state["next_action"] == "pattern_tool"
+
+    assert calls == 1
+
+
+def test_planner_fast_path_skips_llm_for_canonical_state(monkeypatch) -> None:  # noqa: ANN001
+    from app.agent import planner as planner_module
+
+    settings = planner_module.get_settings().model_copy(deep=True)
+    settings.planner.fast_path_enabled = True
+    monkeypatch.setattr(planner_module, "get_settings", lambda: settings)
+
+    class _UnusedLLM:
+        async def ainvoke(self, _messages, **_kwargs):  # noqa: ANN001, ANN003
+            raise AssertionError("LLM must not be called on the fast path")
+
+    state = create_initial_state("inv-fast", "txn-fast")
+    state["context"] = {"transaction": {"transaction_id": "txn-fast"}}
+    state["completed_steps"] = ["context_tool", "pattern_tool"]
+
+    updated_state = asyncio.run(planner_node(state, _UnusedLLM(), _build_registry()))
+
+    assert updated_state["next_action"] == "similarity_tool"
+    assert updated_state["planner_decisions"][-1]["reason"] == "fast-path: canonical sequence"
+
+
+def test_planner_fast_path_defers_to_llm_for_high_severity(monkeypatch) -> None:  # noqa: ANN001
+    from app.agent import planner as planner_module
+
+    settings = planner_module.get_settings().model_copy(deep=True)
+    settings.planner.fast_path_enabled = True
+    monkeypatch.setattr(planner_module, "get_settings", lambda: settings)
+
+    state = create_initial_state("inv-fast-2", "txn-fast-2")
+    state["context"] = {"transaction": {"transaction_id": "txn-fast-2"}}
+    state["completed_steps"] = ["context_tool", "pattern_tool"]
+    state["severity"] = "HIGH"
+    llm = _DummyLLM('{"tool":"link_analysis_tool","reason":"llm","confidence":0.7}')
+
+    updated_state = asyncio.run(planner_node(state, llm, _build_registry()))
+
+    assert updated_state["next_action"] == "link_analysis_tool"
+
+
+def test_render_planner_user_prompt_matches_template_format() -> None:
+    from app.agent.planner import PLANNER_USER_TEMPLATE, _render_planner_user_prompt
+
+    values = {
+        "transaction_id": "txn-1",
+        "completed_steps": "context_tool",
+        "step_count": 1,
+        "max_steps": 20,
+        "has_context": True,
+        "has_patterns": False,
+        "has_similarity": False,
+        "has_link_analysis": False,
+        "has_reasoning": False,
+        "has_recommendations": False,
+        "has_rule_draft": False,
+        "confidence_score": 0.25,
+        "severity": "LOW",
+        "findings_summary": "none",
+    }
+
+    assert _render_planner_user_prompt(**values) == PLANNER_USER_TEMPLATE.format(**values)
+
+
+def test_planner_skips_findings_summary_when_llm_not_called(monkeypatch) -> None:  # noqa: ANN001
+    from app.agent import planner as planner_module
+
+    def _fail(_state):  # noqa: ANN001, ANN202
+        raise AssertionError("findings summary must only be built for LLM planning")
+
+    monkeypatch.setattr(planner_module, "_build_findings_summary", _fail)
+
+    state = create_initial_state("inv-lazy", "txn-lazy")
+    state["context"] = {"transaction": {"transaction_id": "txn-lazy"}}
+    state["completed_steps"] = ["context_tool", "pattern_tool"]
+    state["planner_circuit_open"] = True
+
+    updated_state = asyncio.run(planner_node(state, _FailingLLM(), _build_registry()))
+
+    assert updated_state["next_action"] == "similarity_tool"
+
+
+def test_planner_fix_retry_recovers_malformed_json() -> None:
+    state = create_initial_state("inv-fix", "txn-fix")
+    state["context"] = {"transaction": {"transaction_id": "txn-fix"}}
+    state["completed_steps"] = ["context_tool"]
+    state["step_count"] = 1
+    llm = _SequenceLLM(
+        [
+            "I think pattern_tool is next",
+            '{"tool":"pattern_tool","reason":"fixed","confidence":0.6}',
+        ]
+    )
+
+    updated_state = asyncio.run(planner_node(state, llm, _build_registry()))
+
+    assert updated_state["next_action"] == "pattern_tool"
+    assert updated_state["planner_decisions"][-1]["reason"] == "fixed"
+
+
+def test_planner_coalesces_concurrent_identical_llm_calls(monkeypatch) -> None:  # noqa: ANN001
+    from app.agent import planner as planner_module
+
+    settings = planner_module.get_settings().model_copy(deep=True)
+    settings.planner.decision_cache_size = 4
+    monkeypatch.setattr(planner_module, "get_settings", lambda: settings)
+    monkeypatch.setattr(planner_module, "_DECISION_CACHE", planner_module.OrderedDict())
+
+    calls = 0
+
+    class _SlowLLM:
+        async def ainvoke(self, _messages, **_kwargs):  # noqa: ANN001, ANN003
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return _DummyResponse(content='{"tool":"pattern_tool","reason":"x","confidence":0.5}')
+
+    registry = _build_registry()
+
+    def _state(transaction_id: str):  # noqa: ANN202
+        state = create_initial_state(f"inv-{transaction_id}", transaction_id)
+        state["context"] = {"transaction": {"transaction_id": transaction_id}}
+        state["completed_steps"] = ["context_tool"]
+        return state
+
+    async def _run():  # noqa: ANN202
+        llm = _SlowLLM()
+        return await asyncio.gather(
+            planner_node(_state("txn-c1"), llm, registry),
+            planner_node(_state("txn-c2"), llm, registry),
+        )
+
+    first, second = asyncio.run(_run())
+
+    assert calls == 1
+    assert first["next_action"] == second["next_action"] == "pattern_tool"
+
+
+def test_planner_span_events_omit_previews_unless_verbose(monkeypatch) -> None:  # noqa: ANN001
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from app.agent import planner as planner_module
+
+    settings = planner_module.get_settings().model_copy(deep=True)
+    settings.planner.decision_cache_size = 0
+    monkeypatch.setattr(planner_module, "get_settings", lambda: settings)
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(planner_module, "tracer", provider.get_tracer(__name__))
+    llm = _DummyLLM('{"tool":"pattern_tool","reason":"next","confidence":0.9}')
+
+    def _events_for_run() -> dict[str, dict]:
+        exporter.clear()
+        state = create_initial_state("inv-trace", "txn-trace")
+        state["context"] = {"transaction": {"transaction_id": "txn-trace"}}
+        state["completed_steps"] = ["context_tool"]
+        asyncio.run(planner_node(state, llm, _build_registry()))
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "agent.planner"
+        return {event.name: dict(event.attributes or {}) for event in span.events}
+
+    quiet = _events_for_run()
+    assert "user_prompt_preview" not in quiet["llm.request"]
+    assert "content_preview" not in quiet["llm.response"]
+
+    settings.planner.verbose_tracing = True
+    settings.planner.trace_preview_chars = 8
+    verbose = _events_for_run()
+    assert len(verbose["llm.request"]["user_prompt_preview"]) == 8
+    assert verbose["llm.response"]["content_preview"] == '{"tool":'
+
+
+def test_is_high_severity_ranks_case_insensitively() -> None:
+    from app.agent.planner import _is_high_severity
+
+    state = create_initial_state("inv-sev", "txn-sev")
+    for severity, expected in [
+        ("LOW", False),
+        ("MEDIUM", False),
+        ("HIGH", True),
+        ("critical", True),
+        ("unknown", False),
+        ("", False),
+    ]:
+        state["severity"] = severity
+        assert _is_high_severity(state) is expected
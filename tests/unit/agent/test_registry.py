@@ -62,4 +62,45 @@ class TestToolRegistry:
         registry.register(mock_tool_factory("alpha"))
         registry.register(mock_tool_factory("middle"))
 
-        assert registry.tool_names == ["alpha", "middle", "zebra"]
+        assert registry.tool_names == ("alpha", "middle", "zebra")
+
+    def test_cached_views_refresh_after_register(self, mock_tool_factory):
+        """Cached views are rebuilt after registration; descriptions keep registration order."""
+        registry = ToolRegistry()
+        registry.register(mock_tool_factory("zebra", "Z tool"))
+
+        assert registry.tool_names == ("zebra",)
+        assert registry.tool_names is registry.tool_names
+        assert registry.tool_descriptions_block() == "- zebra: Z tool"
+
+        registry.register(mock_tool_factory("alpha", "A tool"))
+
+        assert registry.tool_names == ("alpha", "zebra")
+        assert len(registry.list_tools()) == 2
+        assert registry.tool_descriptions_block() == "- zebra: Z tool\n- alpha: A tool"
+
+    def test_tool_name_set_tracks_registrations(self, mock_tool_factory):
+        """tool_name_set is a cached frozenset refreshed on register."""
+        registry = ToolRegistry()
+        registry.register(mock_tool_factory("tool_a"))
+
+        assert registry.tool_name_set == frozenset({"tool_a"})
+        assert registry.tool_name_set is registry.tool_name_set
+
+        registry.register(mock_tool_factory("tool_b"))
+
+        assert registry.tool_name_set == frozenset({"tool_a", "tool_b"})
+
+    def test_freeze_blocks_registration(self, mock_tool_factory):
+        """A frozen registry keeps serving lookups but rejects new tools."""
+        registry = ToolRegistry()
+        registry.register(mock_tool_factory("tool_a", "A tool"))
+        registry.freeze()
+
+        assert registry.frozen is True
+        assert registry.get("tool_a").name == "tool_a"
+        assert registry.tool_names == ("tool_a",)
+        assert registry.tool_descriptions_block() == "- tool_a: A tool"
+        with pytest.raises(RuntimeError, match="frozen"):
+            registry.register(mock_tool_factory("tool_b"))
+        assert registry.has("tool_b") is False
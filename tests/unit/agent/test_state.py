@@ -2,7 +2,7 @@
 
 import json
 
-from app.agent.state import create_initial_state
+from app.agent.state import create_initial_state, update_state
 
 
 class TestInvestigationState:
@@ -70,9 +70,22 @@ class TestInvestigationState:
             "planner_decisions",
             "tool_executions",
             "error",
+            "planner_circuit_open",
             "feature_flags",
             "safeguards",
         ]
 
         for field in required_fields:
             assert field in state, f"Missing field: {field}"
+
+    def test_update_state_returns_new_dict(self):
+        """update_state merges fields into a copy and leaves the input untouched."""
+        state = create_initial_state("inv-1", "txn-1")
+
+        updated = update_state(state, severity="HIGH", confidence_score=0.85)
+
+        assert updated is not state
+        assert updated["severity"] == "HIGH"
+        assert updated["confidence_score"] == 0.85
+        assert state["severity"] == "LOW"
+        assert updated["completed_steps"] is state["completed_steps"]
@@ -0,0 +1,63 @@
+"""Unit tests for PostgresStateStore serialization."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from app.persistence.state_store import PostgresStateStore
+
+
+@dataclass
+class _Step:
+    name: str
+
+
+def _make_mock_session(fetchone_row=None):
+    mock_result = MagicMock()
+    mock_result.fetchone.return_value = fetchone_row
+    mock_session = AsyncMock()
+    mock_session.execute = AsyncMock(return_value=mock_result)
+    return mock_session
+
+
+@pytest.mark.asyncio
+async def test_save_state_serializes_rich_values_as_json_text():
+    session = _make_mock_session(fetchone_row=(3,))
+    store = PostgresStateStore(session)
+    state = {
+        "investigation_id": "inv-1",
+        "started_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+        "case_uuid": UUID("12345678-1234-5678-1234-567812345678"),
+        "step": _Step(name="context_tool"),
+        "windows": {1: {"transaction_count": 2}},
+        "flags": MappingProxyType({"planner_llm_enabled": True}),
+    }
+
+    version = await store.save_state("inv-1", state)
+
+    assert version == 3
+    params = session.execute.call_args.args[1]
+    assert isinstance(params["state"], str)
+    assert json.loads(params["state"]) == {
+        "investigation_id": "inv-1",
+        "started_at": "2026-01-02T03:04:05+00:00",
+        "case_uuid": "12345678-1234-5678-1234-567812345678",
+        "step": {"name": "context_tool"},
+        "windows": {"1": {"transaction_count": 2}},
+        "flags": {"planner_llm_enabled": True},
+    }
+
+
+@pytest.mark.asyncio
+async def test_load_state_parses_text_payload():
+    session = _make_mock_session(fetchone_row=('{"investigation_id": "inv-2"}', 1))
+    store = PostgresStateStore(session)
+
+    assert await store.load_state("inv-2") == {"investigation_id": "inv-2"}
@@ -0,0 +1,76 @@
+"""Tests for dataclass_utils module."""
+
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from app.utils.dataclass_utils import to_dict, to_dict_list
+
+
+@dataclass(frozen=True)
+class _Match:
+    match_id: str
+    score: float
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _Result:
+    matches: list[_Match]
+    overall: float
+    tags: tuple[str, ...] = ()
+    extra: Any = None
+
+
+@dataclass
+class _Empty:
+    pass
+
+
+class TestToDict:
+    """Test the to_dict dataclass conversion utility."""
+
+    def test_matches_asdict_for_nested_dataclasses(self):
+        """Nested dataclasses, lists, tuples and dicts convert like asdict."""
+        result = _Result(
+            matches=[_Match("t1", 0.5, {"a": [1, {"b": None}]}), _Match("t2", 0.25)],
+            overall=0.4,
+            tags=("x", "y"),
+        )
+
+        assert to_dict(result) == asdict(result)
+
+    def test_falls_back_to_asdict_for_other_values(self):
+        """Non-JSON leaf values are deep-copied exactly as asdict does."""
+        details = {"amount": Decimal("1.50")}
+        result = _Result(matches=[_Match("t1", 1.0, details)], overall=1.0, extra={1, 2})
+
+        converted = to_dict(result)
+
+        assert converted == asdict(result)
+        assert converted["matches"][0]["details"] is not details
+
+    def test_returns_copies(self):
+        """Converted containers are not shared with the source dataclass."""
+        match = _Match("t1", 0.5, {"a": [1]})
+
+        converted = to_dict(match)
+        converted["details"]["a"].append(2)
+
+        assert match.details == {"a": [1]}
+
+    def test_dict_passthrough_and_non_dataclass(self):
+        """Dicts pass through; other values become an empty dict."""
+        payload = {"a": 1}
+
+        assert to_dict(payload) is payload
+        assert to_dict(_Empty()) == {}
+        assert to_dict(_Match) == {}
+        assert to_dict("text") == {}
+
+    def test_to_dict_list(self):
+        """Lists of dataclasses convert element-wise."""
+        assert to_dict_list([_Match("t1", 0.5), _Match("t2", 0.1)]) == [
+            {"match_id": "t1", "score": 0.5, "details": {}},
+            {"match_id": "t2", "score": 0.1, "details": {}},
+        ]
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+
+import httpx
 import pytest
 from langchain_core.messages import HumanMessage
 
@@ -40,7 +44,7 @@ def _make_provider(**kwargs) -> LLMChatProvider:
 async def test_ainvoke_returns_response(monkeypatch):
     model = _make_provider()
 
-    async def fake_post(self, _client, _url, _payload):  # noqa: ANN001
+    async def fake_post(self, _client, _url, _payload, **_kwargs):  # noqa: ANN001, ANN003
         return _FakeResponse(_openai_response('{"risk_level":"LOW","confidence":0.9}'))
 
     monkeypatch.setattr(LLMChatProvider, "_post_with_retries", fake_post)
@@ -57,7 +61,7 @@ async def test_ainvoke_sets_minimal_reasoning_effort_for_reasoning_models(monkey
     model = _make_provider(model="gpt-5-mini")
     captured_payload: dict = {}
 
-    async def fake_post(self, _client, _url, payload):  # noqa: ANN001
+    async def fake_post(self, _client, _url, payload, **_kwargs):  # noqa: ANN001, ANN003
         captured_payload.update(payload)
         return _FakeResponse(_openai_response('{"risk_level":"LOW"}'))
 
@@ -73,7 +77,7 @@ async def test_ainvoke_skips_reasoning_effort_for_non_reasoning_models(monkeypat
     model = _make_provider(model="gpt-4.1-mini")
     captured_payload: dict = {}
 
-    async def fake_post(self, _client, _url, payload):  # noqa: ANN001
+    async def fake_post(self, _client, _url, payload, **_kwargs):  # noqa: ANN001, ANN003
         captured_payload.update(payload)
         return _FakeResponse(_openai_response('{"risk_level":"LOW"}', model="gpt-4.1-mini"))
 
@@ -89,7 +93,7 @@ async def test_ainvoke_retries_on_empty_content(monkeypatch):
     model = _make_provider()
     calls = 0
 
-    async def fake_post(self, _client, _url, _payload):  # noqa: ANN001
+    async def fake_post(self, _client, _url, _payload, **_kwargs):  # noqa: ANN001, ANN003
         nonlocal calls
         calls += 1
         if calls < 3:
@@ -107,7 +111,7 @@ async def test_ainvoke_retries_on_empty_content(monkeypatch):
 async def test_ainvoke_raises_after_max_retries_empty(monkeypatch):
     model = _make_provider()
 
-    async def fake_post(self, _client, _url, _payload):  # noqa: ANN001
+    async def fake_post(self, _client, _url, _payload, **_kwargs):  # noqa: ANN001, ANN003
         return _FakeResponse({"model": "gpt-5-mini", "choices": [{"message": {"content": ""}}]})
 
     monkeypatch.setattr(LLMChatProvider, "_post_with_retries", fake_post)
@@ -120,7 +124,7 @@ async def test_ainvoke_raises_after_max_retries_empty(monkeypatch):
 async def test_ainvoke_raises_on_non_json_in_json_mode(monkeypatch):
     model = _make_provider()
 
-    async def fake_post(self, _client, _url, _payload):  # noqa: ANN001
+    async def fake_post(self, _client, _url, _payload, **_kwargs):  # noqa: ANN001, ANN003
         return _FakeResponse(_openai_response("here is your answer in plain text"))
 
     monkeypatch.setattr(LLMChatProvider, "_post_with_retries", fake_post)
@@ -133,10 +137,160 @@ async def test_ainvoke_raises_on_non_json_in_json_mode(monkeypatch):
 async def test_ainvoke_non_json_mode_accepts_plain_text(monkeypatch):
     model = _make_provider()
 
-    async def fake_post(self, _client, _url, _payload):  # noqa: ANN001
+    async def fake_post(self, _client, _url, _payload, **_kwargs):  # noqa: ANN001, ANN003
         return _FakeResponse(_openai_response("plain text response"))
 
     monkeypatch.setattr(LLMChatProvider, "_post_with_retries", fake_post)
 
     response = await model.ainvoke([HumanMessage(content="test")], json_mode=False)
     assert response.content == "plain text response"
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_reports_cached_prompt_tokens(monkeypatch):
+    model = _make_provider()
+    payload = _openai_response('{"risk_level":"LOW"}')
+    payload["usage"]["prompt_tokens_details"] = {"cached_tokens": 8}
+
+    async def fake_post(self, _client, _url, _payload, **_kwargs):  # noqa: ANN001, ANN003
+        return _FakeResponse(payload)
+
+    monkeypatch.setattr(LLMChatProvider, "_post_with_retries", fake_post)
+
+    response = await model.ainvoke([HumanMessage(content="test")])
+    assert response.usage_metadata["input_token_details"] == {"cache_read": 8}
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_reuses_shared_http_client(monkeypatch):
+    clients: list = []
+
+    async def fake_post(self, client, _url, _payload, **_kwargs):  # noqa: ANN001, ANN003
+        clients.append(client)
+        return _FakeResponse(_openai_response('{"risk_level":"LOW"}'))
+
+    monkeypatch.setattr(LLMChatProvider, "_post_with_retries", fake_post)
+
+    await _make_provider().ainvoke([HumanMessage(content="one")])
+    await _make_provider().ainvoke([HumanMessage(content="two")])
+
+    assert clients[0] is clients[1]
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_sends_json_schema_response_format(monkeypatch):
+    model = _make_provider(base_url="https://schema.example/v1")
+    captured_payload: dict = {}
+    schema = {"type": "object", "properties": {}, "additionalProperties": False}
+
+    async def fake_post(self, _client, _url, payload, **_kwargs):  # noqa: ANN001, ANN003
+        captured_payload.update(payload)
+        return _FakeResponse(_openai_response('{"risk_level":"LOW"}'))
+
+    monkeypatch.setattr(LLMChatProvider, "_post_with_retries", fake_post)
+
+    await model.ainvoke(
+        [HumanMessage(content="test")], response_format=schema, response_format_name="check"
+    )
+
+    assert captured_payload["response_format"] == {
+        "type": "json_schema",
+        "json_schema": {"name": "check", "schema": schema, "strict": True},
+    }
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_falls_back_to_json_object_when_schema_rejected(monkeypatch):
+    model = _make_provider(base_url="https://no-schema.example/v1")
+    formats: list[dict] = []
+
+    async def fake_post(self, _client, url, payload, **_kwargs):  # noqa: ANN001, ANN003
+        formats.append(dict(payload["response_format"]))
+        if payload["response_format"]["type"] == "json_schema":
+            request = httpx.Request("POST", url)
+            response = httpx.Response(
+                400,
+                request=request,
+                json={"error": {"message": "Invalid parameter: 'response_format' json_schema"}},
+            )
+            raise httpx.HTTPStatusError("400", request=request, response=response)
+        return _FakeResponse(_openai_response('{"risk_level":"LOW"}'))
+
+    monkeypatch.setattr(LLMChatProvider, "_post_with_retries", fake_post)
+
+    schema = {"type": "object", "properties": {}}
+    await model.ainvoke([HumanMessage(content="one")], response_format=schema)
+    await model.ainvoke([HumanMessage(content="two")], response_format=schema)
+
+    assert [f["type"] for f in formats] == ["json_schema", "json_object", "json_object"]
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_reraises_unrelated_400_without_downgrading(monkeypatch):
+    from app.llm import provider as provider_module
+
+    model = _make_provider(base_url="https://too-long.example/v1")
+    formats: list[str] = []
+
+    async def fake_post(self, _client, url, payload, **_kwargs):  # noqa: ANN001, ANN003
+        formats.append(payload["response_format"]["type"])
+        request = httpx.Request("POST", url)
+        response = httpx.Response(
+            400,
+            request=request,
+            json={"error": {"message": "This model's maximum context length is 8192 tokens"}},
+        )
+        raise httpx.HTTPStatusError("400", request=request, response=response)
+
+    monkeypatch.setattr(LLMChatProvider, "_post_with_retries", fake_post)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await model.ainvoke([HumanMessage(content="one")], response_format={"type": "object"})
+
+    assert formats == ["json_schema"]
+    assert ("https://too-long.example/v1", "gpt-5-mini") not in (
+        provider_module._JSON_SCHEMA_UNSUPPORTED
+    )
+
+
+def test_http_client_from_other_loop_is_closed_on_that_loop(monkeypatch):
+    from app.llm import provider as provider_module
+
+    monkeypatch.setattr(provider_module, "_http_client", None)
+    monkeypatch.setattr(provider_module, "_http_client_loop", None)
+
+    async def _get_client():  # noqa: ANN202
+        return provider_module._get_http_client()
+
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        stale = asyncio.run_coroutine_threadsafe(_get_client(), other_loop).result(timeout=5)
+        fresh = asyncio.run(_get_client())
+        # aclose() runs on the stale client's own loop; wait for it to finish there.
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other_loop).result(timeout=5)
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(timeout=5)
+        other_loop.close()
+
+    assert fresh is not stale
+    assert stale.is_closed
+    assert not fresh.is_closed
+
+
+def test_http_client_from_closed_loop_is_replaced(monkeypatch):
+    from app.llm import provider as provider_module
+
+    monkeypatch.setattr(provider_module, "_http_client", None)
+    monkeypatch.setattr(provider_module, "_http_client_loop", None)
+
+    async def _get_client():  # noqa: ANN202
+        return provider_module._get_http_client()
+
+    first = asyncio.run(_get_client())
+    second = asyncio.run(_get_client())
+
+    assert second is not first
+    assert provider_module._http_client is second
@@ -74,3 +74,15 @@ async def test_tm_client_get_fingerprint_neighborhood_builds_expected_params() -
         "from_date": "2026-02-28T00:00:00Z",
         "page_size": 500,
     }
+
+
+@pytest.mark.asyncio
+async def test_tm_client_bounds_connection_pool() -> None:
+    client = TMClient(TMClientConfig(base_url="http://tm.local/api/v1", max_connections=4))
+
+    http_client = await client._get_client()
+
+    assert http_client is await client._get_client()
+    assert client._limits.max_connections == 4
+    assert client._limits.max_keepalive_connections == 4
+    await client.close()
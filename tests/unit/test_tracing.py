@@ -1,12 +1,15 @@
 """Unit tests for tracing context helpers."""
 
 from app.core.tracing import (
+    agent_span,
     bind_contextvars_to_logging,
     clear_tracing_context,
+    current_agent_span,
     get_current_trace_id,
     get_request_id,
     get_trace_parent,
     get_tracing_headers,
+    investigation_span_attributes,
     set_request_id,
     set_trace_parent,
 )
@@ -68,3 +71,100 @@ def test_get_current_trace_id_renders_otel_trace_id(monkeypatch):
 
     monkeypatch.setattr("app.core.tracing.otel_trace.get_current_span", lambda: _Span())
     assert get_current_trace_id() == "0123456789abcdef0123456789abcdef"
+
+
+def test_agent_span_yields_noop_span_when_disabled(monkeypatch):
+    monkeypatch.setattr("app.core.tracing._TRACING_ENABLED", False)
+
+    class _Tracer:
+        def start_as_current_span(self, name):
+            raise AssertionError("span must not be created when tracing is disabled")
+
+    with agent_span(_Tracer(), "agent.test") as span:
+        span.set_attribute("investigation_id", "inv-1")
+        span.set_attributes({"investigation_id": "inv-1"})
+        assert span.is_recording() is False
+
+
+def test_investigation_span_attributes_skips_unset_ids():
+    state = {
+        "investigation_id": "inv-1",
+        "transaction_id": "txn-1",
+        "case_id": None,
+        "scenario_name": "",
+    }
+
+    assert investigation_span_attributes(state) == {
+        "investigation_id": "inv-1",
+        "model_mode": "unknown",
+        "transaction_id": "txn-1",
+    }
+    assert investigation_span_attributes(
+        {**state, "model_mode": "mock", "case_id": "case-9"}, model_mode="agentic"
+    ) == {
+        "investigation_id": "inv-1",
+        "model_mode": "agentic",
+        "transaction_id": "txn-1",
+        "case_id": "case-9",
+    }
+
+
+def test_agent_span_skips_children_of_unsampled_parent(monkeypatch):
+    monkeypatch.setattr("app.core.tracing._TRACING_ENABLED", True)
+
+    class _ParentContext:
+        is_valid = True
+
+    class _UnsampledParent:
+        def get_span_context(self):
+            return _ParentContext()
+
+        def is_recording(self):
+            return False
+
+    monkeypatch.setattr("app.core.tracing.otel_trace.get_current_span", lambda: _UnsampledParent())
+
+    class _Tracer:
+        def start_as_current_span(self, name):
+            raise AssertionError("child span must not be created under an unsampled parent")
+
+    with agent_span(_Tracer(), "agent.test") as span:
+        span.set_attributes({"investigation_id": "inv-1"})
+        assert span.is_recording() is False
+
+
+def test_agent_span_starts_root_span_without_parent(monkeypatch):
+    from contextlib import nullcontext
+
+    monkeypatch.setattr("app.core.tracing._TRACING_ENABLED", True)
+    started: list[str] = []
+    sentinel = object()
+
+    class _Tracer:
+        def start_as_current_span(self, name):
+            started.append(name)
+            return nullcontext(sentinel)
+
+    with agent_span(_Tracer(), "agent.test") as span:
+        assert span is sentinel
+
+    assert started == ["agent.test"]
+
+
+def test_current_agent_span_only_returns_matching_recording_span(monkeypatch):
+    monkeypatch.setattr("app.core.tracing._TRACING_ENABLED", True)
+
+    class _Span:
+        name = "investigation.run"
+
+        def is_recording(self):
+            return True
+
+    span = _Span()
+    monkeypatch.setattr("app.core.tracing.otel_trace.get_current_span", lambda: span)
+
+    assert current_agent_span("investigation.run") is span
+    assert current_agent_span("agent.tool.reasoning_tool").is_recording() is False
+
+    monkeypatch.setattr("app.core.tracing._TRACING_ENABLED", False)
+    assert current_agent_span("investigation.run").is_recording() is False
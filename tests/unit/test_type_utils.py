@@ -2,7 +2,7 @@
 
 from decimal import Decimal
 
-from app.utils.type_utils import to_float
+from app.utils.type_utils import to_float, to_int
 
 
 class TestToFloat:
@@ -58,3 +58,22 @@ class TestToFloat:
         """Dicts should return the default value."""
         assert to_float({"key": "value"}) == 0.0
         assert to_float({}, -1.0) == -1.0
+
+
+class TestToInt:
+    """Test the to_int type conversion utility."""
+
+    def test_int_passthrough(self):
+        assert to_int(7) == 7
+        assert to_int(0) == 0
+
+    def test_float_and_string_conversion(self):
+        assert to_int(7.9) == 7
+        assert to_int("12") == 12
+        assert to_int(True) == 1
+
+    def test_invalid_values_return_default(self):
+        assert to_int(None) == 0
+        assert to_int("") == 0
+        assert to_int("1.5") == 0
+        assert to_int({"key": "value"}, -1) == -1
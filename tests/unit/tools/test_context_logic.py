@@ -0,0 +1,46 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+from app.tools._core.context_logic import (
+    _coerce_datetime,
+    _parse_iso_datetime,
+    compute_all_windows,
+    compute_window_stats,
+)
+
+
+def test_coerce_datetime_normalizes_strings_to_utc() -> None:
+    assert _coerce_datetime("2026-01-02T10:00:00Z") == datetime(2026, 1, 2, 10, tzinfo=UTC)
+    assert _coerce_datetime("2026-01-02T12:00:00+02:00") == datetime(2026, 1, 2, 10, tzinfo=UTC)
+    assert _coerce_datetime("2026-01-02T10:00:00") == datetime(2026, 1, 2, 10, tzinfo=UTC)
+    assert _coerce_datetime("not-a-timestamp") is None
+    assert _coerce_datetime(None) is None
+
+
+def test_coerce_datetime_reuses_parsed_strings() -> None:
+    _parse_iso_datetime.cache_clear()
+
+    first = _coerce_datetime("2026-01-02T10:00:00Z")
+    second = _coerce_datetime("2026-01-02T10:00:00Z")
+
+    assert first is second
+    assert _parse_iso_datetime.cache_info().hits == 1
+
+
+def test_coerce_datetime_converts_aware_datetimes() -> None:
+    value = datetime(2026, 1, 2, 12, tzinfo=timezone(timedelta(hours=2)))
+
+    assert _coerce_datetime(value) == datetime(2026, 1, 2, 10, tzinfo=UTC)
+    assert _coerce_datetime(value).tzinfo is UTC
+
+
+def test_compute_all_windows_shares_empty_window_stats() -> None:
+    anchor = "2026-01-02T10:00:00Z"
+    history = [{"transaction_id": "t1", "transaction_timestamp": "2026-01-01T12:00:00Z"}]
+
+    windows = compute_all_windows(history, anchor)
+
+    assert windows[1] == compute_window_stats([], 1)
+    assert windows[1] is compute_window_stats([], 1)
+    assert windows[1].transaction_count == 0
+    assert windows[24].transaction_count == 1
+    assert compute_window_stats([], 48).window_hours == 48
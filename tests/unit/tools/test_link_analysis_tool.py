@@ -204,3 +204,40 @@ class TestLinkAnalysisTool:
 
         assert "link_analysis_results" in result
         assert result["evidence"][-1]["category"] == "link_analysis"
+
+    @pytest.mark.asyncio
+    async def test_execute_starts_tm_lookups_before_local_analysis(
+        self, state_with_context, monkeypatch
+    ) -> None:
+        import app.tools.link_analysis_tool as module
+
+        tm_client = AsyncMock()
+        tm_client.get_ip_neighborhood.return_value = []
+        tm_client.get_device_neighborhood.return_value = []
+        tm_client.get_device_fingerprint_neighborhood.return_value = []
+        seen_before_analysis: list[bool] = []
+        original = module.run_link_analysis
+
+        def _recording_analysis(**kwargs):
+            seen_before_analysis.append(tm_client.get_ip_neighborhood.await_count > 0)
+            return original(**kwargs)
+
+        monkeypatch.setattr(module, "run_link_analysis", _recording_analysis)
+
+        tool = LinkAnalysisTool(tm_client=tm_client)
+        state = {
+            **state_with_context,
+            "context": {
+                **state_with_context["context"],
+                "transaction": {
+                    "transaction_id": "txn-current",
+                    "card_id": "card-001",
+                    "transaction_timestamp": "2026-02-28T12:00:00Z",
+                },
+                "features": {"ip_address": "203.0.113.10"},
+            },
+        }
+
+        await tool.execute(state)
+
+        assert seen_before_analysis == [True]
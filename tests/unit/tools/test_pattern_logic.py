@@ -0,0 +1,244 @@
+from types import SimpleNamespace
+
+from app.tools._core.pattern_logic import (
+    PatternScore,
+    _is_round_number,
+    _parse_timestamp,
+    compute_severity,
+    run_pattern_scoring,
+    score_amount_anomalies,
+    score_card_testing,
+    score_time_anomalies,
+)
+
+
+def test_score_card_testing_uses_most_recent_history_rows() -> None:
+    transaction = {"amount": 50.0, "transaction_timestamp": "2026-01-02T10:00:00+00:00"}
+    ladder = [
+        {"amount": amount, "transaction_timestamp": f"2026-01-02T09:{minute:02d}:00+00:00"}
+        for amount, minute in ((1.0, 40), (5.0, 45), (10.0, 50))
+    ]
+    stale = [
+        {"amount": 500.0, "transaction_timestamp": f"2025-12-{day:02d}T12:00:00+00:00"}
+        for day in range(1, 29)
+    ]
+
+    result = score_card_testing(transaction, [*stale[:14], *ladder, *stale[14:]])
+
+    assert result.score == 0.8
+    assert result.details["increasing_sequence"] is True
+    assert result.details["sequence_length"] == 4
+    assert result.details["amount_range"] == "1.00 - 50.00"
+
+
+def test_score_amount_anomalies_flags_outlier_against_history() -> None:
+    history = [{"amount": a} for a in (10.0, 20.0, 30.0, 40.0)]
+    history += [{"amount": None}, {"amount": "n/a"}, {}]
+
+    result = score_amount_anomalies({"amount": 123.45}, history, {})
+
+    # mean 25, population std sqrt(125)
+    assert result.score == 0.9
+    assert result.details["outlier"] is True
+    assert result.details["mean"] == 25.0
+    assert result.details["std_dev"] == 11.18
+    assert result.details["z_score"] == 8.81
+
+
+def test_score_amount_anomalies_ignores_single_history_amount() -> None:
+    result = score_amount_anomalies({"amount": 123.45}, [{"amount": 1.0}], {})
+
+    assert "outlier" not in result.details
+
+
+def test_score_amount_anomalies_skips_history_scan_for_non_positive_amount() -> None:
+    class _Untouchable(dict):
+        def get(self, *_args, **_kwargs):
+            raise AssertionError("history should not be read")
+
+    result = score_amount_anomalies({"amount": 0}, [_Untouchable()], {})
+
+    assert result.score == 0.0
+    assert result.details == {}
+
+
+def test_run_pattern_scoring_uses_configured_round_number_thresholds() -> None:
+    context = {"transaction": {"amount": 250.0}}
+
+    default_scores = run_pattern_scoring(context)
+    custom_scores = run_pattern_scoring(context, {"round_number_thresholds": [250]})
+
+    assert "round_number" not in default_scores[0].details
+    assert custom_scores[0].details["round_number"] is True
+
+
+def test_score_time_anomalies_flags_high_risk_mcc_at_night() -> None:
+    transaction = {"transaction_timestamp": "2026-01-02T03:15:00Z", "merchant_category": 7999}
+
+    result = score_time_anomalies(transaction, [])
+
+    assert result.score == 0.8
+    assert result.details["merchant_risk"] == "high"
+    assert result.details["high_risk_combo"] is True
+
+
+def test_score_time_anomalies_maps_padded_and_unknown_mccs() -> None:
+    medium = score_time_anomalies(
+        {"transaction_timestamp": "2026-01-02T14:00:00Z", "merchant_category_code": "5411"}, []
+    )
+    low = score_time_anomalies(
+        {"transaction_timestamp": "2026-01-02T14:00:00Z", "merchant_category": "742"}, []
+    )
+
+    assert medium.details["merchant_risk"] == "medium"
+    assert low.details["merchant_category"] == "742"
+    assert low.details["merchant_risk"] == "low"
+
+
+def test_parse_timestamp_is_memoized_and_keeps_offset() -> None:
+    _parse_timestamp.cache_clear()
+
+    first = _parse_timestamp("2026-01-02T03:15:00+05:00")
+    again = _parse_timestamp("2026-01-02T03:15:00+05:00")
+
+    assert first is again
+    assert first is not None and first.hour == 3
+    assert _parse_timestamp("not-a-timestamp") is None
+    assert _parse_timestamp.cache_info().hits == 1
+
+
+def test_score_card_testing_tolerates_missing_history_timestamps() -> None:
+    transaction = {"amount": 5.0, "transaction_timestamp": "2026-01-02T10:00:00+00:00"}
+    history = [
+        {"amount": 1.0, "transaction_timestamp": None},
+        {"amount": 2.0, "transaction_timestamp": "2026-01-02T09:50:00+00:00"},
+        {"amount": 3.0},
+    ]
+
+    result = score_card_testing(transaction, history)
+
+    assert result.pattern_name == "card_testing"
+
+
+def test_score_card_testing_combines_decline_merchant_and_small_amount_signals() -> None:
+    transaction = {
+        "amount": 2.0,
+        "merchant_id": "m-3",
+        "transaction_timestamp": "2026-01-02T10:00:00+00:00",
+    }
+    history = [
+        {
+            "amount": 1.0,
+            "status": "DECLINE",
+            "merchant_id": "m-1",
+            "transaction_timestamp": "2026-01-02T09:40:00+00:00",
+        },
+        {
+            "decision": "decline",
+            "merchant_id": "m-2",
+            "transaction_timestamp": "2026-01-02T09:45:00+00:00",
+        },
+        {
+            "amount": 50.0,
+            "status": "APPROVE",
+            "merchant_id": "m-1",
+            "transaction_timestamp": "2026-01-02T09:50:00+00:00",
+        },
+    ]
+
+    result = score_card_testing(transaction, history)
+
+    assert result.score == 0.7
+    assert result.details["recent_decline_count"] == 2
+    assert result.details["decline_rate"] == 0.67
+    assert result.details["unique_merchants"] == 3
+    assert result.details["small_txn_count"] == 3
+    assert "increasing_sequence" not in result.details
+
+
+def test_is_round_number_matches_whole_thresholds() -> None:
+    assert _is_round_number(500.0)
+    assert _is_round_number(1000, frozenset({1000}))
+    assert not _is_round_number(500.004)
+    assert not _is_round_number(499.98)
+    assert not _is_round_number(250.0)
+    assert not _is_round_number(0.0)
+
+
+def test_score_time_anomalies_flags_hour_outside_cardholder_history() -> None:
+    history = [
+        {"transaction_timestamp": f"2026-01-0{day}T{hour:02d}:00:00Z"}
+        for day, hour in ((1, 14), (2, 9), (3, 14), (4, 18), (5, 9))
+    ]
+
+    unusual = score_time_anomalies({"transaction_timestamp": "2026-01-06T11:00:00Z"}, history)
+    usual = score_time_anomalies({"transaction_timestamp": "2026-01-06T14:00:00Z"}, history)
+
+    assert unusual.score == 0.6
+    assert unusual.details["usual_hours"] == [9, 14, 18]
+    assert "unusual_hour_for_cardholder" not in usual.details
+
+
+def _score(name: str, score: float, weight: float = 0.25) -> PatternScore:
+    return PatternScore(pattern_name=name, score=score, weight=weight, details={})
+
+
+def test_compute_severity_levels() -> None:
+    assert compute_severity([]) == "LOW"
+    assert compute_severity([_score("amount_anomaly", 0.9), _score("velocity", 0.8)]) == "CRITICAL"
+    # Two strong network signals promote despite a diluted weighted average.
+    strong_network = [
+        _score("velocity", 0.7),
+        _score("card_testing", 0.7),
+        *(_score(f"quiet_{i}", 0.0) for i in range(4)),
+    ]
+    assert compute_severity(strong_network) == "HIGH"
+    isolated = [_score("time_anomaly", 0.6), *(_score(f"quiet_{i}", 0.0) for i in range(5))]
+    assert compute_severity(isolated) == "LOW"
+    corroborated = [
+        _score("time_anomaly", 0.5),
+        _score("decline_anomaly", 0.5),
+        _score("cross_merchant", 0.5),
+        *(_score(f"quiet_{i}", 0.0) for i in range(6)),
+    ]
+    assert compute_severity(corroborated) == "MEDIUM"
+
+
+def test_scorers_read_transaction_model_objects() -> None:
+    transaction = SimpleNamespace(
+        amount=1000.0,
+        transaction_timestamp="2026-01-02T03:15:00Z",
+        merchant_category_code="7999",
+    )
+
+    amount = score_amount_anomalies(transaction, [], {})
+    time = score_time_anomalies(transaction, [])
+
+    assert amount.details["round_number"] is True
+    assert time.details["merchant_risk"] == "high"
+
+
+def test_score_card_testing_skips_malformed_history_amounts() -> None:
+    transaction = {
+        "amount": 8.0,
+        "merchant_id": "m4",
+        "transaction_timestamp": "2026-01-02T10:00:00+00:00",
+    }
+    history = [
+        {"amount": 1.0, "merchant_id": "m1", "transaction_timestamp": "2026-01-02T09:40:00+00:00"},
+        {
+            "amount": "n/a",
+            "merchant_id": "m2",
+            "transaction_timestamp": "2026-01-02T09:45:00+00:00",
+        },
+        {"amount": [3], "merchant_id": "m3", "transaction_timestamp": "2026-01-02T09:50:00+00:00"},
+        {"amount": 4.0, "merchant_id": "m3", "transaction_timestamp": "2026-01-02T09:55:00+00:00"},
+    ]
+
+    result = score_card_testing(transaction, history)
+
+    # Malformed rows still count toward merchants but not the amount ladder or small count.
+    assert result.details["sequence_length"] == 3
+    assert result.details["amount_range"] == "1.00 - 8.00"
+    assert result.details["small_txn_count"] == 3
+    assert result.details["unique_merchants"] == 4
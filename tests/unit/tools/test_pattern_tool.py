@@ -53,3 +53,23 @@ class TestPatternTool:
         result = await tool.execute(state_with_context)
 
         assert "severity" in result
+
+    @pytest.mark.asyncio
+    async def test_execute_summarizes_scores(self, state_with_context):
+        """overall_score is the weighted average and detected names match scores > 0.5."""
+        state_with_context["context"]["transaction"]["amount"] = 9999.99
+        tool = PatternTool()
+        result = await tool.execute(state_with_context)
+
+        pattern_results = result["pattern_results"]
+        scores = pattern_results["scores"]
+        expected = sum(s["score"] * s["weight"] for s in scores) / max(
+            sum(s["weight"] for s in scores), 1
+        )
+        assert pattern_results["overall_score"] == pytest.approx(expected)
+        assert pattern_results["patterns_detected"] == [
+            s["pattern_name"] for s in scores if s["score"] > 0.5
+        ]
+        assert result["evidence"][-1]["description"] == (
+            f"Detected {len(pattern_results['patterns_detected'])} fraud patterns"
+        )
@@ -82,3 +82,20 @@ def test_assemble_prompt_payload_uses_similarity_matches() -> None:
     assert "hist-1: score 0.93" in payload["similarity_analysis"]
     assert "hist-2: score 0.81" in payload["similarity_analysis"]
     assert "No similar transactions found" not in payload["similarity_analysis"]
+
+
+def test_assemble_prompt_payload_renders_context_features_in_label_order() -> None:
+    context = {
+        "transaction": {"transaction_id": "txn-123"},
+        "features": {"txn_count_1h": 4, "amount": 120.0, "mcc": None, "unrelated": "x"},
+    }
+
+    payload = assemble_prompt_payload(context, {"patterns": []}, {})
+
+    assert payload["context_features"] == "  - amt: 120.0\n  - cnt_1h: 4"
+    assert (
+        assemble_prompt_payload({"features": {"mcc": None}}, {"patterns": []}, {})[
+            "context_features"
+        ]
+        == "No features computed"
+    )
@@ -640,3 +640,104 @@ class TestReasoningTool:
         assert result["severity"] == "LOW"
         assert reasoning["llm_risk_level"] == "MEDIUM"
         assert reasoning["severity_calibration"] == "counter_evidence_no_pattern_cap"
+
+    def test_pattern_score_summary_single_pass(self, initial_state):
+        """Max score covers every row; per-name scores keep the last row for a name."""
+        state = {
+            **initial_state,
+            "pattern_results": {
+                "scores": [
+                    {"pattern_name": "velocity", "score": 0.4},
+                    {"pattern_name": None, "score": 0.9},
+                    {"pattern_name": "velocity", "score": "bad"},
+                    {"pattern_name": "card_testing", "score": 0.7},
+                ]
+            },
+        }
+
+        max_score, score_by_name = ReasoningTool._pattern_score_summary(state)
+
+        assert max_score == 0.9
+        assert score_by_name == {"velocity": 0.0, "card_testing": 0.7}
+
+    def test_counter_evidence_count_counts_each_signal_once(self, initial_state):
+        """A signal present in both context and transaction still counts once."""
+        state = {
+            **initial_state,
+            "context": {
+                "transaction_context": {"3ds_verified": True, "payment_token_present": "yes"},
+                "transaction": {
+                    "three_ds_authenticated": True,
+                    "is_trusted_device": 1,
+                    "avs_match": False,
+                    "cvv_match": "no",
+                },
+            },
+        }
+
+        assert ReasoningTool._counter_evidence_count(state) == 3
+
+
+def _recording_tracer():  # noqa: ANN202
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer(__name__), exporter
+
+
+@pytest.mark.asyncio
+async def test_execute_leaves_investigation_span_alone_when_agent_spans_disabled(
+    monkeypatch, state_with_analysis
+):
+    """With agent spans off, a reasoning failure must not annotate or fail the run span."""
+    from opentelemetry.trace import StatusCode
+
+    from app.core.tracing import agent_span
+
+    monkeypatch.setattr("app.core.tracing._TRACING_ENABLED", False)
+    tracer, exporter = _recording_tracer()
+    mock_llm = AsyncMock()
+    mock_llm.ainvoke.side_effect = Exception("LLM timeout")
+    tool = ReasoningTool(llm=mock_llm)
+
+    with tracer.start_as_current_span("investigation.run"):
+        with agent_span(tracer, "agent.tool.reasoning_tool"):
+            with pytest.raises(Exception, match="LLM timeout"):
+                await tool.execute(state_with_analysis)
+
+    (run_span,) = exporter.get_finished_spans()
+    assert run_span.name == "investigation.run"
+    assert "tool_name" not in run_span.attributes
+    assert "error" not in run_span.attributes
+    assert run_span.events == ()
+    assert run_span.status.status_code is StatusCode.UNSET
+
+
+@pytest.mark.asyncio
+async def test_execute_records_on_executor_tool_span(monkeypatch, state_with_analysis):
+    """With agent spans on, reasoning attributes and LLM events land on the tool span."""
+    from langchain_core.messages import AIMessage
+
+    from app.core.tracing import agent_span
+
+    monkeypatch.setattr("app.core.tracing._TRACING_ENABLED", True)
+    tracer, exporter = _recording_tracer()
+    mock_llm = AsyncMock()
+    mock_llm.ainvoke.return_value = AIMessage(
+        content='{"narrative": "Test", "risk_level": "LOW", "key_findings": [], "hypotheses": [], "confidence": 0.5}'
+    )
+    tool = ReasoningTool(llm=mock_llm)
+
+    with tracer.start_as_current_span("investigation.run"):
+        with agent_span(tracer, "agent.tool.reasoning_tool"):
+            await tool.execute(state_with_analysis)
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    tool_span = spans["agent.tool.reasoning_tool"]
+    assert {"llm.request", "llm.response"} <= {event.name for event in tool_span.events}
+    assert tool_span.attributes["severity"] == "LOW"
+    assert spans["investigation.run"].events == ()
@@ -158,3 +158,50 @@ class TestRecommendationTool:
 
         assert isinstance(result["recommendations"], list)
         assert len(result["recommendations"]) > 0
+
+
+def test_generate_recommendations_uses_first_entry_per_pattern():
+    """Duplicate pattern entries resolve to the first score and details."""
+    from app.tools._core.recommendation_logic import generate_recommendations
+
+    candidates = generate_recommendations(
+        pattern_scores=[
+            {
+                "pattern_name": "cross_merchant",
+                "score": 0.7,
+                "details": {"unique_merchants_24h": 9},
+            },
+            {
+                "pattern_name": "cross_merchant",
+                "score": 0.1,
+                "details": {"unique_merchants_24h": 1},
+            },
+        ],
+        similarity_result=None,
+        severity="LOW",
+        context={},
+    )
+
+    cross = [c for c in candidates if c.signature_hash == "rule_cross_merchant_1"]
+    assert len(cross) == 1
+    assert "0.70 with 9 merchants" in cross[0].impact
+
+
+def test_to_similarity_match_normalizes_persisted_payload():
+    from app.tools.recommendation_tool import _to_similarity_match
+
+    match = _to_similarity_match(
+        {
+            "transaction_id": "t1",
+            "score": 0.7,
+            "details": "not-a-dict",
+            "counter_evidence": [{"type": "avs_match"}],
+        }
+    )
+
+    assert match.match_id == "t1"
+    assert match.match_type == "unknown"
+    assert match.similarity_score == 0.7
+    assert match.details == {}
+    assert match.counter_evidence == [{"type": "avs_match"}]
+    assert _to_similarity_match({"counter_evidence": {"x": 1}}).counter_evidence is None
@@ -1,6 +1,9 @@
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
-from app.tools._core.similarity_logic import evaluate_similarity
+import pytest
+
+from app.tools._core.similarity_logic import evaluate_similarity, freshness_weight
 
 
 def test_evaluate_similarity_handles_decimal_amounts() -> None:
@@ -23,3 +26,68 @@ def test_evaluate_similarity_handles_decimal_amounts() -> None:
     assert result.overall_score > 0
     assert len(result.matches) == 1
     assert result.matches[0].match_id == "t2"
+
+
+def test_freshness_weight_uses_supplied_reference_time() -> None:
+    now = datetime(2026, 1, 2, 12, 0, tzinfo=UTC)
+
+    assert freshness_weight(None, now) == 0.5
+    assert freshness_weight(now - timedelta(minutes=30), now) == 1.0
+    assert freshness_weight(now - timedelta(hours=3), now) == 0.9
+    assert freshness_weight(now - timedelta(hours=12), now) == 0.7
+    assert freshness_weight(now - timedelta(days=2), now) == 0.5
+    assert freshness_weight(now - timedelta(days=30), now) == 0.3
+
+
+def test_evaluate_similarity_keeps_top_five_in_score_order() -> None:
+    similar_transactions = [
+        {"transaction_id": f"t{i}", "similarity_score": score}
+        for i, score in enumerate([0.2, 0.9, 0.5, 0.9, 0.1, 0.7, 0.3])
+    ]
+
+    result = evaluate_similarity(
+        transaction={"amount": 10.0},
+        similar_transactions=similar_transactions,
+        now=datetime(2026, 1, 2, tzinfo=UTC),
+    )
+
+    assert [m.match_id for m in result.matches] == ["t1", "t3", "t5", "t2", "t6"]
+
+
+def test_evaluate_similarity_does_not_mutate_input_details() -> None:
+    row_details = {"source": "vector"}
+    similar_transactions = [
+        {"transaction_id": "t1", "similarity_score": 0.8, "details": row_details},
+        {"transaction_id": "t2", "amount": 100.0, "merchant_id": "m1"},
+    ]
+
+    result = evaluate_similarity(
+        transaction={"amount": 100.0, "merchant_id": "m1"},
+        similar_transactions=similar_transactions,
+    )
+
+    assert row_details == {"source": "vector"}
+    by_id = {m.match_id: m.details for m in result.matches}
+    assert by_id["t1"] == {"source": "vector", "risk_multiplier": 1.0}
+    assert by_id["t2"]["same_merchant"] is True
+    assert by_id["t2"]["risk_multiplier"] == 1.0
+
+
+def test_risk_multiplier_by_decision() -> None:
+    from app.tools._core.similarity_logic import _risk_multiplier
+
+    assert _risk_multiplier({"decision": "approved"}, None) == 0.65
+    assert _risk_multiplier({"decision": " DECLINE "}, None) == 1.0
+    assert _risk_multiplier({"decision": "REVIEW"}, None) == 0.85
+    assert _risk_multiplier({}, None) == 1.0
+    assert _risk_multiplier({"decision": None}, None) == 0.85
+
+
+def test_risk_multiplier_averages_counter_evidence_strength() -> None:
+    from app.tools._core.similarity_logic import _risk_multiplier
+
+    payload = {"counter_evidence": [{"strength": 0.8}, {"strength": 0.4}, {}]}
+
+    # avg strength 0.4 -> counter multiplier 1 - 0.32
+    assert _risk_multiplier({"decision": "DECLINE"}, payload) == pytest.approx(1.0 - 0.4 * 0.8)
+    assert _risk_multiplier({"decision": "DECLINE"}, {"counter_evidence": []}) == 1.0